@@ -0,0 +1 @@
+# This file makes 'benchmarks' a package so scripts can import the examples
@@ -0,0 +1,57 @@
+"""Compares the CLI's bulk greeting output with the original print-per-line loop.
+
+Run from the project root with:
+    python -m benchmarks.bench_cli_output --count 1000000
+"""
+
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+from typing import Callable
+
+from examples.cli import greet
+from your_core_library.data_handler import get_core_greeting
+
+
+def print_loop(name: str, count: int) -> None:
+    """The original implementation: one greeting call and one print per line."""
+    print(f"Hello {name}!")
+    for _ in range(count):
+        core_msg = get_core_greeting(name)
+        print(f"Core library says: {core_msg}")
+    print(f"Printed the greeting {count} time(s) for {name}.")
+
+
+def measure(label: str, count: int, func: Callable[[], None]) -> None:
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+    print(f"{label:<22} {seconds:>8.3f}s  {count / seconds:>14,.0f} lines/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+    count, name = args.count, "Bench"
+
+    print(f"{count:,} greeting lines")
+    measure("print loop (stdout)", count, lambda: print_loop(name, count))
+    measure("bulk (stdout)", count, lambda: greet(name, count))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "greetings.txt")
+        measure("bulk (--output)", count, lambda: greet(name, count, output=path))
+        print(f"{'':<22} {os.path.getsize(path) / 1e6:>8.1f} MB written")
+        measure(
+            "bulk (--output --gzip)",
+            count,
+            lambda: greet(name, count, output=path + ".gz"),
+        )
+        print(f"{'':<22} {os.path.getsize(path + '.gz') / 1e6:>8.1f} MB written")
+
+
+if __name__ == "__main__":
+    main()
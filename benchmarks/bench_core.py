@@ -0,0 +1,213 @@
+"""Micro-benchmarks for your_core_library with regression tracking.
+
+Covers DataHandler.process and process_bytes on 10 B to 10 MB inputs,
+process_batch and process_many on 1 to 1M records, another_method,
+ExampleModel and get_core_greeting. Every case is timed as --samples independent samples of
+enough calls to run for at least --min-time seconds each.
+
+With --check, each case's samples are compared against the committed baseline
+(benchmarks/core_baseline.json) with a one-sided Mann-Whitney U test. A case
+is reported as a regression when it is slower with p < --alpha and its median
+is more than --min-slowdown slower. Baselines are machine-specific; refresh it
+with --save-baseline on the machine that runs the check.
+
+Run from the project root with:
+    python -m benchmarks.bench_core --check
+    python -m benchmarks.bench_core --save-baseline
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from your_core_library.data_handler import DataHandler
+from your_core_library.data_handler import ExampleModel
+from your_core_library.data_handler import get_core_greeting
+
+BASELINE_FILE = Path(__file__).with_name("core_baseline.json")
+STRING_SIZES = {"10B": 10, "1KB": 1_000, "100KB": 100_000, "10MB": 10_000_000}
+BATCH_SIZES = (1, 100, 10_000, 1_000_000)
+RECORD_LENGTH = 32
+
+# A case returns (function to time, items it handles per call).
+Case = Tuple[Callable[[], Any], int]
+
+
+def make_string(size: int) -> str:
+    return ("abcdefghij" * (size // 10 + 1))[:size]
+
+
+def build_cases() -> Dict[str, Case]:
+    handler = DataHandler()
+    cases: Dict[str, Case] = {}
+    for label, size in STRING_SIZES.items():
+        data = make_string(size)
+        cases[f"process[{label}]"] = (partial(handler.process, data), 1)
+    for label, size in STRING_SIZES.items():
+        encoded = make_string(size).encode()
+        cases[f"process_bytes[{label}]"] = (
+            partial(handler.process_bytes, encoded, bytearray()),
+            1,
+        )
+    for count in BATCH_SIZES:
+        records = [make_string(RECORD_LENGTH)] * count
+        cases[f"process_batch[{count}]"] = (
+            partial(handler.process_batch, records),
+            count,
+        )
+    records = [make_string(RECORD_LENGTH)] * BATCH_SIZES[-1]
+    cases[f"process_many[{BATCH_SIZES[-1]}]"] = (
+        lambda: list(handler.process_many(records)),
+        BATCH_SIZES[-1],
+    )
+    cases["another_method"] = (lambda: handler.another_method(42), 1)
+    cases["ExampleModel"] = (lambda: repr(ExampleModel("bench", 42)), 1)
+    cases["get_core_greeting"] = (lambda: get_core_greeting("Bench"), 1)
+    return cases
+
+
+def measure(func: Callable[[], Any], samples: int, min_time: float) -> List[float]:
+    """Returns ``samples`` per-call timings in seconds."""
+    loops = 1
+    while True:  # Calibrate the loop count, as timeit.autorange does
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= min_time:
+            break
+        loops *= 10
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        timings.append((time.perf_counter() - start) / loops)
+    return timings
+
+
+def slower_p_value(baseline: List[float], current: List[float]) -> float:
+    """One-sided Mann-Whitney U test that ``current`` timings are larger.
+
+    Uses the normal approximation with a continuity correction; ties get
+    their average rank.
+    """
+    combined = sorted(
+        [(value, 0) for value in baseline] + [(value, 1) for value in current]
+    )
+    ranks = [0.0] * len(combined)
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        i = j + 1
+    n_base, n_current = len(baseline), len(current)
+    rank_sum = sum(
+        rank for rank, (_, group) in zip(ranks, combined, strict=True) if group == 1
+    )
+    u = rank_sum - n_current * (n_current + 1) / 2
+    mean = n_base * n_current / 2
+    sd = math.sqrt(n_base * n_current * (n_base + n_current + 1) / 12)
+    if sd == 0:
+        return 1.0
+    z = (u - mean - 0.5) / sd
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def find_regressions(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    alpha: float,
+    min_slowdown: float,
+) -> List[str]:
+    problems = []
+    for name, result in results["cases"].items():
+        old = baseline["cases"].get(name)
+        if old is None:
+            continue
+        ratio = result["median"] / old["median"]
+        p_value = slower_p_value(old["samples"], result["samples"])
+        if p_value < alpha and ratio > 1 + min_slowdown:
+            problems.append(
+                f"{name}: {ratio:.2f}x slower than baseline (p={p_value:.4f})"
+            )
+    return problems
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--samples", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("-k", "--filter", default="", help="Only run matching cases.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--alpha", type=float, default=0.01)
+    parser.add_argument("--min-slowdown", type=float, default=0.20)
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "cases": {},
+    }
+    for name, (func, items) in build_cases().items():
+        if args.filter not in name:
+            continue
+        samples = measure(func, args.samples, args.min_time)
+        median = statistics.median(samples)
+        results["cases"][name] = {
+            "median": median,
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "items_per_second": items / median,
+            "samples": samples,
+        }
+        print(
+            f"{name:<24} {format_seconds(median):>10} per call"
+            f"  {items / median:>16,.0f} items/s"
+        )
+
+    if args.save_baseline:
+        saved = results
+        if args.filter and args.baseline.exists():  # Only replace the cases run
+            saved = json.loads(args.baseline.read_text())
+            saved["cases"].update(results["cases"])
+        args.baseline.write_text(json.dumps(saved, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    if args.check:
+        baseline = json.loads(args.baseline.read_text())
+        problems = find_regressions(results, baseline, args.alpha, args.min_slowdown)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            return 1
+        print(f"No significant slowdowns against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
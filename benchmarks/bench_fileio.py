@@ -0,0 +1,77 @@
+"""Compares ways of running DataHandler over a large line-delimited file.
+
+Modes: a naive loop that reads the file line by line and calls process() per
+line, and process_file with one or more worker processes.
+
+Run from the project root with:
+    python -m benchmarks.bench_fileio --megabytes 200 --workers 1,4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from your_core_library.data_handler import DataHandler
+from your_core_library.fileio import process_file
+
+LINE = b"a line of benchmark input, " * 3 + b"\n"
+
+
+def make_input(path: Path, megabytes: int) -> int:
+    block = LINE * (1024 * 1024 // len(LINE))
+    with open(path, "wb") as f:
+        for _ in range(megabytes):
+            f.write(block)
+    return megabytes * (len(block) // len(LINE))
+
+
+def naive(input_path: Path, output_path: Path) -> None:
+    handler = DataHandler()
+    with (
+        open(input_path, encoding="utf-8") as source,
+        open(output_path, "w", encoding="utf-8") as target,
+    ):
+        for line in source:
+            try:
+                target.write(handler.process(line.rstrip("\n")) + "\n")
+            except ValueError:
+                pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--megabytes", type=int, default=100)
+    parser.add_argument(
+        "--workers",
+        type=lambda value: [int(part) for part in value.split(",")],
+        default=[1, os.cpu_count() or 1],
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path, output_path = Path(tmp) / "input.txt", Path(tmp) / "output.txt"
+        lines = make_input(input_path, args.megabytes)
+        print(f"{args.megabytes} MB, {lines:,} lines")
+
+        start = time.perf_counter()
+        naive(input_path, output_path)
+        seconds = time.perf_counter() - start
+        print(
+            f"{'line-by-line loop':<26} {seconds:>7.2f} s  {lines / seconds:>12,.0f} lines/s"
+        )
+
+        for workers in args.workers:
+            report = process_file(str(input_path), str(output_path), workers=workers)
+            label = f"process_file workers={workers}"
+            print(
+                f"{label:<26} {report.seconds:>7.2f} s  "
+                f"{report.records_per_second:>12,.0f} lines/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
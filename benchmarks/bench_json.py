@@ -0,0 +1,89 @@
+"""Compares JSON response serialization with and without FAST_JSON.
+
+First the render step alone: FastAPI's jsonable_encoder plus JSONResponse
+against FastJSONResponse, on a small and a larger payload. Then whole requests
+to the hot routes through the ASGI app in-process, with FAST_JSON off and on
+(so the response_model validation is included).
+
+Run from the project root with:
+    python -m benchmarks.bench_json
+"""
+
+import asyncio
+import logging
+import time
+import timeit
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from examples.web.config import settings
+from examples.web.main import app
+from examples.web.main import lifespan
+from examples.web.responses import FastJSONResponse
+from examples.web.responses import _orjson
+
+PAYLOADS: Dict[str, Any] = {
+    "small": {"data": "processed_daolyap"},
+    "large": {
+        "items": [
+            {"item_id": i, "name": f"Item {i}", "owner": "bench", "score": i / 7}
+            for i in range(1000)
+        ]
+    },
+}
+# name -> (method, path, JSON body)
+REQUESTS: Dict[str, Tuple[str, str, Any]] = {
+    "process": ("POST", "/process/", {"data": "payload"}),
+    "items": ("GET", "/items/42", None),
+    "core_greet": ("GET", "/core_greet?name=Bench", None),
+    "health": ("GET", "/health", None),
+}
+
+
+def per_call_us(func: Any) -> float:
+    loops, _ = timeit.Timer(func).autorange()
+    return min(timeit.repeat(func, number=loops, repeat=5)) / loops * 1e6
+
+
+async def requests_per_second(fast: bool, count: int) -> Dict[str, float]:
+    settings.FAST_JSON = fast
+    results = {}
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://b") as c:
+            for name, (method, path, body) in REQUESTS.items():
+                for _ in range(100):  # Warm-up
+                    await c.request(method, path, json=body)
+                start = time.perf_counter()
+                for _ in range(count):
+                    await c.request(method, path, json=body)
+                results[name] = (time.perf_counter() - start) / count * 1e6
+    return results
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    print(f"orjson installed: {_orjson() is not None}")
+    for name, payload in PAYLOADS.items():
+        default = per_call_us(lambda p=payload: JSONResponse(jsonable_encoder(p)))
+        fast = per_call_us(lambda p=payload: FastJSONResponse(p))
+        print(
+            f"render {name:<6} default {default:>9.1f} us  "
+            f"fast {fast:>9.1f} us  ({default / fast:.1f}x)"
+        )
+    default_requests = asyncio.run(requests_per_second(False, 2000))
+    fast_requests = asyncio.run(requests_per_second(True, 2000))
+    for name in REQUESTS:
+        print(
+            f"request {name:<11} default {default_requests[name]:>7.1f} us  "
+            f"fast {fast_requests[name]:>7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Compares request latency of the web app with synchronous and queued logging.
+
+Requests go through the ASGI app in-process while stdout is replaced by a
+stream whose writes take --write-ms, as when a log collector or terminal
+applies back-pressure.
+
+Run from the project root with:
+    python -m benchmarks.bench_logging --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import contextlib
+import statistics
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+
+import httpx
+
+from examples.web.config import settings
+from examples.web.main import app
+
+MODES: Dict[str, Dict[str, Any]] = {
+    "sync text": {"LOG_FORMAT": "text", "LOG_ASYNC": False},
+    "async json": {"LOG_FORMAT": "json", "LOG_ASYNC": True},
+    "async json, 10% sampled": {
+        "LOG_FORMAT": "json",
+        "LOG_ASYNC": True,
+        "LOG_REQUEST_SAMPLE_RATE": 0.1,
+    },
+}
+
+
+class SlowStream:
+    """A text stream whose writes block for a fixed time."""
+
+    def __init__(self, write_seconds: float):
+        self.write_seconds = write_seconds
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        time.sleep(self.write_seconds)
+        self.writes += 1
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+async def run_requests(requests: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def one(i: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(f"/items/{i}")
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        await asyncio.gather(*(one(i) for i in range(requests)))
+    return latencies
+
+
+async def run_mode(
+    overrides: Dict[str, Any], requests: int, concurrency: int, write_seconds: float
+) -> Dict[str, float]:
+    defaults = {name: getattr(settings, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    stream = SlowStream(write_seconds)
+    try:
+        with contextlib.redirect_stdout(stream):  # type: ignore[type-var]
+            async with app.router.lifespan_context(app):
+                start = time.perf_counter()
+                latencies = await run_requests(requests, concurrency)
+                seconds = time.perf_counter() - start
+    finally:
+        for name, value in defaults.items():
+            setattr(settings, name, value)
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "requests_per_second": requests / seconds,
+        "log_writes": stream.writes,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--write-ms", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"{args.write_ms} ms per log write"
+    )
+    for name, overrides in MODES.items():
+        result = asyncio.run(
+            run_mode(overrides, args.requests, args.concurrency, args.write_ms / 1000)
+        )
+        print(
+            f"{name:<24} p50 {result['p50_ms']:>7.2f} ms  p99 {result['p99_ms']:>7.2f} ms"
+            f"  {result['requests_per_second']:>8,.0f} req/s"
+            f"  {result['log_writes']:>6} log writes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Compares memory use and speed of ExampleModel storage layouts.
+
+Layouts: a list of dict-based models (the previous ExampleModel), a list of
+slotted ExampleModels, and one ExampleModelCollection.
+
+Run from the project root with:
+    python -m benchmarks.bench_models --models 1000000
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+from your_core_library.data_handler import ExampleModel
+from your_core_library.models import ExampleModelCollection
+
+
+class DictModel:
+    """ExampleModel as it was before: a plain class with a per-instance __dict__."""
+
+    def __init__(self, name: str, value: int):
+        self.name = name
+        self.value = value
+
+
+def make_values(count: int) -> List[int]:
+    rng = random.Random(42)  # nosec B311 # Deterministic benchmark data
+    return [rng.randint(-1_000_000, 1_000_000) for _ in range(count)]
+
+
+def make_names(count: int) -> Iterator[str]:
+    return (f"model-{i:08d}" for i in range(count))
+
+
+def allocated(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Builds an object and returns it with the bytes it allocated."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure_operations(models: Any) -> Tuple[float, float, float]:
+    if isinstance(models, ExampleModelCollection):
+        return (
+            timed(lambda: models.filter_by_value(min_value=0)),
+            timed(models.sort_by_value),
+            timed(lambda: sum(1 for _ in models)),
+        )
+    return (
+        timed(lambda: [model for model in models if model.value >= 0]),
+        timed(lambda: sorted(models, key=lambda model: model.value)),
+        timed(lambda: sum(1 for _ in models)),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=1_000_000)
+    args = parser.parse_args()
+    count = args.models
+
+    # Names are generated inside each build so that they are counted; the
+    # values are small shared ints for the lists but copied into the array.
+    values = make_values(count)
+    layouts = {
+        "list of dict models": lambda: [
+            DictModel(name, value)
+            for name, value in zip(make_names(count), values, strict=True)
+        ],
+        "list of slotted models": lambda: [
+            ExampleModel(name, value)
+            for name, value in zip(make_names(count), values, strict=True)
+        ],
+        "ExampleModelCollection": lambda: ExampleModelCollection(
+            make_names(count), values
+        ),
+    }
+    ExampleModelCollection(["warm-up"], [0]).sort_by_value()  # Imports NumPy
+    print(f"{count:,} models")
+    for label, build in layouts.items():
+        models, size = allocated(build)
+        filter_seconds, sort_seconds, iterate_seconds = measure_operations(models)
+        print(
+            f"{label:<24} {size / count:>7.1f} B/model  "
+            f"filter {filter_seconds * 1000:>7.1f} ms  "
+            f"sort {sort_seconds * 1000:>7.1f} ms  "
+            f"iterate {iterate_seconds * 1000:>7.1f} ms"
+        )
+        del models
+
+
+if __name__ == "__main__":
+    main()
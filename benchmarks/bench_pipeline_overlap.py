@@ -0,0 +1,81 @@
+"""Compares sequential and concurrent pipeline runs with I/O-bound ends.
+
+Extract and load simulate I/O with a fixed sleep per chunk; the transform is
+the example's CPU-bound transform_data. Run sequentially the wall time is the
+sum of the three stages; run concurrently, with each stage on its own thread
+and bounded queues in between, it approaches the slowest stage. Per-stage
+utilization and queue occupancy are printed for the concurrent runs.
+
+Run from the project root with:
+    python -m benchmarks.bench_pipeline_overlap --io-ms 5
+"""
+
+import argparse
+import time
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+from benchmarks.bench_pipeline_scaling import make_records
+from examples.data_pipeline import transform_data
+from your_core_library.pipeline import Pipeline
+from your_core_library.pipeline import PipelineReport
+
+
+def slow_source(
+    records: List[Dict[str, Any]], chunk_size: int, delay: float
+) -> Iterator[Dict[str, Any]]:
+    for i, record in enumerate(records):
+        if i % chunk_size == 0:
+            time.sleep(delay)  # One simulated request per chunk
+        yield record
+
+
+def run(
+    records: List[Dict[str, Any]],
+    chunk_size: int,
+    delay: float,
+    concurrent: bool,
+    queue_size: int,
+) -> PipelineReport:
+    pipeline = Pipeline(slow_source(records, chunk_size, delay), chunk_size=chunk_size)
+    pipeline.add_stage("transform", transform_data)
+    return pipeline.run(
+        lambda chunk: time.sleep(delay), concurrent=concurrent, queue_size=queue_size
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=1_000)
+    parser.add_argument(
+        "--io-ms", type=float, default=5.0, help="Simulated I/O per chunk."
+    )
+    parser.add_argument("--queue-sizes", type=int, nargs="+", default=[1, 2, 8])
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    delay = args.io_ms / 1000
+    print(
+        f"{args.records} records, chunks of {args.chunk_size}, "
+        f"{args.io_ms:g} ms of I/O per chunk in extract and in load"
+    )
+    baseline = run(records, args.chunk_size, delay, False, 1)
+    slowest = max(stats.seconds for stats in baseline.stages)
+    print(f"  sequential: {baseline.seconds:.3f}s (slowest stage {slowest:.3f}s)")
+    for queue_size in args.queue_sizes:
+        report = run(records, args.chunk_size, delay, True, queue_size)
+        print(
+            f"  concurrent, queue {queue_size}: {report.seconds:.3f}s"
+            f"  speedup x{baseline.seconds / report.seconds:.2f}"
+        )
+        for line in report.summary()[:-1]:
+            print(f"    {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measures how the pipeline's transform stage scales from 1 to N worker processes.
+
+The example transform is cheap enough that pickling chunks dominates, so a
+CPU-heavier transform (hashing each record HASH_ROUNDS times) is benchmarked too.
+
+Run from the project root with:
+    python -m benchmarks.bench_pipeline_scaling --max-workers 8
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+from examples.data_pipeline import transform_data
+from your_core_library.pipeline import Pipeline
+
+HASH_ROUNDS = 50
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    rng = random.Random(42)  # nosec B311 # Deterministic benchmark data
+    return [
+        {"id": i, "value": rng.randint(1, 100), "category": rng.choice("ABC")}
+        for i in range(count)
+    ]
+
+
+def heavy_transform(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    for record in chunk:
+        digest = repr(record).encode()
+        for _ in range(HASH_ROUNDS):
+            digest = hashlib.sha256(digest).digest()
+        record["digest"] = digest.hex()
+    return chunk
+
+
+def run(
+    records: List[Dict[str, Any]],
+    transform: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+    chunk_size: int,
+    workers: int,
+) -> float:
+    pipeline = Pipeline(iter(records), chunk_size=chunk_size)
+    pipeline.add_stage("transform", transform, workers=workers)
+    start = time.perf_counter()
+    pipeline.run(lambda chunk: None)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=5_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    for name, transform in (
+        ("transform_data", transform_data),
+        ("heavy_transform", heavy_transform),
+    ):
+        print(f"{name}: {args.records} records, chunks of {args.chunk_size}")
+        baseline = None
+        for workers in range(1, args.max_workers + 1):
+            seconds = run(records, transform, args.chunk_size, workers)
+            baseline = baseline or seconds
+            print(
+                f"  {workers:>2} worker(s): {args.records / seconds:>12,.0f} records/s"
+                f"  speedup x{baseline / seconds:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
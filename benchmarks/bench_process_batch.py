@@ -0,0 +1,78 @@
+"""Compares DataHandler.process_batch against calling process() in a loop.
+
+Run from the project root with:
+    python -m benchmarks.bench_process_batch --records 1000000
+"""
+
+import argparse
+import random
+import string
+import time
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from your_core_library.data_handler import DataHandler
+
+
+def make_payloads(count: int, length: int, error_rate: float) -> List[str]:
+    rng = random.Random(42)  # nosec B311 # Deterministic benchmark data
+    alphabet = string.ascii_letters + string.digits
+    payloads = []
+    for _ in range(count):
+        if rng.random() < error_rate:
+            payloads.append("trigger error")
+        else:
+            payloads.append("".join(rng.choices(alphabet, k=length)))
+    return payloads
+
+
+def loop_process(handler: DataHandler, payloads: List[str]) -> List[Optional[str]]:
+    """The per-record baseline: collects results and error messages like a batch."""
+    results: List[Optional[str]] = []
+    errors: List[Optional[str]] = []
+    for payload in payloads:
+        try:
+            results.append(handler.process(payload))
+            errors.append(None)
+        except ValueError as e:
+            results.append(None)
+            errors.append(str(e))
+    return results
+
+
+def best_of(repeats: int, func: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--length", type=int, default=32)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    handler = DataHandler()
+    payloads = make_payloads(args.records, args.length, args.error_rate)
+
+    cases = {
+        "process (loop)": lambda: loop_process(handler, payloads),
+        "process_batch": lambda: handler.process_batch(payloads),
+        "process_many (chunks of 4096)": lambda: list(
+            handler.process_many(payloads, chunk_size=4096)
+        ),
+    }
+    print(f"{args.records} records, {args.length} chars, error rate {args.error_rate}")
+    for name, func in cases.items():
+        seconds = best_of(args.repeats, func)
+        print(f"{name:<32} {args.records / seconds:>14,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Compares checking input against many rules one at a time and compiled.
+
+"one at a time" lowers each record and tests every reject word, and every
+numeric threshold, in a Python loop, the way hard-coded checks grow.
+"RuleSet.check" matches all rules against each record in one pass, and
+"RuleSet.check_batch" scans the whole joined batch at once, with
+Aho-Corasick when pyahocorasick (the 'perf' extra) is installed. Numeric
+rules are compared with "check_values", vectorized when NumPy is installed.
+Each rule count is timed separately, as the one-at-a-time cost grows with it.
+
+Run from the project root with:
+    python -m benchmarks.bench_rules --records 100000 --rules 10 50 200
+"""
+
+import argparse
+import operator
+import random
+import string
+import time
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from your_core_library import rules
+from your_core_library.rules import NumericRule
+from your_core_library.rules import PatternRule
+from your_core_library.rules import RuleSet
+
+
+def timed(label: str, records: int, func: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    print(f"{label:<28} {records / seconds:>14,.0f} records/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--rules", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--length", type=int, default=200)
+    args = parser.parse_args()
+
+    backend = (
+        f"Aho-Corasick from {rules._AUTOMATON_MIN_LITERALS} rules"
+        if rules._ahocorasick() is not None
+        else "str.find"
+    )
+    print(f"{args.records:,} records of {args.length} chars; literals via {backend}")
+    for rule_count in args.rules:
+        print(f"--- {rule_count} rules of each kind")
+        run(args.records, rule_count, args.length)
+
+
+def run(records: int, rule_count: int, length: int) -> None:
+    rng = random.Random(0)
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=8)) for _ in range(rule_count)
+    ]
+    texts = [
+        "".join(rng.choices(string.ascii_letters + " ", k=length))
+        for _ in range(records)
+    ]
+    for index in range(0, records, 100):  # 1% of records are rejected
+        texts[index] += " " + rng.choice(words).upper()
+    values = [rng.uniform(-10, 1000) for _ in range(records)]
+    thresholds = [(operator.gt, 900.0 + i) for i in range(rule_count)]
+    rule_set = RuleSet(
+        [PatternRule(f"w{i}", word) for i, word in enumerate(words)],
+        [NumericRule(f"n{i}", ">", 900.0 + i) for i in range(rule_count)],
+    )
+
+    def patterns_one_at_a_time() -> List[Optional[str]]:
+        results: List[Optional[str]] = []
+        for text in texts:
+            lowered = text.lower()
+            results.append(next((word for word in words if word in lowered), None))
+        return results
+
+    def numeric_one_at_a_time() -> List[Optional[float]]:
+        return [
+            next((t for compare, t in thresholds if compare(value, t)), None)
+            for value in values
+        ]
+
+    timed("patterns one at a time", records, patterns_one_at_a_time)
+    timed("RuleSet.check", records, lambda: [rule_set.check(t) for t in texts])
+    timed("RuleSet.check_batch", records, lambda: rule_set.check_batch(texts))
+    timed("numeric one at a time", records, numeric_one_at_a_time)
+    timed("RuleSet.check_values", records, lambda: rule_set.check_values(values))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Measures the throughput of the pipeline sinks.
+
+Each sink receives --records pipeline-shaped records in chunks of --chunk-size,
+with the chunks produced by DataHandler.process_batch so that there is
+transform work to overlap with I/O. Every format is run in the foreground and
+with BackgroundSink. "print" is the original load_data approach, one print per
+record with stdout redirected to a file, and "(no sink)" is the transform work
+alone. Parquet and Arrow are skipped without pyarrow.
+
+Run from the project root with:
+    python -m benchmarks.bench_sinks --records 1000000
+"""
+
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+
+from your_core_library.data_handler import DataHandler
+from your_core_library.sinks import SINK_FORMATS
+from your_core_library.sinks import open_sink
+
+
+def make_chunk(handler: DataHandler, start: int, size: int) -> List[Dict[str, Any]]:
+    ids = range(start, start + size)
+    processed = handler.process_batch([f"record {i}" for i in ids]).results
+    return [
+        {"id": i, "value": i % 100, "category": "ABC"[i % 3], "data": data}
+        for i, data in zip(ids, processed, strict=True)
+    ]
+
+
+def run_transform_only(records: int, chunk_size: int) -> float:
+    handler = DataHandler()
+    start = time.perf_counter()
+    for offset in range(0, records, chunk_size):
+        make_chunk(handler, offset, chunk_size)
+    return time.perf_counter() - start
+
+
+def run_print(path: str, records: int, chunk_size: int) -> float:
+    handler = DataHandler()
+    start = time.perf_counter()
+    with open(path, "w") as output, contextlib.redirect_stdout(output):
+        for offset in range(0, records, chunk_size):
+            for record in make_chunk(handler, offset, chunk_size):
+                print(record)
+    return time.perf_counter() - start
+
+
+def run_sink(
+    file_format: str,
+    path: str,
+    records: int,
+    chunk_size: int,
+    batch_size: int,
+    background: bool,
+) -> float:
+    handler = DataHandler()
+    start = time.perf_counter()
+    with open_sink(file_format, path, batch_size, background=background) as sink:
+        for offset in range(0, records, chunk_size):
+            sink.write(make_chunk(handler, offset, chunk_size))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        formats = [name for name in SINK_FORMATS if name not in ("parquet", "arrow")]
+    else:
+        formats = list(SINK_FORMATS)
+
+    seconds = run_transform_only(args.records, args.chunk_size)
+    print(f"{'(no sink)':<20} {args.records / seconds:>12,.0f} records/s")
+    with tempfile.TemporaryDirectory() as tmp:
+        seconds = run_print(os.path.join(tmp, "out.txt"), args.records, args.chunk_size)
+        print(f"{'print':<20} {args.records / seconds:>12,.0f} records/s")
+        for file_format in formats:
+            for background in (False, True):
+                path = os.path.join(tmp, f"out-{background}.{file_format}")
+                seconds = run_sink(
+                    file_format,
+                    path,
+                    args.records,
+                    args.chunk_size,
+                    args.batch_size,
+                    background,
+                )
+                label = f"{file_format}{' (background)' if background else ''}"
+                print(f"{label:<20} {args.records / seconds:>12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measures how concurrent fetching speeds up HTTP extraction.
+
+A MockTransport stands in for the remote API: every page of --per-page
+records answers after --latency-ms milliseconds. "sequential" fetches the
+pages one after another with a blocking httpx.Client, the way a plain loop
+would; the other rows iterate HttpSource with increasing concurrency.
+
+Run from the project root with:
+    python -m benchmarks.bench_sources --pages 200 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from your_core_library.sources import HttpSource
+
+
+def make_page(request: httpx.Request, per_page: int) -> httpx.Response:
+    page = int(request.url.params["page"])
+    start = page * per_page
+    return httpx.Response(
+        200, json=[{"id": i, "value": i % 100} for i in range(start, start + per_page)]
+    )
+
+
+def run_sequential(pages: int, per_page: int, latency: float) -> float:
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        return make_page(request, per_page)
+
+    start = time.perf_counter()
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        for page in range(pages):
+            client.get(f"http://bench/records?page={page}").json()
+    return time.perf_counter() - start
+
+
+def run_source(pages: int, per_page: int, latency: float, concurrency: int) -> float:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return make_page(request, per_page)
+
+    source = HttpSource(
+        (f"http://bench/records?page={page}" for page in range(pages)),
+        concurrency=concurrency,
+        transport=httpx.MockTransport(handler),
+    )
+    start = time.perf_counter()
+    for _ in source:
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    seconds = run_sequential(args.pages, args.per_page, latency)
+    print(f"{'sequential':<20} {args.pages / seconds:>10,.0f} pages/s")
+    for concurrency in (1, 4, 16, 64):
+        seconds = run_source(args.pages, args.per_page, latency, concurrency)
+        label = f"concurrency={concurrency}"
+        print(f"{label:<20} {args.pages / seconds:>10,.0f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
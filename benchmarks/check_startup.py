@@ -0,0 +1,83 @@
+"""Checks CLI startup against the committed budget in startup_budget.json.
+
+Runs the budget's command under ``python -X importtime`` several times and
+takes the median time spent importing the modules the script itself pulls in
+(imports the bare interpreter already does at startup are excluded). Fails if
+that exceeds ``max_import_ms`` or if any ``forbidden_modules`` were imported.
+
+Run from the project root with:
+    python -m benchmarks.check_startup
+"""
+
+import argparse
+import json
+import statistics
+import subprocess  # nosec B404 # Runs the local interpreter only
+import sys
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Set
+
+BUDGET_FILE = Path(__file__).with_name("startup_budget.json")
+
+
+def import_times(args: List[str]) -> Dict[str, float]:
+    """Maps every imported module to its cumulative import time in ms.
+
+    Nested imports are prefixed with spaces, as in ``-X importtime`` output.
+    """
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name[1:].rstrip()] = int(cumulative) / 1000
+    return times
+
+
+def script_import_ms(times: Dict[str, float], interpreter_imports: Set[str]) -> float:
+    return sum(
+        ms
+        for name, ms in times.items()
+        if not name.startswith(" ") and name not in interpreter_imports
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    budget = json.loads(BUDGET_FILE.read_text())
+    command = budget["command"]
+    interpreter_imports = set(import_times(["-c", "pass"]))
+    runs = [import_times(command) for _ in range(args.runs)]
+    median_ms = statistics.median(
+        script_import_ms(times, interpreter_imports) for times in runs
+    )
+    print(f"{' '.join(command)}: median import time {median_ms:.1f} ms")
+    print(f"budget: {budget['max_import_ms']:.1f} ms")
+
+    failed = median_ms > budget["max_import_ms"]
+    if failed:
+        print("FAIL: startup import time is over budget.")
+    forbidden = sorted(
+        name.strip()
+        for name in runs[0]
+        if name.strip().split(".")[0] in budget["forbidden_modules"]
+    )
+    if forbidden:
+        print(f"FAIL: fast path imported {', '.join(forbidden[:5])}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
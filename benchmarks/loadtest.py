@@ -0,0 +1,265 @@
+"""Load-tests the FastAPI example app on localhost and checks for regressions.
+
+For each worker count the app is started under uvicorn in a subprocess and
+every endpoint is driven by --concurrency async httpx clients in a closed loop
+for --duration seconds (after a short warm-up). Throughput and p50/p95/p99
+latency are printed and written to --output as JSON. With --baseline, the run
+fails if any endpoint's throughput dropped or its p99 latency grew by more than
+--max-regression compared to the baseline file.
+
+Run from the project root with:
+    python -m benchmarks.loadtest --workers 1,2 --duration 10
+    python -m benchmarks.loadtest --baseline benchmarks/results/loadtest.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess  # nosec B404 # Runs the local interpreter only
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import httpx
+
+APP = "examples.web.main:app"
+HOST = "127.0.0.1"
+DEFAULT_OUTPUT = Path(__file__).with_name("results") / "loadtest.json"
+
+# name -> (method, path, JSON body)
+ENDPOINTS: Dict[str, Tuple[str, str, Optional[Dict[str, Any]]]] = {
+    "process": ("POST", "/process/", {"data": "load test payload"}),
+    "items": ("GET", "/items/42", None),
+    "core_greet": ("GET", "/core_greet?name=Load", None),
+    "health": ("GET", "/health", None),
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(fraction * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def start_server(workers: int, port: int) -> "subprocess.Popen[bytes]":
+    env = {**os.environ, "LOG_LEVEL": "WARNING"}
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        APP,
+        "--host",
+        HOST,
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+        "--no-access-log",
+    ]
+    return subprocess.Popen(command, env=env)  # nosec B603
+
+
+def wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"Server at {base_url} did not become ready in {timeout}s.")
+
+
+async def drive(
+    client: httpx.AsyncClient, endpoint: str, concurrency: int, duration: float
+) -> Dict[str, Any]:
+    """Runs a closed-loop load against one endpoint and summarizes latencies."""
+    method, path, body = ENDPOINTS[endpoint]
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            errors += not ok
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "endpoint": endpoint,
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+async def load_test(
+    base_url: str,
+    endpoints: List[str],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+) -> List[Dict[str, Any]]:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        results = []
+        for endpoint in endpoints:
+            await drive(client, endpoint, concurrency, warmup)
+            results.append(await drive(client, endpoint, concurrency, duration))
+        return results
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    runs = []
+    for workers in args.workers:
+        port = free_port()
+        base_url = f"http://{HOST}:{port}"
+        server = start_server(workers, port)
+        try:
+            wait_until_ready(base_url)
+            for result in asyncio.run(
+                load_test(
+                    base_url,
+                    args.endpoints,
+                    args.concurrency,
+                    args.duration,
+                    args.warmup,
+                )
+            ):
+                runs.append({"workers": workers, **result})
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+        },
+        "runs": runs,
+    }
+
+
+def find_regressions(
+    results: Dict[str, Any], baseline: Dict[str, Any], max_regression: float
+) -> List[str]:
+    """Compares runs with the same worker count and endpoint against a baseline."""
+    previous = {(run["workers"], run["endpoint"]): run for run in baseline["runs"]}
+    problems = []
+    for run in results["runs"]:
+        old = previous.get((run["workers"], run["endpoint"]))
+        if old is None:
+            continue
+        label = f"{run['endpoint']} ({run['workers']} worker(s))"
+        min_rps = old["requests_per_second"] * (1 - max_regression)
+        if run["requests_per_second"] < min_rps:
+            problems.append(
+                f"{label}: {run['requests_per_second']:,.0f} req/s is below "
+                f"{min_rps:,.0f} (baseline {old['requests_per_second']:,.0f})"
+            )
+        max_p99 = old["p99_ms"] * (1 + max_regression)
+        if run["p99_ms"] > max_p99:
+            problems.append(
+                f"{label}: p99 {run['p99_ms']:.2f} ms is above {max_p99:.2f} ms "
+                f"(baseline {old['p99_ms']:.2f} ms)"
+            )
+        if run["errors"] > old["errors"]:
+            problems.append(
+                f"{label}: {run['errors']} errors (baseline {old['errors']})"
+            )
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--workers",
+        type=lambda value: [int(part) for part in value.split(",")],
+        default=[1],
+        help="Comma-separated uvicorn worker counts, e.g. 1,2,4.",
+    )
+    parser.add_argument(
+        "--endpoints",
+        type=lambda value: value.split(","),
+        default=list(ENDPOINTS),
+        help=f"Comma-separated subset of {','.join(ENDPOINTS)}.",
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Allowed relative throughput drop / p99 increase (default: 0.2).",
+    )
+    args = parser.parse_args()
+    unknown = set(args.endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"Unknown endpoint(s): {', '.join(sorted(unknown))}")
+
+    # Read the baseline first: it may be the file this run overwrites.
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    results = run(args)
+    for result in results["runs"]:
+        print(
+            f"{result['endpoint']:<11} workers={result['workers']:<2} "
+            f"{result['requests_per_second']:>9,.0f} req/s  "
+            f"p50 {result['p50_ms']:>7.2f} ms  p95 {result['p95_ms']:>7.2f} ms  "
+            f"p99 {result['p99_ms']:>7.2f} ms  errors {result['errors']}"
+        )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"Results written to {args.output}")
+
+    if baseline is not None:
+        problems = find_regressions(results, baseline, args.max_regression)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            return 1
+        print(f"No regressions beyond {args.max_regression:.0%} of {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
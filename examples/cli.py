@@ -1,27 +1,199 @@
-import typer
+# Typer (with its click/rich stack) is only imported when it is needed: plain
+# greetings take a fast path that parses the few known options directly.
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import BinaryIO
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
 
 from your_core_library.data_handler import get_core_greeting
 
-app = typer.Typer(
-    help="A simple CLI example that uses the project's core library.",
-)
+if TYPE_CHECKING:
+    import typer
 
+# Repeated lines are written in blocks of about this many bytes.
+WRITE_BLOCK_SIZE = 1 << 16
+OUTPUT_BUFFER_SIZE = 1 << 20
+# Fastest gzip level; the repeated lines still compress extremely well.
+GZIP_LEVEL = 1
 
-@app.command()
-def main(
-    name: str = typer.Option("World", help="The name to greet."),
-    count: int = typer.Option(1, help="Number of times to print the core message."),
-):
-    """Say hello and demonstrate core library functionality."""
+
+def write_repeated(stream: BinaryIO, line: bytes, count: int) -> None:
+    """Writes ``line`` ``count`` times using a few large writes.
+
+    A count below one writes nothing, as ``line * count`` would.
+    """
+    per_block = max(1, WRITE_BLOCK_SIZE // len(line))
+    full_blocks, remainder = divmod(max(count, 0), per_block)
+    if full_blocks:
+        block = line * per_block
+        for _ in range(full_blocks):
+            stream.write(block)
+    stream.write(line * remainder)
+
+
+def greet(
+    name: str = "World",
+    count: int = 1,
+    output: Optional[str] = None,
+    compress: bool = False,
+) -> None:
+    """Say hello and demonstrate core library functionality.
+
+    The core message is computed once and written in bulk, either to stdout or
+    to ``output`` (gzip-compressed with ``compress`` or a ``.gz`` suffix).
+    """
     greeting_msg = f"Hello {name}!"
     print(greeting_msg)
 
-    for _ in range(count):
-        core_msg = get_core_greeting(name)  # Use the imported function
-        print(f"Core library says: {core_msg}")
+    core_msg = get_core_greeting(name)  # Use the imported function
+    line = f"Core library says: {core_msg}\n".encode()
+    if output is not None:
+        if compress or output.endswith(".gz"):
+            import gzip
+
+            with gzip.open(output, "wb", compresslevel=GZIP_LEVEL) as stream:
+                write_repeated(stream, line, count)  # type: ignore[arg-type]
+        else:
+            with open(output, "wb", buffering=OUTPUT_BUFFER_SIZE) as stream:
+                write_repeated(stream, line, count)
+    else:
+        sys.stdout.flush()
+        stdout = getattr(sys.stdout, "buffer", None)
+        if stdout is not None:
+            write_repeated(stdout, line, count)
+            stdout.flush()
+        else:  # A text-only stream, e.g. a replaced sys.stdout
+            sys.stdout.write(line.decode() * count)
 
     print(f"Printed the greeting {count} time(s) for {name}.")
 
 
+def parse_fast_args(argv: List[str]) -> Optional[Dict[str, Any]]:
+    """Parses the greeting options into ``greet`` keyword arguments without Typer.
+
+    Returns None for anything else (``--help``, unknown options, bad values) so
+    the caller can hand the arguments to Typer for full handling and errors.
+    """
+    options: Dict[str, Any] = {"name": "World", "count": 1}
+    args = iter(argv)
+    for arg in args:
+        if arg == "--gzip":
+            options["compress"] = True
+            continue
+        option, has_value, value = arg.partition("=")
+        if option not in ("--name", "--count", "--output"):
+            return None
+        if not has_value:
+            next_value = next(args, None)
+            if next_value is None:
+                return None
+            value = next_value
+        if option == "--count":
+            try:
+                options["count"] = int(value)
+            except ValueError:
+                return None
+        else:
+            options[option[2:]] = value
+    return options
+
+
+def run_batch(lines: Iterable[str]) -> int:
+    """Runs one greeting per line of options and returns the number of bad lines."""
+    import shlex
+
+    errors = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        parsed = parse_fast_args(shlex.split(line))
+        if parsed is None:
+            print(f"Skipping invalid command: {line.strip()}", file=sys.stderr)
+            errors += 1
+        else:
+            greet(**parsed)
+    return errors
+
+
+@lru_cache(maxsize=None)
+def build_app() -> "typer.Typer":
+    import typer
+
+    # The callback's docstring is the app help, as it was for the single command.
+    app = typer.Typer()
+
+    @app.callback(invoke_without_command=True)
+    def main(
+        ctx: typer.Context,
+        name: str = typer.Option("World", help="The name to greet."),
+        count: int = typer.Option(1, help="Number of times to print the core message."),
+        output: Optional[str] = typer.Option(
+            None, help="Write the core messages to this file instead of stdout."
+        ),
+        gzip: bool = typer.Option(
+            False, "--gzip", help="Gzip-compress --output (implied by a .gz suffix)."
+        ),
+        batch: bool = typer.Option(
+            False,
+            "--batch",
+            help="Read one set of options per line from stdin and run them all.",
+        ),
+    ):
+        """Say hello and demonstrate core library functionality."""
+        if ctx.invoked_subcommand is not None:
+            return
+        if batch:
+            raise typer.Exit(code=1 if run_batch(sys.stdin) else 0)
+        greet(name, count, output=output, compress=gzip)
+
+    @app.command("process-file")
+    def process_file_command(
+        input_path: str = typer.Argument(..., metavar="INPUT"),
+        output_path: str = typer.Argument(..., metavar="OUTPUT"),
+        workers: int = typer.Option(
+            1, min=1, help="Worker processes, each handling one byte range."
+        ),
+        record_size: Optional[int] = typer.Option(
+            None, min=1, help="Fixed record size in bytes (default: one per line)."
+        ),
+    ):
+        """Process every record of a large file through the core library."""
+        from your_core_library.fileio import process_file
+
+        report = process_file(
+            input_path, output_path, workers=workers, record_size=record_size
+        )
+        print(
+            f"Processed {report.records} record(s) ({report.errors} rejected) "
+            f"in {report.seconds:.2f}s: {report.bytes_in} bytes in, "
+            f"{report.bytes_out} bytes out."
+        )
+
+    return app
+
+
+def __getattr__(name: str):
+    # Builds the Typer app on first access, e.g. `from examples.cli import app`.
+    if name == "app":
+        return build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv == ["--batch"]:
+        sys.exit(1 if run_batch(sys.stdin) else 0)
+    parsed = parse_fast_args(argv)
+    if parsed is None:
+        build_app()(args=argv)
+    else:
+        greet(**parsed)
+
+
 if __name__ == "__main__":
-    app()
+    run()
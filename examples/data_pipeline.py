@@ -1,11 +1,28 @@
+import argparse
 import logging
 import random
+from functools import partial
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
 
 # Import from the installed package name, not the src directory
+from your_core_library.checkpoint import CheckpointStore
 from your_core_library.data_handler import get_core_greeting
+from your_core_library.pipeline import Pipeline
+from your_core_library.sinks import APPENDABLE_FORMATS
+from your_core_library.sinks import SINK_FORMATS
+from your_core_library.sinks import Sink
+from your_core_library.sinks import open_sink
+from your_core_library.sources import HttpSource
+
+if TYPE_CHECKING:
+    from your_core_library.columnar import RecordBatch
 
 # Configure basic logging
 logging.basicConfig(
@@ -13,25 +30,42 @@ logging.basicConfig(
 )
 
 
-def extract_data() -> List[Dict[str, Any]]:
-    """Simulates extracting raw data."""
+def extract_data(num_records: int = 10, start_id: int = 1) -> Iterator[Dict[str, Any]]:
+    """Simulates extracting raw data, yielding one record at a time.
+
+    Records have ids ``start_id`` to ``num_records``, so an incremental run
+    can ask only for the records after the ones it has already processed.
+    """
     logging.info("Starting data extraction...")
     # In a real scenario, this could read from a DB, API, file, etc.
-    raw_data = [
-        {
+    for i in range(start_id, num_records + 1):
+        yield {
             "id": i,
             "value": random.randint(1, 100),
             "category": random.choice(["A", "B", "C"]),
         }
-        for i in range(1, 11)
-    ]
-    logging.info(f"Extracted {len(raw_data)} raw records.")
-    return raw_data
+    logging.info(f"Extracted {max(0, num_records - start_id + 1)} raw records.")
+
 
+def extract_http(
+    url_template: str, pages: int, concurrency: int = 8, **options: Any
+) -> HttpSource:
+    """Extracts records from ``pages`` HTTP pages, fetched concurrently.
 
-def transform_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Simulates transforming the data."""
-    logging.info("Starting data transformation...")
+    ``url_template`` holds a ``{page}`` placeholder that is filled with the
+    page numbers 1 to ``pages``; each page must return a JSON list of
+    records. ``options`` are passed on to ``HttpSource`` (e.g. ``retries``).
+    """
+    if "{page}" not in url_template:
+        raise ValueError("The source URL needs a {page} placeholder.")
+    urls = (url_template.format(page=page) for page in range(1, pages + 1))
+    logging.info(f"Extracting {pages} page(s) with up to {concurrency} in flight.")
+    return HttpSource(urls, concurrency=concurrency, **options)
+
+
+def transform_data(data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Simulates transforming the data (one chunk of it when run by main)."""
+    logging.debug("Starting data transformation...")
     transformed = []
     # Example: Filter records with value > 50 and add a derived field using the core library
     core_lib_msg = get_core_greeting()  # Get message from core library
@@ -41,10 +75,39 @@ def transform_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             record["core_message"] = core_lib_msg  # Add info from core lib
             record["value_category"] = f"{record['value']}-{record['category']}"
             transformed.append(record)
-    logging.info(f"Transformed data resulted in {len(transformed)} records.")
+    logging.debug(f"Transformed data resulted in {len(transformed)} records.")
     return transformed
 
 
+def transform_batch(batch: "RecordBatch") -> "RecordBatch":
+    """Columnar version of transform_data, vectorized over a RecordBatch.
+
+    Needs the optional 'perf' extra (NumPy).
+    """
+    import numpy as np
+
+    kept = batch.filter(batch["value"] > 50)
+    value_category = np.char.add(
+        np.char.add(kept["value"].astype(np.str_), "-"), kept["category"]
+    )
+    return (
+        kept.with_constant("status", "processed")
+        .with_constant("core_message", get_core_greeting())
+        .with_column("value_category", value_category)
+    )
+
+
+def load_batch(
+    batch: "RecordBatch",
+    load: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+):
+    """Loads a RecordBatch, converting it back to dict records at the edge.
+
+    ``load`` receives the records; it defaults to ``load_data``.
+    """
+    (load or load_data)(batch.to_records())
+
+
 def load_data(data: List[Dict[str, Any]]):
     """Simulates loading the transformed data."""
     logging.info("Starting data loading...")
@@ -60,14 +123,233 @@ def load_data(data: List[Dict[str, Any]]):
     logging.info(f"Successfully loaded {len(data)} records.")
 
 
-def main():
-    """Main function to run the ETL pipeline."""
+def load_and_checkpoint(
+    chunk: Any,
+    load: Callable[[Any], Any],
+    writer: Optional[Sink],
+    store: CheckpointStore,
+):
+    """Loads a chunk, makes it durable, then commits the checkpoint.
+
+    With the in-process pipeline everything extracted so far has been loaded
+    or dropped by the time a chunk reaches the sink, so committing all staged
+    records is safe.
+    """
+    load(chunk)
+    if writer is not None:
+        writer.flush()
+    store.commit()
+
+
+def main(
+    num_records: int = 10,
+    chunk_size: int = 1000,
+    workers: int = 1,
+    ordered: bool = True,
+    columnar: bool = False,
+    sink: Optional[str] = None,
+    output: Optional[str] = None,
+    sink_batch_size: int = 10_000,
+    background: bool = False,
+    state: Optional[str] = None,
+    source_url: Optional[str] = None,
+    pages: int = 1,
+    concurrency: int = 8,
+    concurrent: bool = False,
+    queue_size: int = 2,
+):
+    """Main function to run the ETL pipeline.
+
+    Records stream through the stages in chunks of ``chunk_size``, so memory
+    use stays flat regardless of ``num_records``. With ``workers > 1`` the
+    transform stage runs on a process pool, one chunk per task. With
+    ``columnar`` each chunk is converted to a RecordBatch once after extraction
+    and back to dicts only when loading.
+
+    With ``sink`` (one of ``SINK_FORMATS``) records are written to ``output``
+    in batches of ``sink_batch_size`` instead of being printed; with
+    ``background`` the writes run on a separate thread.
+
+    With ``state`` (a SQLite file) the run is incremental: only records after
+    the stored high-water mark are extracted, records whose content was
+    already processed are skipped, and the checkpoint is committed after each
+    loaded chunk, so a crashed run resumes from the last committed chunk.
+    The sink then appends to ``output`` (one of ``APPENDABLE_FORMATS``).
+
+    With ``source_url`` records are fetched from ``pages`` HTTP pages (see
+    ``extract_http``) instead of being simulated; up to ``concurrency``
+    requests run at once, ahead of the transform.
+
+    With ``concurrent`` extract, each transform stage and load run at the
+    same time on their own threads, connected by queues of at most
+    ``queue_size`` chunks, so a slow load throttles the extraction and the
+    run takes about as long as its slowest stage.
+    """
+    if state is not None and workers > 1:
+        raise ValueError("Incremental runs need an in-process transform (workers=1).")
+    if state is not None and concurrent:
+        # Committing after a chunk is loaded is only safe when nothing
+        # extracted after it has been staged yet.
+        raise ValueError("Incremental runs cannot run the stages concurrently.")
+    load: Any = load_data
+    writer = None
+    if sink is not None:
+        if output is None:
+            raise ValueError("An output path is required when a sink is used.")
+        # An incremental run adds to the output of the runs before it.
+        writer = open_sink(
+            sink,
+            output,
+            sink_batch_size,
+            background=background,
+            append=state is not None,
+        )
+        load = writer.write
+    checkpoints = None
+    start_id = 1
+    if state is not None:
+        checkpoints = CheckpointStore(state, pipeline="data_pipeline")
+        start_id = (checkpoints.high_water_mark or 0) + 1
+        logging.info(f"Incremental run: extracting records from id {start_id}.")
     logging.info("ETL Pipeline Started.")
-    raw = extract_data()
-    transformed = transform_data(raw)
-    load_data(transformed)
+    source: Iterable[Dict[str, Any]]
+    if source_url is not None:
+        source = extract_http(source_url, pages, concurrency)
+    else:
+        source = extract_data(num_records, start_id)
+    pipeline = Pipeline(source, chunk_size=chunk_size)
+    if checkpoints is not None:
+        pipeline.add_stage("skip_unchanged", checkpoints.select)
+    if columnar:
+        from your_core_library.columnar import RecordBatch
+
+        pipeline.add_stage("to_columnar", RecordBatch.from_records)
+        pipeline.add_stage(
+            "transform", transform_batch, workers=workers, ordered=ordered
+        )
+        load = partial(load_batch, load=load)
+    else:
+        pipeline.add_stage(
+            "transform", transform_data, workers=workers, ordered=ordered
+        )
+    if checkpoints is not None:
+        load = partial(load_and_checkpoint, load=load, writer=writer, store=checkpoints)
+    try:
+        report = pipeline.run(
+            load, sink_name="load", concurrent=concurrent, queue_size=queue_size
+        )
+        if checkpoints is not None:  # Records the transform dropped at the end
+            checkpoints.commit()
+    finally:
+        if writer is not None:
+            writer.close()
+        if checkpoints is not None:
+            checkpoints.close()
+    for line in report.summary():
+        logging.info(f"Pipeline stats: {line}")
     logging.info("ETL Pipeline Finished.")
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the example ETL pipeline.")
+    parser.add_argument("--records", type=int, default=10, help="Records to extract.")
+    parser.add_argument(
+        "--chunk-size", type=int, default=1000, help="Records per pipeline chunk."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for the transform stage (1 runs it in-process).",
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="With --workers > 1, load chunks as they finish instead of in order.",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Transform NumPy-backed columnar batches (needs the 'perf' extra).",
+    )
+    parser.add_argument(
+        "--sink",
+        choices=SINK_FORMATS,
+        help="Write records to --output in this format instead of printing them.",
+    )
+    parser.add_argument("--output", help="Output file (or SQLite database) path.")
+    parser.add_argument(
+        "--sink-batch-size",
+        type=int,
+        default=10_000,
+        help="Records per sink write (per transaction for sqlite).",
+    )
+    parser.add_argument(
+        "--background",
+        action="store_true",
+        help="Write to the sink on a background thread.",
+    )
+    parser.add_argument(
+        "--state",
+        help="Checkpoint database; makes the run incremental (only new or "
+        "changed records are processed).",
+    )
+    parser.add_argument(
+        "--source-url",
+        help="Fetch records over HTTP from this URL template, e.g. "
+        "'http://host/records?page={page}', instead of simulating them.",
+    )
+    parser.add_argument(
+        "--pages", type=int, default=1, help="Pages to fetch with --source-url."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Concurrent requests with --source-url.",
+    )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Run extract, transform and load at the same time on separate "
+        "threads, connected by bounded queues.",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=2,
+        help="Chunks each queue holds with --concurrent.",
+    )
+    args = parser.parse_args(argv)
+    if args.sink is not None and args.output is None:
+        parser.error("--sink requires --output.")
+    if args.state is not None and args.workers > 1:
+        parser.error("--state cannot be combined with --workers > 1.")
+    if args.state is not None and args.sink not in (None, *APPENDABLE_FORMATS):
+        parser.error(f"--state cannot be combined with --sink {args.sink}.")
+    if args.state is not None and args.concurrent:
+        parser.error("--state cannot be combined with --concurrent.")
+    if args.queue_size < 1:
+        parser.error("--queue-size must be a positive integer.")
+    return args
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(
+        num_records=args.records,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        ordered=not args.unordered,
+        columnar=args.columnar,
+        sink=args.sink,
+        output=args.output,
+        sink_batch_size=args.sink_batch_size,
+        background=args.background,
+        state=args.state,
+        source_url=args.source_url,
+        pages=args.pages,
+        concurrency=args.concurrency,
+        concurrent=args.concurrent,
+        queue_size=args.queue_size,
+    )
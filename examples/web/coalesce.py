@@ -0,0 +1,157 @@
+import asyncio
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    coalesced: int = 0  # Calls that joined a computation already in flight
+    in_flight: int = 0
+
+
+class SingleFlight:
+    """Shares one in-flight computation among concurrent calls with one key.
+
+    The first call for a key starts ``func()`` as a task; calls for the same
+    key made before it finishes await that task instead of starting their
+    own, and all of them get its result or exception. The task is shielded,
+    so a cancelled caller (a disconnected client) does not cancel the others.
+    Nothing is remembered once the computation finishes.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._stats = SingleFlightStats()
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        self._stats.calls += 1
+        future = self._in_flight.get(key)
+        if future is not None:
+            self._stats.coalesced += 1
+        else:
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            future.exception()  # Retrieved here in case every caller went away
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._stats
+        stats.in_flight = len(self._in_flight)
+        ratio = stats.coalesced / stats.calls if stats.calls else 0.0
+        return {**asdict(stats), "ratio": ratio}
+
+
+@dataclass
+class MicroBatchStats:
+    items: int = 0
+    batches: int = 0
+    wait_seconds_total: float = 0.0  # Latency added by waiting for the window
+    wait_seconds_max: float = 0.0
+
+
+class MicroBatcher(Generic[T, R]):
+    """Collects concurrent calls for a short window into one batch call.
+
+    ``submit(item)`` waits until ``window`` seconds have passed since the
+    first item of the current batch, or until ``max_batch`` items have been
+    collected, then ``run_batch(items)`` is awaited once for all of them. It
+    must return one entry per item: the result, or an exception to raise in
+    that item's caller. If ``run_batch`` itself raises, every caller gets the
+    exception.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[T]], Awaitable[Sequence[Union[R, BaseException]]]],
+        window: float = 0.002,
+        max_batch: int = 256,
+    ):
+        if window < 0 or max_batch < 1:
+            raise ValueError("window must be >= 0 and max_batch must be >= 1.")
+        self.run_batch = run_batch
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: List[Tuple[T, "asyncio.Future[R]", float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._stats = MicroBatchStats()
+
+    async def submit(self, item: T) -> R:
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[R]" = loop.create_future()
+        self._pending.append((item, future, loop.time()))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)  # Keeps the task referenced until it is done
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[T, "asyncio.Future[R]", float]]) -> None:
+        stats = self._stats
+        started = asyncio.get_running_loop().time()
+        for _, _, queued in batch:
+            waited = started - queued
+            stats.wait_seconds_total += waited
+            stats.wait_seconds_max = max(stats.wait_seconds_max, waited)
+        stats.items += len(batch)
+        stats.batches += 1
+        try:
+            results = await self.run_batch([item for item, _, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"run_batch returned {len(results)} results for {len(batch)} items."
+                )
+        except Exception as exc:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future, _), result in zip(batch, results, strict=True):
+            if future.done():  # The caller was cancelled
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, float]:
+        stats = self._stats
+        return {
+            **asdict(stats),
+            "mean_batch_size": stats.items / stats.batches if stats.batches else 0.0,
+            "wait_seconds_mean": (
+                stats.wait_seconds_total / stats.items if stats.items else 0.0
+            ),
+        }
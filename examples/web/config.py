@@ -1,3 +1,6 @@
+from typing import Dict
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
 
@@ -10,11 +13,84 @@ class Settings(BaseSettings):
     )
     DEBUG: bool = False
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # "text" or "json" (one JSON object per line)
+    # Hand records to a background thread instead of writing them inline
+    LOG_ASYNC: bool = False
+    # Fraction of per-request INFO/DEBUG logs to keep (warnings always pass)
+    LOG_REQUEST_SAMPLE_RATE: float = 1.0
 
     # FastAPI server settings (if running directly, Docker CMD overrides these for container)
     APP_HOST: str = "0.0.0.0"  # nosec B104 # Allows binding to all interfaces, common for Docker
     APP_PORT: int = 8000
 
+    # Pre-forking server (python -m examples.web.server): worker processes and
+    # when to recycle them. A worker restarts after SERVER_MAX_REQUESTS (plus
+    # a random 0..SERVER_MAX_REQUESTS_JITTER) requests or once its private
+    # memory (excluding pages shared with the parent) exceeds
+    # SERVER_MAX_MEMORY_MB; None disables either limit.
+    SERVER_WORKERS: int = 1
+    SERVER_MAX_REQUESTS: Optional[int] = None
+    SERVER_MAX_REQUESTS_JITTER: int = 0
+    SERVER_MAX_MEMORY_MB: Optional[float] = None
+    SERVER_BACKLOG: int = 2048
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+
+    # Validation rules for DataHandler (a JSON file, see
+    # your_core_library.rules); the file is checked for changes every
+    # RULES_RELOAD_SECONDS and reloaded without a restart
+    RULES_FILE: Optional[str] = None
+    RULES_RELOAD_SECONDS: float = 1.0
+
+    # Batch processing: records handed to DataHandler.process_batch per call.
+    # NDJSON lines longer than PROCESS_BATCH_MAX_LINE_BYTES become error records.
+    PROCESS_BATCH_CHUNK_SIZE: int = 1024
+    PROCESS_BATCH_MAX_LINE_BYTES: int = 1024 * 1024
+
+    # Worker pool for CPU-bound DataHandler work ("thread" or "process").
+    # Requests beyond EXECUTOR_MAX_WORKERS + EXECUTOR_MAX_QUEUE get a 503.
+    EXECUTOR_MODE: str = "thread"
+    EXECUTOR_MAX_WORKERS: int = 4
+    EXECUTOR_MAX_QUEUE: int = 64
+
+    # Request coalescing for /process/: concurrent requests with the same
+    # payload share one computation. With COALESCE_BATCH_WINDOW_MS > 0 (1-5 ms
+    # is typical), requests arriving within the window are processed by one
+    # DataHandler.process_batch call of up to COALESCE_MAX_BATCH items.
+    COALESCE_ENABLED: bool = False
+    COALESCE_BATCH_WINDOW_MS: float = 0.0
+    COALESCE_MAX_BATCH: int = 256
+
+    # Opt-in memoization of /process/ results (policy: "lru" or "tinylfu")
+    PROCESS_CACHE_ENABLED: bool = False
+    PROCESS_CACHE_MAX_ENTRIES: int = 10_000
+    PROCESS_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    PROCESS_CACHE_POLICY: str = "lru"
+    PROCESS_CACHE_TTL_SECONDS: Optional[float] = None
+    PROCESS_CACHE_ERRORS: bool = True  # Also cache rejected (ValueError) inputs
+
+    # Render JSON with orjson (the 'perf' extra; compact stdlib JSON without
+    # it), and skip response_model re-validation on the hot routes
+    FAST_JSON: bool = False
+
+    # Whole-response cache with ETag/304 support for idempotent GET routes.
+    # TTLs are per path; a path ending in "/" covers every path below it.
+    # RESPONSE_CACHE_KEY is "path_query" (the query string is part of the key)
+    # or "path".
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_TTLS: Dict[str, float] = {
+        "/items/": 60.0,
+        "/core_greet": 300.0,
+        "/health": 1.0,
+    }
+    RESPONSE_CACHE_KEY: str = "path_query"
+    RESPONSE_CACHE_MAX_ENTRIES: int = 10_000
+    RESPONSE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+    # Prometheus metrics at /metrics (also enabled by YOUR_CORE_LIBRARY_METRICS=1)
+    METRICS_ENABLED: bool = False
+    # On-demand profiling at /debug/profile; keep off in production
+    PROFILING_ENABLED: bool = False
+
     # Example of a more specific setting
     # CORE_LIBRARY_API_KEY: str = None
 
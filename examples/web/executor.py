@@ -0,0 +1,117 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Tuple
+from typing import TypeVar
+
+T = TypeVar("T")
+
+EXECUTOR_MODES = ("thread", "process")
+
+
+class ExecutorBusyError(RuntimeError):
+    """Raised when the executor's queue is full and the work is rejected."""
+
+
+@dataclass
+class ExecutorStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    queue_depth: int = 0
+    execution_seconds_total: float = 0.0
+    execution_seconds_max: float = 0.0
+    wait_seconds_total: float = 0.0
+
+
+def _timed_call(func: Callable[..., T], *args: Any) -> Tuple[T, float]:
+    # Runs inside the worker, so the elapsed time excludes time spent queued.
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+class WorkExecutor:
+    """Runs blocking work off the event loop on a thread or process pool.
+
+    At most ``max_workers`` calls run at once and at most ``max_queue`` more
+    wait for a worker; beyond that, ``run`` raises ``ExecutorBusyError`` so the
+    caller can shed load instead of piling up requests.
+    """
+
+    def __init__(self, mode: str = "thread", max_workers: int = 4, max_queue: int = 64):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(
+                f"Executor mode must be one of {EXECUTOR_MODES}, got {mode!r}."
+            )
+        if max_workers < 1 or max_queue < 0:
+            raise ValueError("max_workers must be >= 1 and max_queue must be >= 0.")
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool: Executor
+        if mode == "process":
+            self._pool = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="work-executor"
+            )
+        self._slots = asyncio.Semaphore(max_workers + max_queue)
+        self._stats = ExecutorStats()
+
+    @property
+    def saturated(self) -> bool:
+        return self._slots.locked()
+
+    async def run(self, func: Callable[..., T], *args: Any, wait: bool = False) -> T:
+        """Runs ``func(*args)`` in the pool and returns its result.
+
+        With ``wait=True`` the call waits for a free slot instead of being
+        rejected, for callers such as a response stream that cannot fail midway.
+        In process mode, ``func`` and ``args`` must be picklable.
+        """
+        stats = self._stats
+        if not wait and self.saturated:
+            stats.rejected += 1
+            raise ExecutorBusyError("Work queue is full, try again later.")
+        async with self._slots:
+            stats.submitted += 1
+            stats.in_flight += 1
+            submitted_at = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            try:
+                result, elapsed = await loop.run_in_executor(
+                    self._pool, partial(_timed_call, func, *args)
+                )
+            except BaseException:
+                stats.failed += 1
+                raise
+            finally:
+                stats.in_flight -= 1
+            stats.completed += 1
+            stats.execution_seconds_total += elapsed
+            stats.execution_seconds_max = max(stats.execution_seconds_max, elapsed)
+            stats.wait_seconds_total += time.perf_counter() - submitted_at - elapsed
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        self._stats.queue_depth = max(0, self._stats.in_flight - self.max_workers)
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            **asdict(self._stats),
+        }
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
@@ -1,25 +1,107 @@
+import json
 import logging
 import sys
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from queue import SimpleQueue
+from typing import Optional
 
+LOG_FORMATS = ("text", "json")
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+# High-volume per-request messages are logged here so they can be sampled.
+REQUEST_LOGGER_NAME = "examples.web.main.requests"
 
-def init_logging(log_level: str):
-    """Initializes basic logging configuration."""
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+class SamplingFilter(logging.Filter):
+    """Passes about ``rate`` of the records below WARNING, evenly spaced.
+
+    Warnings and errors always pass.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        if not 0 <= rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1.")
+        self.rate = rate
+        self._credit = 0.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        self._credit += self.rate
+        if self._credit >= 1:
+            self._credit -= 1
+            return True
+        return False
+
+
+def init_logging(
+    log_level: str,
+    log_format: str = "text",
+    async_mode: bool = False,
+    request_sample_rate: float = 1.0,
+) -> Optional[QueueListener]:
+    """Initializes logging configuration.
+
+    With ``async_mode`` callers only put records on a queue and a background
+    thread formats and writes them, so slow stdout writes never block the event
+    loop. The returned listener must then be stopped on shutdown to flush the
+    queue. ``request_sample_rate`` keeps that fraction of the request logs.
+    """
+    if log_format not in LOG_FORMATS:
+        raise ValueError(
+            f"Log format must be one of {LOG_FORMATS}, got {log_format!r}."
+        )
     # Determine the logging level
     level = getattr(logging, log_level.upper(), logging.INFO)
 
-    # Basic configuration
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%dT%H:%M:%S%z",
-        handlers=[
-            logging.StreamHandler(
-                sys.stdout
-            )  # Ensure logs go to stdout for container visibility
-        ],
-        force=True,
-    )
+    # Ensure logs go to stdout for container visibility
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if log_format == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(TEXT_FORMAT, DATE_FORMAT))
+
+    listener = None
+    handler: logging.Handler = stream_handler
+    if async_mode:
+        log_queue: "SimpleQueue[logging.LogRecord]" = SimpleQueue()
+        handler = QueueHandler(log_queue)
+        # Only merge msg and args here; the listener applies the real format.
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        listener.start()
+
+    logging.basicConfig(level=level, handlers=[handler], force=True)
+
+    request_logger = logging.getLogger(REQUEST_LOGGER_NAME)
+    for old_filter in request_logger.filters[:]:
+        if isinstance(old_filter, SamplingFilter):
+            request_logger.removeFilter(old_filter)
+    if request_sample_rate < 1:
+        request_logger.addFilter(SamplingFilter(request_sample_rate))
 
-    # You can add more handlers here, e.g., for file logging or structured logging
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging initialized with level: {log_level.upper()}")
+    logger.info(
+        "Logging initialized with level: %s (format: %s, async: %s)",
+        log_level.upper(),
+        log_format,
+        async_mode,
+    )
+    return listener
@@ -1,20 +1,60 @@
 # Placeholder for your main application logic or FastAPI app
 
+import asyncio
+import json
 import logging
 from contextlib import asynccontextmanager
+from dataclasses import asdict
+from functools import partial
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
 from fastapi import FastAPI
 from fastapi import HTTPException
+from fastapi import Query
 from fastapi import Request
+from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
 
+from your_core_library import instrumentation
+from your_core_library.cache import CachedDataHandler
+from your_core_library.cache import ResultCache
 from your_core_library.data_handler import DataHandler
 from your_core_library.data_handler import get_core_greeting
 
+from .coalesce import MicroBatcher
+from .coalesce import SingleFlight
+from .config import Settings
 from .config import settings
+from .executor import ExecutorBusyError
+from .executor import WorkExecutor
+from .logging_config import REQUEST_LOGGER_NAME
 from .logging_config import init_logging
+from .response_cache import ResponseCache
+from .response_cache import ResponseCacheMiddleware
+from .responses import FastJSONResponse
 
 logger = logging.getLogger(__name__)
+request_logger = logging.getLogger(REQUEST_LOGGER_NAME)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PROFILE_MODES = ("sample", "cprofile")
+INVALID_RECORD_MESSAGE = "Record must be a JSON object with a string 'data' field."
+
+# A batch record is (index, data, error): exactly one of data/error is set.
+BatchRecord = Tuple[int, Optional[str], Optional[str]]
 
 
 # Define Pydantic models here if they are specific to the app
@@ -22,25 +62,109 @@ class ExamplePayload(BaseModel):
     data: str
 
 
+def build_data_handler(config: Settings = settings) -> DataHandler:
+    """A DataHandler checking input against ``RULES_FILE``, if one is set."""
+    if config.RULES_FILE is None:
+        return DataHandler()
+    from your_core_library.rules import RuleFile
+
+    rules = RuleFile(config.RULES_FILE, check_interval=config.RULES_RELOAD_SECONDS)
+    logger.info("Loaded %d validation rule(s) from %s.", len(rules.current), rules.path)
+    return DataHandler(rules=rules)
+
+
 # Lifespan context manager for startup and shutdown events
 @asynccontextmanager
 async def lifespan(app_instance: FastAPI):
     # Startup logic
-    init_logging(settings.LOG_LEVEL)
+    log_listener = init_logging(
+        settings.LOG_LEVEL,
+        log_format=settings.LOG_FORMAT,
+        async_mode=settings.LOG_ASYNC,
+        request_sample_rate=settings.LOG_REQUEST_SAMPLE_RATE,
+    )
     logger.info("Application startup sequence started.")
-    logger.info(f"Application Name: {settings.APP_NAME}")
-    logger.info(f"Application Version: {settings.APP_VERSION}")
-    logger.info(f"Log Level: {settings.LOG_LEVEL}")
+    logger.info("Application Name: %s", settings.APP_NAME)
+    logger.info("Application Version: %s", settings.APP_VERSION)
+    logger.info("Log Level: %s", settings.LOG_LEVEL)
+    if settings.METRICS_ENABLED:
+        instrumentation.enable()
+        logger.info("Core library instrumentation enabled.")
 
-    # Initialize DataHandler and make it available via app.state
-    app_instance.state.data_handler = DataHandler()
-    logger.info("DataHandler initialized and attached to app state.")
+    # Initialize DataHandler and make it available via app.state, unless the
+    # pre-forking server already built one in the parent process.
+    owns_data_handler = getattr(app_instance.state, "data_handler", None) is None
+    if owns_data_handler:
+        app_instance.state.data_handler = build_data_handler()
+        logger.info("DataHandler initialized and attached to app state.")
+    app_instance.state.process_cache = None
+    if settings.PROCESS_CACHE_ENABLED:
+        app_instance.state.process_cache = CachedDataHandler(
+            app_instance.state.data_handler,
+            ResultCache(
+                max_entries=settings.PROCESS_CACHE_MAX_ENTRIES,
+                max_bytes=settings.PROCESS_CACHE_MAX_BYTES,
+                policy=settings.PROCESS_CACHE_POLICY,
+                ttl=settings.PROCESS_CACHE_TTL_SECONDS,
+            ),
+            cache_errors=settings.PROCESS_CACHE_ERRORS,
+        )
+        logger.info(
+            "Process result cache enabled (%s policy).", settings.PROCESS_CACHE_POLICY
+        )
+    app_instance.state.response_cache = None
+    if settings.RESPONSE_CACHE_ENABLED:
+        app_instance.state.response_cache = ResponseCache(
+            ResultCache(
+                max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+                max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+            ),
+            settings.RESPONSE_CACHE_TTLS,
+            key=settings.RESPONSE_CACHE_KEY,
+        )
+        logger.info(
+            "Response cache enabled for %s.", ", ".join(settings.RESPONSE_CACHE_TTLS)
+        )
+    app_instance.state.executor = WorkExecutor(
+        mode=settings.EXECUTOR_MODE,
+        max_workers=settings.EXECUTOR_MAX_WORKERS,
+        max_queue=settings.EXECUTOR_MAX_QUEUE,
+    )
+    logger.info(
+        "Work executor started in %s mode with %d worker(s).",
+        settings.EXECUTOR_MODE,
+        settings.EXECUTOR_MAX_WORKERS,
+    )
+    app_instance.state.single_flight = None
+    if settings.COALESCE_ENABLED:
+        app_instance.state.single_flight = SingleFlight()
+        logger.info("Request coalescing enabled for /process/.")
+    app_instance.state.process_batcher = None
+    if settings.COALESCE_BATCH_WINDOW_MS > 0:
+        app_instance.state.process_batcher = MicroBatcher(
+            partial(
+                _process_many,
+                app_instance.state.executor,
+                app_instance.state.data_handler,
+            ),
+            window=settings.COALESCE_BATCH_WINDOW_MS / 1000,
+            max_batch=settings.COALESCE_MAX_BATCH,
+        )
+        logger.info(
+            "Micro-batching /process/ over %.1f ms windows.",
+            settings.COALESCE_BATCH_WINDOW_MS,
+        )
     logger.info("Application startup sequence complete.")
     yield
     # Shutdown logic (if any)
     logger.info("Application shutdown sequence started.")
+    app_instance.state.executor.shutdown()
+    if owns_data_handler:  # A later startup builds it from the settings again
+        del app_instance.state.data_handler
     # Clean up resources, e.g., app.state.data_handler.close_connections()
     logger.info("Application shutdown sequence complete.")
+    if log_listener is not None:
+        log_listener.stop()  # Flushes queued records
 
 
 # Initialize FastAPI app with lifespan context manager
@@ -49,27 +173,88 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="A template for Python FastAPI projects with a core library.",
     lifespan=lifespan,  # Use the lifespan manager
+    default_response_class=FastJSONResponse if settings.FAST_JSON else JSONResponse,
 )
+# A pass-through unless the lifespan enabled the response cache
+app.add_middleware(ResponseCacheMiddleware)
+
+
+def _json(content: Dict[str, Any]) -> Any:
+    """Returns ``content`` as a ready-made response in fast JSON mode.
+
+    FastAPI then skips the response_model validation and jsonable_encoder
+    round trip, so only use it for content that is already plain JSON.
+    """
+    if settings.FAST_JSON:
+        return FastJSONResponse(content)
+    return content
 
 
 @app.get("/", tags=["General"])
 async def read_root():
-    logger.info("Root endpoint was called.")
+    request_logger.info("Root endpoint was called.")
     return {
         "message": "Hello from FastAPI app! Use /core_greet for core library greeting."
     }
 
 
+async def _process_many(
+    executor: WorkExecutor, data_handler: DataHandler, items: List[str]
+) -> List[Union[str, ValueError]]:
+    """Processes a micro-batch, with a ValueError for each rejected item."""
+    batch = await executor.run(data_handler.process_batch, items)
+    return [
+        ValueError(error) if result is None else result
+        for result, error in zip(batch.results, batch.errors, strict=True)
+    ]
+
+
+async def _compute(app_state: Any, data: str) -> str:
+    process_batcher: Optional[MicroBatcher[str, str]] = getattr(
+        app_state, "process_batcher", None
+    )
+    if process_batcher is not None:
+        return await process_batcher.submit(data)
+    return await app_state.executor.run(app_state.data_handler.process, data)
+
+
+async def _process_one(app_state: Any, data: str) -> str:
+    # The cache is consulted on the event loop so that it also works when the
+    # executor runs the handler in other processes.
+    process_cache: Optional[CachedDataHandler] = app_state.process_cache
+    if process_cache is not None:
+        result = process_cache.lookup(data)
+        if result is not None:
+            return result
+    single_flight: Optional[SingleFlight] = getattr(app_state, "single_flight", None)
+    try:
+        if single_flight is not None:
+            result = await single_flight.run(data, partial(_compute, app_state, data))
+        else:
+            result = await _compute(app_state, data)
+    except ValueError as e:
+        if process_cache is not None:
+            process_cache.remember_error(data, e)
+        raise
+    if process_cache is not None:
+        process_cache.remember(data, result)
+    return result
+
+
 @app.post("/process/", tags=["Processing"], response_model=ExamplePayload)
 async def process_data(request: Request, payload: ExamplePayload):
     """
     Processes data using the core library's DataHandler.
     """
     try:
-        # Access app.state.data_handler via the request object
-        data_handler_from_state = request.app.state.data_handler
-        result = data_handler_from_state.process(payload.data)
-        return {"data": result}
+        # The handler, executor and caches live on app.state (see lifespan)
+        result = await _process_one(request.app.state, payload.data)
+        return _json({"data": result})
+    except ExecutorBusyError as e:
+        logger.warning("Rejected processing request: %s", e)
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "1"}
+        ) from e
     except AttributeError:  # Should not happen if lifespan is correct
         logger.error(
             "Critical: data_handler not found on app.state. Check lifespan initialization."
@@ -79,37 +264,342 @@ async def process_data(request: Request, payload: ExamplePayload):
             detail="Internal server error: Core processing component not available.",
         ) from None
     except ValueError as e:
-        logger.warning(f"ValueError during data processing: {e}")
+        logger.warning("ValueError during data processing: %s", e)
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+class FullDuplexStreamingResponse(StreamingResponse):
+    """A StreamingResponse whose body may still be reading the request.
+
+    StreamingResponse normally consumes ``receive()`` in a background task to
+    watch for disconnects, which steals body chunks from a generator that is
+    still reading the request. Here a disconnect instead surfaces as
+    ``ClientDisconnect`` from ``request.stream()``.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def _parse_record(index: int, record: Any) -> BatchRecord:
+    if isinstance(record, dict) and isinstance(record.get("data"), str):
+        return index, record["data"], None
+    return index, None, INVALID_RECORD_MESSAGE
+
+
+def _parse_ndjson_line(index: int, line: Union[bytes, bytearray]) -> BatchRecord:
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return index, None, "Invalid JSON."
+    return _parse_record(index, record)
+
+
+async def _iter_ndjson_records(
+    request: Request, max_line_bytes: int
+) -> AsyncIterator[BatchRecord]:
+    """Parses an NDJSON request body incrementally, one line at a time.
+
+    Only the unfinished last line is buffered, and each byte is scanned for a
+    newline once. A line longer than ``max_line_bytes`` is skipped (without
+    being buffered) and reported as an error record.
+    """
+    too_long = f"Line is longer than {max_line_bytes} bytes."
+    index = 0
+    partial = bytearray()
+    overlong = False  # The current line is already too long to keep
+    async for chunk in request.stream():
+        view = memoryview(chunk)
+        start = 0
+        while (newline := chunk.find(b"\n", start)) != -1:
+            if not overlong:
+                partial += view[start:newline]
+            if overlong or len(partial) > max_line_bytes:
+                yield index, None, too_long
+                index += 1
+            elif partial.strip():
+                yield _parse_ndjson_line(index, partial)
+                index += 1
+            overlong = False
+            partial.clear()
+            start = newline + 1
+        if not overlong:
+            partial += view[start:]
+            if len(partial) > max_line_bytes:
+                overlong = True
+                partial.clear()
+    if overlong:
+        yield index, None, too_long
+    elif partial.strip():
+        yield _parse_ndjson_line(index, partial)
+
+
+async def _read_json_array_records(request: Request) -> List[BatchRecord]:
+    try:
+        records = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body.") from None
+    if not isinstance(records, list):
+        raise HTTPException(
+            status_code=400, detail="Request body must be a JSON array of records."
+        )
+    return [_parse_record(index, record) for index, record in enumerate(records)]
+
+
+async def _iter_records(records: Iterable[BatchRecord]) -> AsyncIterator[BatchRecord]:
+    for record in records:
+        yield record
+
+
+def _process_chunk(data_handler: DataHandler, chunk: List[BatchRecord]) -> bytes:
+    """Processes one chunk of records and encodes the results as NDJSON lines."""
+    batch = data_handler.process_batch(
+        [data for _, data, _ in chunk if data is not None]
+    )
+    outcomes = zip(batch.results, batch.errors, strict=True)
+    lines = []
+    for index, data, error in chunk:
+        result = None
+        if data is not None:
+            result, error = next(outcomes)
+        line: Dict[str, Any] = {"index": index}
+        if error is None:
+            line["data"] = result
+        else:
+            line["error"] = error
+        lines.append(json.dumps(line))
+    return ("\n".join(lines) + "\n").encode()
+
+
+async def _stream_batch_results(
+    executor: WorkExecutor,
+    data_handler: DataHandler,
+    records: AsyncIterator[BatchRecord],
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    # Once the response has started it can no longer become a 503, so chunks
+    # wait for a free executor slot instead of being rejected.
+    chunk: List[BatchRecord] = []
+    async for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield await executor.run(_process_chunk, data_handler, chunk, wait=True)
+            chunk = []
+    if chunk:
+        yield await executor.run(_process_chunk, data_handler, chunk, wait=True)
+
+
+@app.post("/process/batch", tags=["Processing"])
+async def process_data_batch(request: Request):
+    """
+    Processes many records in one request and streams NDJSON results back.
+
+    The body is either a JSON array of `{"data": ...}` objects or, with an
+    `application/x-ndjson` content type, one such object per line. Records are
+    processed in chunks off the event loop; each output line carries the record
+    `index` and either its `data` or an `error`.
+    """
+    executor = request.app.state.executor
+    if executor.saturated:
+        raise HTTPException(
+            status_code=503,
+            detail="Work queue is full, try again later.",
+            headers={"Retry-After": "1"},
+        )
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith(NDJSON_MEDIA_TYPE):
+        records = _iter_ndjson_records(request, settings.PROCESS_BATCH_MAX_LINE_BYTES)
+    else:
+        # A JSON array has to be parsed as a whole; use NDJSON for large uploads.
+        records = _iter_records(await _read_json_array_records(request))
+    return FullDuplexStreamingResponse(
+        _stream_batch_results(
+            executor,
+            request.app.state.data_handler,
+            records,
+            settings.PROCESS_BATCH_CHUNK_SIZE,
+        ),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
 @app.get("/items/{item_id}", tags=["Items"])
 async def read_item(item_id: int):
-    logger.info(f"Item endpoint called with item_id: {item_id}")
+    request_logger.info("Item endpoint called with item_id: %s", item_id)
     # In a real app, you'd fetch item details from a database or other source
-    return {
-        "item_id": item_id,
-        "name": "Sample Item",  # Placeholder name
-        "owner": "testuser",  # Placeholder owner
-    }
+    return _json(
+        {
+            "item_id": item_id,
+            "name": "Sample Item",  # Placeholder name
+            "owner": "testuser",  # Placeholder owner
+        }
+    )
 
 
 @app.get("/health", tags=["Health"])
 async def health_check():
-    logger.debug("Health check endpoint was called.")
-    return {
-        "status": "ok",
-        "app_name": settings.APP_NAME,
-        "app_version": settings.APP_VERSION,
-    }
+    request_logger.debug("Health check endpoint was called.")
+    return _json(
+        {
+            "status": "ok",
+            "app_name": settings.APP_NAME,
+            "app_version": settings.APP_VERSION,
+        }
+    )
+
+
+@app.get("/executor/stats", tags=["Health"])
+async def executor_stats(request: Request):
+    """Reports work executor queue depth, throughput and execution times."""
+    return request.app.state.executor.stats()
+
+
+@app.get("/cache/stats", tags=["Health"])
+async def cache_stats(request: Request):
+    """Reports hit/miss/eviction counters of the process result cache."""
+    process_cache = request.app.state.process_cache
+    if process_cache is None:
+        return {"enabled": False}
+    stats = process_cache.cache.stats()
+    return {"enabled": True, "hit_ratio": stats.hit_ratio, **asdict(stats)}
+
+
+# Statistics that only ever grow, exported as Prometheus counters; every
+# other numeric value of the same component is a point-in-time gauge.
+APP_COUNTERS = {
+    "executor": (
+        "submitted",
+        "completed",
+        "failed",
+        "rejected",
+        "execution_seconds_total",
+        "wait_seconds_total",
+    ),
+    "process_cache": ("hits", "misses", "evictions", "expirations", "rejections"),
+    "coalesce": ("calls", "coalesced"),
+    "microbatch": ("items", "batches", "wait_seconds_total"),
+    "rules": ("reloads",),
+    "response_cache": (
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "not_modified",
+        "bypassed",
+    ),
+}
+
+
+def _app_stats(app_state: Any) -> Dict[str, Dict[str, Any]]:
+    stats: Dict[str, Dict[str, Any]] = {"executor": app_state.executor.stats()}
+    if app_state.process_cache is not None:
+        cache_stats = app_state.process_cache.cache.stats()
+        stats["process_cache"] = asdict(cache_stats)
+        stats["process_cache"]["hit_ratio"] = cache_stats.hit_ratio
+    for prefix, coalescer in (
+        ("coalesce", getattr(app_state, "single_flight", None)),
+        ("microbatch", getattr(app_state, "process_batcher", None)),
+    ):
+        if coalescer is not None:
+            stats[prefix] = coalescer.stats()
+    rules = getattr(app_state.data_handler, "rules", None)
+    if rules is not None:
+        stats["rules"] = {
+            "loaded": len(rules.current),
+            "reloads": getattr(rules, "reloads", 0),
+        }
+    response_cache = getattr(app_state, "response_cache", None)
+    if response_cache is not None:
+        stats["response_cache"] = response_cache.stats()
+    return stats
+
+
+def _app_counters(app_state: Any) -> Dict[str, float]:
+    counters: Dict[str, float] = {}
+    for prefix, stats in _app_stats(app_state).items():
+        for key in APP_COUNTERS.get(prefix, ()):
+            counters[f"{prefix}_{key}"] = stats[key]
+    return counters
+
+
+def _app_gauges(app_state: Any) -> Dict[str, float]:
+    gauges: Dict[str, float] = {}
+    for prefix, stats in _app_stats(app_state).items():
+        for key, value in stats.items():
+            if isinstance(value, (int, float)) and key not in APP_COUNTERS[prefix]:
+                gauges[f"{prefix}_{key}"] = value
+    return gauges
+
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics(request: Request):
+    """Exports core library timers plus executor and cache gauges for Prometheus."""
+    return PlainTextResponse(
+        instrumentation.render_prometheus(
+            _app_gauges(request.app.state), _app_counters(request.app.state)
+        ),
+        media_type=PROMETHEUS_MEDIA_TYPE,
+    )
+
+
+_profile_lock = asyncio.Lock()
+
+
+@app.get("/debug/profile", tags=["Health"], response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(5.0, gt=0, le=60),
+    mode: str = "sample",
+    interval_ms: float = Query(5.0, gt=0),
+):
+    """
+    Profiles the running app for `seconds` and returns the result as text.
+
+    `sample` mode samples the stacks of all threads (executor workers included)
+    and returns folded stacks for flame graph tools; `cprofile` mode runs
+    cProfile on the event loop thread and returns the top functions by
+    cumulative time. Requires `PROFILING_ENABLED`.
+    """
+    if not settings.PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiling is disabled.")
+    if mode not in PROFILE_MODES:
+        raise HTTPException(
+            status_code=400, detail=f"Profile mode must be one of {PROFILE_MODES}."
+        )
+    if _profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profile is already running.")
+    async with _profile_lock:
+        logger.info("Profiling for %ss in %s mode.", seconds, mode)
+        if mode == "sample":
+            sampler = instrumentation.SamplingProfiler(interval_ms / 1000).start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                sampler.stop()
+            return PlainTextResponse(sampler.collapsed())
+
+        import cProfile
+        import io
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(50)
+        return PlainTextResponse(output.getvalue())
 
 
 @app.get("/core_greet")
 async def core_greeting_endpoint(name: str = "App User"):
-    logger.info(f"Core greeting endpoint called with name: {name}")
+    request_logger.info("Core greeting endpoint called with name: %s", name)
     core_msg = get_core_greeting(name)
-    logger.debug(f"Core library returned: {core_msg}")
-    return {"core_message": core_msg}
+    request_logger.debug("Core library returned: %s", core_msg)
+    return _json({"core_message": core_msg})
 
 
 # For now, a simple function to demonstrate app layer, independent of core logic for now
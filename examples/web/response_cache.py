@@ -0,0 +1,224 @@
+import hashlib
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from your_core_library.cache import ResultCache
+
+CACHE_KEY_MODES = ("path", "path_query")
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+
+class CachedResponse:
+    __slots__ = ("status", "headers", "body", "etag")
+
+    def __init__(self, status: int, headers: RawHeaders, body: bytes, etag: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers) + 64
+
+
+class ResponseCache:
+    """Per-route TTLs and counters around a ResultCache of whole responses.
+
+    ``ttls`` maps a path to its TTL in seconds; a path ending in ``/`` covers
+    every path below it (``"/items/"`` matches ``/items/42``). With
+    ``key="path_query"`` the normalized query string is part of the key,
+    with ``key="path"`` it is ignored.
+    """
+
+    def __init__(
+        self,
+        cache: ResultCache,
+        ttls: Mapping[str, float],
+        key: str = "path_query",
+    ):
+        if key not in CACHE_KEY_MODES:
+            raise ValueError(
+                f"Response cache key must be one of {CACHE_KEY_MODES}, got {key!r}."
+            )
+        self.cache = cache
+        self.key = key
+        self._exact = {
+            path: ttl for path, ttl in ttls.items() if not path.endswith("/")
+        }
+        # Longest prefix first, so the most specific route wins.
+        self._prefixes = sorted(
+            ((path, ttl) for path, ttl in ttls.items() if path.endswith("/")),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self.not_modified = 0
+        self.bypassed = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        ttl = self._exact.get(path)
+        if ttl is not None:
+            return ttl
+        for prefix, prefix_ttl in self._prefixes:
+            if path.startswith(prefix):
+                return prefix_ttl
+        return None
+
+    def key_for(self, scope: Scope) -> str:
+        path = scope["path"]
+        if self.key == "path" or not scope["query_string"]:
+            return path
+        query = parse_qsl(scope["query_string"].decode("latin-1"), True)
+        return f"{path}?{urlencode(sorted(query))}"
+
+    def stats(self) -> Dict[str, float]:
+        stats = self.cache.stats()
+        return {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "hit_ratio": stats.hit_ratio,
+            "evictions": stats.evictions,
+            "expirations": stats.expirations,
+            "entries": stats.entries,
+            "bytes": stats.bytes,
+            "not_modified": self.not_modified,
+            "bypassed": self.bypassed,
+        }
+
+
+def _etag_matches(if_none_match: str, etag: bytes) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    tag = etag.decode("latin-1")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.removeprefix("W/") == tag:  # Weak comparison, per RFC 9110
+            return True
+    return False
+
+
+class ResponseCacheMiddleware:
+    """Serves idempotent GET/HEAD responses from an in-process cache.
+
+    The cache is read from ``app.state.response_cache`` on every request, so
+    the app's lifespan decides whether it is enabled (None turns the
+    middleware into a pass-through). Only successful responses without
+    ``Set-Cookie`` are stored. Every cached response carries an ``ETag``; a
+    request whose ``If-None-Match`` matches gets a bodiless 304. Requests
+    with ``Cache-Control: no-cache`` skip the lookup but refresh the entry.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in CACHEABLE_METHODS:
+            await self.app(scope, receive, send)
+            return
+        response_cache: Optional[ResponseCache] = getattr(
+            scope["app"].state, "response_cache", None
+        )
+        ttl = response_cache.ttl_for(scope["path"]) if response_cache else None
+        if response_cache is None or ttl is None:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        key = response_cache.key_for(scope)
+        cached: Optional[CachedResponse] = None
+        if "no-cache" in request_headers.get("cache-control", ""):
+            response_cache.bypassed += 1
+        else:
+            cached = response_cache.cache.get(key)
+        if cached is None:
+            cached = await self._fetch(scope, receive, send, ttl)
+            if cached is None:  # Already sent as is
+                return
+            response_cache.cache.put(key, cached, size=cached.size, ttl=ttl)
+            hit = b"MISS"
+        else:
+            hit = b"HIT"
+
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None and _etag_matches(if_none_match, cached.etag):
+            response_cache.not_modified += 1
+            headers = [
+                (name, value)
+                for name, value in cached.headers
+                if name in (b"etag", b"cache-control")
+            ]
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [*headers, (b"x-cache", hit)],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send(
+            {
+                "type": "http.response.start",
+                "status": cached.status,
+                "headers": [*cached.headers, (b"x-cache", hit)],
+            }
+        )
+        body = b"" if scope["method"] == "HEAD" else cached.body
+        await send({"type": "http.response.body", "body": body})
+
+    async def _fetch(
+        self, scope: Scope, receive: Receive, send: Send, ttl: float
+    ) -> Optional[CachedResponse]:
+        """Runs the app and buffers its response.
+
+        Returns None if the response was not cacheable and has already been
+        passed through to the client.
+        """
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        passthrough = False
+
+        async def capture(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if message["status"] != 200 or "set-cookie" in headers:
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+            elif passthrough:
+                await send(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        if passthrough or start is None:
+            return None
+        body = b"".join(chunks)
+        etag = b'"' + hashlib.blake2b(body, digest_size=8).hexdigest().encode() + b'"'
+        headers: RawHeaders = [
+            (name, value)
+            for name, value in start["headers"]
+            if name not in (b"etag", b"cache-control", b"content-length")
+        ]
+        headers += [
+            (b"content-length", str(len(body)).encode()),
+            (b"etag", etag),
+            (b"cache-control", f"max-age={int(ttl)}".encode()),
+        ]
+        return CachedResponse(start["status"], headers, body, etag)
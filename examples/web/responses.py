@@ -0,0 +1,37 @@
+import json
+from functools import lru_cache
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+
+@lru_cache(maxsize=None)
+def _orjson() -> Any:
+    """orjson if installed (the 'perf' extra), else None."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def dumps(content: Any) -> bytes:
+    """Compact JSON bytes, with orjson when it is installed."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """A JSONResponse rendered by orjson, or compact stdlib JSON without it.
+
+    Returning one from an endpoint also skips FastAPI's ``response_model``
+    validation and ``jsonable_encoder`` pass, so ``content`` must already
+    be JSON-compatible (dicts, lists, strings, numbers, bools and None).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
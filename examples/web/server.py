@@ -0,0 +1,264 @@
+"""Pre-forking production server for the web example.
+
+The parent process imports the app, builds the expensive shared state once
+(see ``preload``), freezes it out of the garbage collector and then forks
+``SERVER_WORKERS`` uvicorn workers that all accept on one listening socket.
+Forked workers share the parent's memory pages copy-on-write. A worker
+exits gracefully after ``SERVER_MAX_REQUESTS`` requests (plus up to
+``SERVER_MAX_REQUESTS_JITTER``, so workers do not all restart at once) or
+once its private memory (not counting pages still shared with the parent)
+exceeds ``SERVER_MAX_MEMORY_MB``, and the parent
+forks a fresh one in its place.
+
+Run from the project root with:
+    python -m examples.web.server --workers 4
+"""
+
+import argparse
+import gc
+import logging
+import os
+import random
+import signal
+import socket
+import sys
+import time
+from typing import Dict
+from typing import List
+from typing import NoReturn
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI
+
+from your_core_library.data_handler import get_core_greeting
+
+from .config import Settings
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# A worker that dies sooner than this after starting is restarted with a
+# delay, so a crash on startup does not turn into a fork loop.
+MIN_WORKER_LIFETIME = 1.0
+
+
+def private_memory_bytes() -> int:
+    """Memory used by this process alone, in bytes.
+
+    Pages still shared copy-on-write with the parent (the preloaded state)
+    or with other processes are not counted, so a worker is only charged
+    for what it allocated or modified itself.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            private_kb = sum(
+                int(line.split()[1]) for line in f if line.startswith("Private_")
+            )
+        return private_kb * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:  # Older kernels: resident minus file-backed shared pages
+        with open("/proc/self/statm") as f:
+            resident, shared = f.read().split()[1:3]
+        return (int(resident) - int(shared)) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+
+        # Peak resident memory, shared pages included, where /proc is missing;
+        # ru_maxrss is in KiB on Linux, bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RecyclingServer(uvicorn.Server):
+    """A uvicorn server that also exits once its private memory is too large."""
+
+    def __init__(self, config: uvicorn.Config, max_memory_bytes: Optional[int] = None):
+        super().__init__(config)
+        self.max_memory_bytes = max_memory_bytes
+
+    async def on_tick(self, counter: int) -> bool:
+        if await super().on_tick(counter):
+            return True
+        if self.max_memory_bytes is not None and counter % 10 == 0:  # Every second
+            used = private_memory_bytes()
+            if used > self.max_memory_bytes:
+                logger.warning(
+                    "Worker %d uses %.0f MB of private memory, above the %.0f MB "
+                    "limit; recycling.",
+                    os.getpid(),
+                    used / 2**20,
+                    self.max_memory_bytes / 2**20,
+                )
+                return True
+        return False
+
+
+def preload(app: FastAPI, config: Settings = settings) -> None:
+    """Builds state once in the parent so that every worker inherits it.
+
+    The lifespan reuses ``app.state.data_handler`` when it is already set.
+    Freezing moves everything allocated so far out of the collector's
+    generations, so collections in the workers do not touch (and copy) the
+    shared pages.
+    """
+    from .main import build_data_handler
+
+    app.state.data_handler = build_data_handler(config)
+    get_core_greeting()  # Warms the core library's code paths
+    gc.collect()
+    gc.freeze()
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def worker_config(app: FastAPI, config: Settings) -> uvicorn.Config:
+    # The jitter is drawn here, once per worker, rather than passed on as
+    # uvicorn's limit_max_requests_jitter, which older releases lack.
+    max_requests = config.SERVER_MAX_REQUESTS
+    if max_requests is not None and config.SERVER_MAX_REQUESTS_JITTER > 0:
+        max_requests += random.randint(0, config.SERVER_MAX_REQUESTS_JITTER)  # nosec B311
+    return uvicorn.Config(
+        app,
+        lifespan="on",
+        log_level=config.LOG_LEVEL.lower(),
+        limit_max_requests=max_requests,
+        timeout_graceful_shutdown=config.SERVER_GRACEFUL_TIMEOUT,
+    )
+
+
+def _run_worker(app: FastAPI, sock: socket.socket, config: Settings) -> NoReturn:
+    # The parent's supervisor handlers must not run in the worker.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    max_memory = (
+        int(config.SERVER_MAX_MEMORY_MB * 2**20)
+        if config.SERVER_MAX_MEMORY_MB is not None
+        else None
+    )
+    code = 0
+    try:
+        RecyclingServer(worker_config(app, config), max_memory).run(sockets=[sock])
+    except BaseException:
+        logger.exception("Worker %d crashed.", os.getpid())
+        code = 1
+    finally:
+        os._exit(code)  # Never return into the parent's supervisor loop
+
+
+class Supervisor:
+    """Forks the workers and replaces each one that exits until stopped."""
+
+    def __init__(self, app: FastAPI, sock: socket.socket, config: Settings):
+        self.app = app
+        self.sock = sock
+        self.config = config
+        self.workers: Dict[int, float] = {}  # pid -> start time
+        self.stopping = False
+
+    def spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(self.app, self.sock, self.config)
+        self.workers[pid] = time.monotonic()
+        logger.info("Started worker %d.", pid)
+        return pid
+
+    def stop(self, signum: int, frame: object = None) -> None:
+        if self.stopping:
+            return
+        self.stopping = True
+        logger.info("Stopping %d worker(s).", len(self.workers))
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        for _ in range(self.config.SERVER_WORKERS):
+            self.spawn()
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, 0)
+            except ChildProcessError:
+                break
+            started = self.workers.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            logger.info("Worker %d exited with code %d; replacing it.", pid, code)
+            if code != 0 and time.monotonic() - started < MIN_WORKER_LIFETIME:
+                time.sleep(MIN_WORKER_LIFETIME)
+            if not self.stopping:
+                self.spawn()
+
+
+def serve(app: FastAPI, config: Settings = settings) -> None:
+    """Runs ``app`` with ``config.SERVER_WORKERS`` recycled worker processes."""
+    sock = bind_socket(config.APP_HOST, config.APP_PORT, config.SERVER_BACKLOG)
+    logger.info(
+        "Listening on %s:%d with %d worker(s).",
+        config.APP_HOST,
+        config.APP_PORT,
+        config.SERVER_WORKERS,
+    )
+    preload(app, config)
+    try:
+        Supervisor(app, sock, config).run()
+    finally:
+        sock.close()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--host", default=settings.APP_HOST)
+    parser.add_argument("--port", type=int, default=settings.APP_PORT)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS)
+    parser.add_argument(
+        "--max-requests", type=int, default=settings.SERVER_MAX_REQUESTS
+    )
+    parser.add_argument(
+        "--max-memory-mb", type=float, default=settings.SERVER_MAX_MEMORY_MB
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    if not hasattr(os, "fork"):
+        sys.exit("The pre-forking server needs os.fork(); run uvicorn directly.")
+    args = parse_args(argv)
+    if args.workers < 1:
+        sys.exit("--workers must be a positive integer.")
+    config = settings.model_copy(
+        update={
+            "APP_HOST": args.host,
+            "APP_PORT": args.port,
+            "SERVER_WORKERS": args.workers,
+            "SERVER_MAX_REQUESTS": args.max_requests,
+            "SERVER_MAX_MEMORY_MB": args.max_memory_mb,
+        }
+    )
+    # Settings accept any case (e.g. LOG_LEVEL=info in .env.example).
+    level = getattr(logging, config.LOG_LEVEL.upper(), logging.INFO)
+    logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
+    from .main import app
+
+    serve(app, config)
+
+
+if __name__ == "__main__":
+    main()
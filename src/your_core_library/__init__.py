@@ -1,3 +1,38 @@
 # This file makes 'your_core_library' a Python package
 
 __version__ = "0.1.0"  # Corresponds to pyproject.toml version for the core library
+
+# Public names are imported lazily on first access so that `import
+# your_core_library` stays cheap; optional dependencies (e.g. NumPy for
+# RecordBatch) are only needed by the submodules that use them.
+_LAZY_EXPORTS = {
+    "BatchResult": "data_handler",
+    "DataHandler": "data_handler",
+    "ExampleModel": "data_handler",
+    "get_core_greeting": "data_handler",
+    "CachedDataHandler": "cache",
+    "ResultCache": "cache",
+    "Pipeline": "pipeline",
+    "PipelineReport": "pipeline",
+    "RecordBatch": "columnar",
+    "ExampleModelCollection": "models",
+    "FileReport": "fileio",
+    "process_file": "fileio",
+}
+
+__all__ = ["__version__", *_LAZY_EXPORTS]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
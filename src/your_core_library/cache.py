@@ -0,0 +1,283 @@
+# Bounded, thread-safe memoization for DataHandler results
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterator
+from typing import Optional
+
+from your_core_library.data_handler import DataHandler
+
+CACHE_POLICIES = ("lru", "tinylfu")
+
+_MISSING = object()
+
+# Multipliers for deriving the sketch's row indices from a single hash.
+_SKETCH_SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0x27D4EB2F165667C5,
+)
+_MASK_64 = (1 << 64) - 1
+_HALVE = bytes(count >> 1 for count in range(256))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    rejections: int = 0  # Candidates the TinyLFU admission filter turned away
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _FrequencySketch:
+    """Count-min sketch of 4-bit counters that is halved periodically (aging)."""
+
+    def __init__(self, capacity: int):
+        width = 16
+        while width < capacity:
+            width <<= 1
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in _SKETCH_SEEDS]
+        self._sample_size = 10 * width
+        self._additions = 0
+
+    def _indexes(self, key: Hashable) -> Iterator[int]:
+        h = hash(key) & _MASK_64
+        for seed in _SKETCH_SEEDS:
+            yield ((h * seed) & _MASK_64) >> 32 & self._mask
+
+    def increment(self, key: Hashable) -> None:
+        for row, index in zip(self._rows, self._indexes(key), strict=True):
+            if row[index] < 15:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            for row in self._rows:
+                row[:] = row.translate(_HALVE)
+            self._additions //= 2
+
+    def estimate(self, key: Hashable) -> int:
+        return min(
+            row[index]
+            for row, index in zip(self._rows, self._indexes(key), strict=True)
+        )
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float]):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+def estimate_size(key: Any, value: Any) -> int:
+    """Approximate memory held by a cache entry, in bytes."""
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class ResultCache:
+    """A cache bounded by both entry count and total (estimated) bytes.
+
+    ``policy="lru"`` evicts the least recently used entry. ``policy="tinylfu"``
+    additionally keeps a frequency sketch of recent lookups and only admits a
+    new entry if it has been requested more often than the entry it would
+    evict, which protects hot keys from one-off scans. All methods are safe to
+    call from multiple threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        policy: str = "lru",
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if policy not in CACHE_POLICIES:
+            raise ValueError(
+                f"Cache policy must be one of {CACHE_POLICIES}, got {policy!r}."
+            )
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._sketch = _FrequencySketch(max_entries) if policy == "tinylfu" else None
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None:
+                if entry.expires_at <= self._clock():
+                    self._remove(key)
+                    self._stats.expirations += 1
+                    entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        size: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> bool:
+        """Stores ``value`` and returns whether it was admitted to the cache.
+
+        ``ttl`` overrides the cache-wide TTL for this entry.
+        """
+        if size is None:
+            size = estimate_size(key, value)
+        if size > self.max_bytes:
+            return False
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            elif not self._admit(key, size):
+                self._stats.rejections += 1
+                return False
+            while self._entries and (
+                len(self._entries) >= self.max_entries
+                or self._stats.bytes + size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+            self._entries[key] = _Entry(value, size, expires_at)
+            self._stats.entries += 1
+            self._stats.bytes += size
+            return True
+
+    def _admit(self, key: Hashable, size: int) -> bool:
+        if self._sketch is None:
+            return True
+        if (
+            len(self._entries) < self.max_entries
+            and self._stats.bytes + size <= self.max_bytes
+        ):
+            return True
+        victim = next(iter(self._entries))
+        return self._sketch.estimate(key) > self._sketch.estimate(victim)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._stats.entries -= 1
+        self._stats.bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats.entries = 0
+            self._stats.bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+
+class _Rejection:
+    """A cached ValueError outcome; only the message is kept, not the traceback."""
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+class CachedDataHandler:
+    """Wraps a DataHandler and memoizes ``process`` results in a ResultCache.
+
+    With ``cache_errors=True`` inputs rejected with ``ValueError`` are cached
+    too, so repeated bad inputs are rejected without being processed again.
+    Other DataHandler methods are passed through uncached. The cache is
+    cleared whenever the handler's validation rules change (e.g. when a
+    ``RuleFile`` reloads), since cached outcomes depend on them.
+    """
+
+    def __init__(
+        self,
+        handler: Optional[DataHandler] = None,
+        cache: Optional[ResultCache] = None,
+        cache_errors: bool = True,
+    ):
+        self.handler = handler if handler is not None else DataHandler()
+        self.cache = cache if cache is not None else ResultCache()
+        self.cache_errors = cache_errors
+        self._rules = self._current_rules()
+
+    def _current_rules(self) -> Any:
+        rules = getattr(self.handler, "rules", None)
+        return rules.current if rules is not None else None
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "handler":  # Not yet set, e.g. while being copied
+            raise AttributeError(name)
+        return getattr(self.handler, name)
+
+    def lookup(self, data: str) -> Optional[str]:
+        """Returns the cached result, or None on a miss.
+
+        Raises ValueError if a rejection of ``data`` was cached.
+        """
+        rules = self._current_rules()
+        if rules is not self._rules:  # Outcomes under the old rules are stale
+            self._rules = rules
+            self.cache.clear()
+            return None
+        cached = self.cache.get(data, _MISSING)
+        if cached is _MISSING:
+            return None
+        if isinstance(cached, _Rejection):
+            raise ValueError(cached.message)
+        return cached
+
+    def remember(self, data: str, result: str) -> None:
+        self.cache.put(data, result)
+
+    def remember_error(self, data: str, error: ValueError) -> None:
+        if self.cache_errors:
+            message = str(error)
+            self.cache.put(data, _Rejection(message), estimate_size(data, message))
+
+    def process(self, data: str) -> str:
+        result = self.lookup(data)
+        if result is not None:
+            return result
+        try:
+            result = self.handler.process(data)
+        except ValueError as e:
+            self.remember_error(data, e)
+            raise
+        self.remember(data, result)
+        return result
@@ -0,0 +1,133 @@
+# SQLite-backed checkpoints for incremental pipeline runs
+import hashlib
+import json
+import sqlite3
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+Record = Dict[str, Any]
+
+# SQLite allows at most 999 bound parameters per statement in older builds.
+_LOOKUP_BATCH = 900
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS high_water_marks "
+    "(pipeline TEXT PRIMARY KEY, last_id INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS record_hashes (pipeline TEXT NOT NULL, "
+    "id INTEGER NOT NULL, hash BLOB NOT NULL, PRIMARY KEY (pipeline, id)) "
+    "WITHOUT ROWID",
+)
+
+
+def record_hash(record: Record) -> bytes:
+    """A stable 128-bit digest of a record's content (key order ignored)."""
+    encoded = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).digest()
+
+
+class CheckpointStore:
+    """Remembers which records a pipeline has already processed.
+
+    For each pipeline name the store keeps a high-water mark (the largest
+    processed ``id``) and a content hash per processed record. ``select``
+    keeps the records that are new or whose content changed and stages their
+    entries; ``commit`` persists everything staged so far in one transaction.
+    Commit after each chunk has been durably loaded: a crashed run then
+    resumes after the last committed chunk, and at worst reloads the chunk
+    that was being written when it stopped.
+    """
+
+    def __init__(self, path: str, pipeline: str = "default", key: str = "id"):
+        self.pipeline = pipeline
+        self.key = key
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+        row = self._connection.execute(
+            "SELECT last_id FROM high_water_marks WHERE pipeline = ?", (pipeline,)
+        ).fetchone()
+        self._high_water_mark: Optional[int] = row[0] if row else None
+        self._pending: Dict[int, bytes] = {}
+
+    @property
+    def high_water_mark(self) -> Optional[int]:
+        """The largest committed ``id``, or None before the first commit."""
+        return self._high_water_mark
+
+    def _stored_hashes(self, ids: List[int]) -> Dict[int, bytes]:
+        stored: Dict[int, bytes] = {}
+        for start in range(0, len(ids), _LOOKUP_BATCH):
+            batch = ids[start : start + _LOOKUP_BATCH]
+            placeholders = ", ".join("?" * len(batch))
+            stored.update(
+                self._connection.execute(
+                    "SELECT id, hash FROM record_hashes "  # nosec B608
+                    f"WHERE pipeline = ? AND id IN ({placeholders})",
+                    (self.pipeline, *batch),
+                ).fetchall()
+            )
+        return stored
+
+    def select(self, records: List[Record]) -> List[Record]:
+        """Returns the new or changed records and stages them for ``commit``.
+
+        Hashes are taken before the records are returned, so later stages
+        may modify them in place.
+        """
+        key = self.key
+        hashes = [record_hash(record) for record in records]
+        mark = self._high_water_mark
+        seen = (
+            [record[key] for record in records if record[key] <= mark]
+            if mark is not None
+            else []
+        )
+        stored = self._stored_hashes(seen) if seen else {}
+        selected = []
+        for record, digest in zip(records, hashes, strict=True):
+            record_id = record[key]
+            if stored.get(record_id) != digest:
+                selected.append(record)
+                self._pending[record_id] = digest
+        return selected
+
+    def commit(self) -> None:
+        """Persists the staged records and advances the high-water mark."""
+        if not self._pending:
+            return
+        mark = max(self._pending)
+        if self._high_water_mark is not None:
+            mark = max(mark, self._high_water_mark)
+        connection = self._connection
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO record_hashes (pipeline, id, hash) "
+                "VALUES (?, ?, ?)",
+                [(self.pipeline, *entry) for entry in self._pending.items()],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO high_water_marks (pipeline, last_id) "
+                "VALUES (?, ?)",
+                (self.pipeline, mark),
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        self._high_water_mark = mark
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Closes the store, dropping anything staged but not committed."""
+        self._pending.clear()
+        self._connection.close()
+
+    def __enter__(self) -> "CheckpointStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
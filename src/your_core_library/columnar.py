@@ -0,0 +1,136 @@
+# Columnar record batches backed by NumPy (install with the 'perf' extra)
+import itertools
+import sys
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+
+import numpy as np
+
+
+class RecordBatch:
+    """A batch of records stored column by column.
+
+    Numeric columns are NumPy arrays. Dictionary-encoded columns store small
+    integer codes plus one array of distinct values, and constant columns
+    (the same value for every record) store a single interned object. Records
+    are only materialized as dicts by ``to_records``.
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, np.ndarray],
+        dictionaries: Optional[Mapping[str, np.ndarray]] = None,
+        constants: Optional[Mapping[str, Any]] = None,
+        names: Optional[Sequence[str]] = None,
+    ):
+        lengths = {len(array) for array in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns of a RecordBatch must have the same length.")
+        self.columns: Dict[str, np.ndarray] = dict(columns)
+        self.dictionaries: Dict[str, np.ndarray] = dict(dictionaries or {})
+        self.constants: Dict[str, Any] = dict(constants or {})
+        # Column order of the records, whether stored as arrays or constants.
+        self._names = list(names) if names is not None else [*columns, *self.constants]
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Sequence[Mapping[str, Any]],
+        dictionary_columns: Iterable[str] = ("category",),
+    ) -> "RecordBatch":
+        """Builds a batch from dicts; all records must share the same keys."""
+        if not records:
+            return cls({})
+        encoded = set(dictionary_columns)
+        columns: Dict[str, np.ndarray] = {}
+        dictionaries: Dict[str, np.ndarray] = {}
+        for name in records[0]:
+            values = [record[name] for record in records]
+            if name in encoded:
+                distinct, codes = np.unique(np.array(values), return_inverse=True)
+                columns[name] = codes.astype(_code_dtype(len(distinct)))
+                dictionaries[name] = distinct
+            else:
+                columns[name] = np.array(values)
+        return cls(columns, dictionaries)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Returns a column as a (decoded) NumPy array."""
+        if name in self.dictionaries:
+            return self.dictionaries[name][self.columns[name]]
+        if name in self.columns:
+            return self.columns[name]
+        if name in self.constants:
+            return np.full(len(self), self.constants[name], dtype=object)
+        raise KeyError(name)
+
+    def filter(self, mask: np.ndarray) -> "RecordBatch":
+        """Returns the records where the boolean ``mask`` is True."""
+        return RecordBatch(
+            {name: array[mask] for name, array in self.columns.items()},
+            self.dictionaries,
+            self.constants,
+            self._names,
+        )
+
+    def with_column(self, name: str, values: np.ndarray) -> "RecordBatch":
+        return RecordBatch(
+            {**self.columns, name: values},
+            self.dictionaries,
+            self.constants,
+            self._with_name(name),
+        )
+
+    def with_constant(self, name: str, value: Any) -> "RecordBatch":
+        if isinstance(value, str):
+            value = sys.intern(value)
+        return RecordBatch(
+            self.columns,
+            self.dictionaries,
+            {**self.constants, name: value},
+            self._with_name(name),
+        )
+
+    def _with_name(self, name: str) -> List[str]:
+        return self._names if name in self._names else [*self._names, name]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Converts the batch to dicts whose keys follow ``names``."""
+        names = self._names
+        decoded: List[Iterable[Any]] = []
+        for name in names:
+            if name in self.constants:
+                decoded.append(itertools.repeat(self.constants[name], len(self)))
+                continue
+            values = self.columns[name].tolist()
+            if name in self.dictionaries:
+                dictionary = [
+                    sys.intern(value) if isinstance(value, str) else value
+                    for value in self.dictionaries[name].tolist()
+                ]
+                values = [dictionary[code] for code in values]
+            decoded.append(values)
+        return [
+            dict(zip(names, row, strict=True)) for row in zip(*decoded, strict=True)
+        ]
+
+
+def _code_dtype(cardinality: int) -> type:
+    if cardinality <= np.iinfo(np.uint8).max + 1:
+        return np.uint8
+    if cardinality <= np.iinfo(np.uint16).max + 1:
+        return np.uint16
+    return np.uint32
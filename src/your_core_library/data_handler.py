@@ -1,17 +1,234 @@
 # Placeholder for your core data processing logic (e.g., DuckDB, LinkML interactions)
+from bisect import bisect_right
+from itertools import accumulate
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Union
+
+from your_core_library.instrumentation import timed
+
+if TYPE_CHECKING:
+    from your_core_library.rules import RuleFile
+    from your_core_library.rules import RuleSet
+
+PROCESSED_PREFIX = "processed_"
+EMPTY_INPUT_MESSAGE = "Input data cannot be empty."
+SIMULATED_ERROR_MESSAGE = "Simulated processing error based on input."
+
+# Joins a batch for the single-pass "error" scan. It cannot occur inside the
+# trigger word, so a match in the joined text never spans two records.
+_BATCH_SEPARATOR = "\x00"
+
+BytesLike = Union[bytes, bytearray, memoryview]
+# process_bytes scans for "error" in windows of this size, overlapping by the
+# length of the word minus one so that a match across two windows is found.
+_SCAN_WINDOW = 1 << 16
+_SMALL_INPUT = 4096  # Bytes; smaller inputs take the str path
+_ERROR_BYTES = b"error"
+_REVERSED_PREFIX = PROCESSED_PREFIX.encode()[::-1]
+
+
+class BatchResult:
+    """Per-item outcome of DataHandler.process_batch.
+
+    ``results[i]`` holds the processed string for item ``i`` or ``None`` if it
+    was rejected, in which case ``errors[i]`` holds the error message.
+    """
+
+    # A plain slotted class rather than a dataclass: importing dataclasses
+    # (and inspect with it) would add to the startup time of every CLI call.
+    __slots__ = ("results", "errors")
+
+    def __init__(
+        self,
+        results: Optional[List[Optional[str]]] = None,
+        errors: Optional[List[Optional[str]]] = None,
+    ):
+        self.results: List[Optional[str]] = results if results is not None else []
+        self.errors: List[Optional[str]] = errors if errors is not None else []
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BatchResult):
+            return NotImplemented
+        return self.results == other.results and self.errors == other.errors
+
+    def __repr__(self) -> str:
+        return f"BatchResult(results={self.results!r}, errors={self.errors!r})"
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @property
+    def error_count(self) -> int:
+        return sum(1 for error in self.errors if error is not None)
+
+    @property
+    def ok(self) -> bool:
+        return self.error_count == 0
+
+    def to_numpy(self) -> Any:
+        """Returns the results as a NumPy unicode array (rejected items are "").
+
+        Requires the optional ``numpy`` dependency (``pip install .[perf]``).
+        """
+        import numpy as np
+
+        return np.array(
+            [result if result is not None else "" for result in self.results],
+            dtype=np.str_,
+        )
+
+    def to_arrow(self) -> Any:
+        """Returns the results as a ``pyarrow`` string array with nulls for errors.
+
+        Requires the optional ``pyarrow`` dependency.
+        """
+        import pyarrow as pa
+
+        return pa.array(self.results, type=pa.string())
 
 
 class DataHandler:
+    # A class-level default keeps subclasses that skip __init__ working.
+    rules: Optional[Union["RuleSet", "RuleFile"]] = None
+
+    def __init__(self, rules: Optional[Union["RuleSet", "RuleFile"]] = None):
+        # Without rules the built-in "error" check and another_method's fixed
+        # thresholds apply. A RuleSet (or a RuleFile, which reloads itself)
+        # replaces the "error" check and, if it has numeric rules, the
+        # thresholds; empty input is always rejected.
+        self.rules = rules
+
+    @timed("data_handler_process")
     def process(self, data: str) -> str:
         if not data:
-            raise ValueError("Input data cannot be empty.")
-        if "error" in data.lower():
-            raise ValueError("Simulated processing error based on input.")
+            raise ValueError(EMPTY_INPUT_MESSAGE)
+        if self.rules is not None:
+            message = self.rules.current.check(data)
+            if message is not None:
+                raise ValueError(message)
+        elif "error" in data.lower():
+            raise ValueError(SIMULATED_ERROR_MESSAGE)
         # Example processing: reverse the string and add a prefix
         processed_data = data[::-1]
-        return f"processed_{processed_data}"
+        return f"{PROCESSED_PREFIX}{processed_data}"
+
+    @timed("data_handler_process_bytes")
+    def process_bytes(
+        self, data: BytesLike, out: Optional[bytearray] = None
+    ) -> bytearray:
+        """Processes UTF-8 encoded data like ``process``, without decoding it.
+
+        ASCII input is checked for "error" a window at a time, so no lowered
+        copy of the whole payload is made, and the output is built in a single
+        buffer: the input is copied in once and reversed in place. Pass
+        ``out`` to reuse a buffer across calls; it is resized to fit and
+        returned. Non-contiguous buffers are copied first. Small and non-ASCII
+        inputs go through the ``str`` path, and invalid UTF-8 raises
+        ``UnicodeDecodeError`` (a ``ValueError``).
+        """
+        view = memoryview(data)
+        if not view.c_contiguous:  # E.g. a strided slice; cast() needs C order
+            view = memoryview(view.tobytes())
+        view = view.cast("B")
+        if not view:
+            raise ValueError(EMPTY_INPUT_MESSAGE)
+        # Small inputs are cheaper to copy than to scan window by window, and
+        # reversing non-ASCII UTF-8 bytes would break multi-byte characters.
+        # Inputs checked against configured rules also take the str path.
+        if self.rules is not None or len(view) <= _SMALL_INPUT or not _scan_ascii(view):
+            result = self.process(str(view, "utf-8")).encode()
+            if out is None:
+                return bytearray(result)
+            out[:] = result
+            return out
+        size = len(view)
+        total = size + len(_REVERSED_PREFIX)
+        if out is None:
+            out = bytearray(total)
+        elif len(out) > total:
+            del out[total:]
+        elif len(out) < total:
+            out += bytes(total - len(out))
+        # reversed(data + reversed(prefix)) == prefix + reversed(data)
+        # Through a memoryview: slice-assigning a non-bytearray to a bytearray
+        # would first copy it into a temporary bytearray.
+        with memoryview(out) as target:
+            target[:size] = view
+            target[size:] = _REVERSED_PREFIX
+        out.reverse()
+        return out
+
+    def process_batch(self, items: List[str]) -> BatchResult:
+        """Processes a batch of strings, collecting errors instead of raising.
+
+        The batch is joined and lowered once for the "error" check; matches are
+        mapped back to record indices through their offsets in the joined text.
+        Configured rules check the whole batch at once too (see RuleSet).
+        """
+        rejected: Dict[int, str] = {}
+        if self.rules is not None:
+            messages = self.rules.current.check_batch(items)
+            rejected = {i: m for i, m in enumerate(messages) if m is not None}
+            joined = lowered = ""
+        else:
+            joined = _BATCH_SEPARATOR.join(items)
+            lowered = joined.lower()
+        if "error" in lowered:
+            if len(lowered) == len(joined):
+                starts = list(accumulate((len(item) + 1 for item in items), initial=0))
+                position = lowered.find("error")
+                while position != -1:
+                    index = bisect_right(starts, position) - 1
+                    rejected[index] = SIMULATED_ERROR_MESSAGE
+                    position = lowered.find("error", starts[index + 1])
+            else:
+                # Some characters change length when lowered, so offsets in the
+                # lowered text no longer line up with records; check each one.
+                for index, item in enumerate(items):
+                    if "error" in item.lower():
+                        rejected[index] = SIMULATED_ERROR_MESSAGE
+        if not all(items):
+            for index, item in enumerate(items):
+                if not item:
+                    rejected[index] = EMPTY_INPUT_MESSAGE
 
+        prefix = PROCESSED_PREFIX
+        results: List[Optional[str]] = [prefix + item[::-1] for item in items]
+        errors: List[Optional[str]] = [None] * len(items)
+        for index, message in rejected.items():
+            results[index] = None
+            errors[index] = message
+        return BatchResult(results=results, errors=errors)
+
+    def process_many(
+        self, items: Iterable[str], chunk_size: int = 1024
+    ) -> Iterator[BatchResult]:
+        """Lazily processes an iterable in chunks of ``chunk_size`` items.
+
+        The chunk size is checked when called, not on the first ``next()``.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        return self._process_chunks(iter(items), chunk_size)
+
+    def _process_chunks(
+        self, iterator: Iterator[str], chunk_size: int
+    ) -> Iterator[BatchResult]:
+        while chunk := list(islice(iterator, chunk_size)):
+            yield self.process_batch(chunk)
+
+    @timed("data_handler_another_method")
     def another_method(self, value: int) -> bool:
+        rules = self.rules.current if self.rules is not None else None
+        if rules is not None and rules.numeric:
+            return rules.check_value(value) is None
         # Placeholder for more complex logic
         if value < 0:
             return False
@@ -21,7 +238,27 @@ class DataHandler:
         return value > 10  # Intentionally a bit odd to make testing more interesting
 
 
+def _scan_ascii(view: memoryview) -> bool:
+    """Returns whether ``view`` is ASCII, raising ValueError if it has "error".
+
+    Stops at the first non-ASCII window; the caller then falls back to the
+    ``str`` path, which applies the full Unicode-aware check.
+    """
+    overlap = len(_ERROR_BYTES) - 1
+    for start in range(0, len(view), _SCAN_WINDOW):
+        window = bytes(view[start : start + _SCAN_WINDOW + overlap])
+        if not window.isascii():
+            return False
+        if _ERROR_BYTES in window.lower():
+            raise ValueError(SIMULATED_ERROR_MESSAGE)
+    return True
+
+
 class ExampleModel:
+    # No per-instance __dict__: millions of models can be held in memory. See
+    # ExampleModelCollection for an even more compact array-backed store.
+    __slots__ = ("name", "value")
+
     def __init__(self, name: str, value: int):
         self.name = name
         self.value = value
@@ -30,5 +267,6 @@ class ExampleModel:
         return f"ExampleModel(name='{self.name}', value={self.value})"
 
 
+@timed("get_core_greeting")
 def get_core_greeting(name: str = "Core Library User") -> str:
     return f"Hello, {name}! This greeting comes from 'your_core_library'."
@@ -0,0 +1,240 @@
+# Memory-mapped processing of large line-delimited or fixed-size-record files
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from your_core_library.data_handler import DataHandler
+
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+ByteRange = Tuple[int, int]
+
+
+@dataclass
+class FileReport:
+    records: int = 0
+    # Records rejected by the handler or not valid UTF-8; they are left out
+    errors: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    seconds: float = 0.0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds else 0.0
+
+    def merge(self, other: "FileReport") -> None:
+        self.records += other.records
+        self.errors += other.errors
+        self.bytes_in += other.bytes_in
+        self.bytes_out += other.bytes_out
+
+
+def _record_boundary(
+    data: mmap.mmap, position: int, size: int, record_size: Optional[int]
+) -> int:
+    """Moves ``position`` forward to the start of the next record."""
+    if position <= 0 or position >= size:
+        return min(max(position, 0), size)
+    if record_size is not None:
+        return min(-(-position // record_size) * record_size, size)
+    newline = data.find(b"\n", position - 1)
+    return size if newline == -1 else newline + 1
+
+
+def split_ranges(
+    data: mmap.mmap, parts: int, record_size: Optional[int] = None
+) -> List[ByteRange]:
+    """Splits ``data`` into up to ``parts`` byte ranges of whole records.
+
+    Records are lines, or ``record_size`` bytes each if it is given.
+    """
+    if parts < 1:
+        raise ValueError("parts must be a positive integer.")
+    size = len(data)
+    boundaries = [
+        _record_boundary(data, size * part // parts, size, record_size)
+        for part in range(parts + 1)
+    ]
+    return [
+        (start, end)
+        for start, end in zip(boundaries, boundaries[1:], strict=False)
+        if end > start
+    ]
+
+
+def _iter_chunks(
+    data: mmap.mmap,
+    start: int,
+    end: int,
+    record_size: Optional[int],
+    chunk_bytes: int,
+) -> Iterator[Sequence[Optional[str]]]:
+    """Yields the records of ``data[start:end]`` in lists, one chunk at a time.
+
+    Records that are not valid UTF-8 are yielded as None.
+    """
+    if record_size is not None:
+        chunk_bytes = max(record_size, chunk_bytes // record_size * record_size)
+    position = start
+    while position < end:
+        stop = min(position + chunk_bytes, end)
+        if record_size is None and stop < end:
+            newline = data.rfind(b"\n", position, stop)
+            if newline == -1:  # A record longer than the chunk
+                newline = data.find(b"\n", stop, end)
+            stop = end if newline == -1 else newline + 1
+        chunk = data[position:stop]
+        if record_size is None:
+            try:
+                yield chunk.decode().removesuffix("\n").split("\n")
+            except UnicodeDecodeError:  # Find the bad lines one by one
+                yield [_decode(line) for line in chunk.removesuffix(b"\n").split(b"\n")]
+        else:
+            yield [
+                _decode(chunk[offset : offset + record_size])
+                for offset in range(0, len(chunk), record_size)
+            ]
+        position = stop
+
+
+def _decode(record: bytes) -> Optional[str]:
+    """The record as text, or None if it is not valid UTF-8."""
+    try:
+        return record.decode()
+    except UnicodeDecodeError:
+        return None
+
+
+def process_range(
+    input_path: str,
+    output: BinaryIO,
+    byte_range: ByteRange,
+    handler: DataHandler,
+    record_size: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> FileReport:
+    """Processes the records in one byte range of a file into ``output``.
+
+    Line-delimited input produces one output line per accepted record. Fixed
+    size records produce fixed-size output records, ``len(PROCESSED_PREFIX)``
+    bytes longer than the input ones (the prefix is ASCII and reversing keeps
+    the encoded length), with no separator.
+    """
+    report = FileReport()
+    start, end = byte_range
+    separator = "\n" if record_size is None else ""
+    with (
+        open(input_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        for records in _iter_chunks(data, start, end, record_size, chunk_bytes):
+            valid = [record for record in records if record is not None]
+            report.records += len(records)
+            report.errors += len(records) - len(valid)
+            batch = handler.process_batch(valid)
+            accepted = [result for result in batch.results if result is not None]
+            if accepted:
+                encoded = (separator.join(accepted) + separator).encode()
+                output.write(encoded)
+                report.bytes_out += len(encoded)
+            report.errors += batch.error_count
+    report.bytes_in = end - start
+    return report
+
+
+def _process_part(
+    input_path: str,
+    part_path: str,
+    byte_range: ByteRange,
+    handler: DataHandler,
+    record_size: Optional[int],
+    chunk_bytes: int,
+) -> FileReport:
+    with open(part_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as output:
+        return process_range(
+            input_path, output, byte_range, handler, record_size, chunk_bytes
+        )
+
+
+def process_file(
+    input_path: str,
+    output_path: str,
+    handler: Optional[DataHandler] = None,
+    workers: int = 1,
+    record_size: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> FileReport:
+    """Runs ``handler.process`` over every record of a (possibly huge) file.
+
+    The input is memory-mapped and read ``chunk_bytes`` at a time, so memory
+    use does not grow with the file size. Records are lines (UTF-8, without
+    the trailing newline) or, with ``record_size``, fixed-size byte records.
+    Rejected records, and records that are not valid UTF-8, are counted in
+    the report and left out of the output.
+
+    With ``workers > 1`` the file is split into byte ranges aligned to record
+    boundaries, processed in parallel worker processes into temporary part
+    files next to the output, and the parts are concatenated in order.
+    """
+    if workers < 1:
+        raise ValueError("Worker count must be a positive integer.")
+    if record_size is not None and record_size < 1:
+        raise ValueError("record_size must be a positive integer.")
+    handler = handler if handler is not None else DataHandler()
+    started = time.perf_counter()
+    report = FileReport()
+    if os.path.getsize(input_path) == 0:  # An empty file cannot be mapped
+        open(output_path, "wb").close()
+        return report
+
+    with (
+        open(input_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        ranges = split_ranges(data, workers, record_size)
+
+    if len(ranges) == 1:
+        with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as output:
+            report = process_range(
+                input_path, output, ranges[0], handler, record_size, chunk_bytes
+            )
+    else:
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        with tempfile.TemporaryDirectory(dir=output_dir) as parts_dir:
+            part_paths = [
+                os.path.join(parts_dir, f"part-{index:05d}")
+                for index in range(len(ranges))
+            ]
+            with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                futures = [
+                    pool.submit(
+                        _process_part,
+                        input_path,
+                        part_path,
+                        byte_range,
+                        handler,
+                        record_size,
+                        chunk_bytes,
+                    )
+                    for part_path, byte_range in zip(part_paths, ranges, strict=True)
+                ]
+                for future in futures:
+                    report.merge(future.result())
+            with open(output_path, "wb") as output:
+                for part_path in part_paths:
+                    with open(part_path, "rb") as part:
+                        shutil.copyfileobj(part, output, OUTPUT_BUFFER_SIZE)
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,229 @@
+# Opt-in counters, timers and profiling helpers for hot paths
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from functools import wraps
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+ENV_VAR = "YOUR_CORE_LIBRARY_METRICS"
+METRIC_PREFIX = "your_core_library_"
+
+F = TypeVar("F", bound=Callable[..., Any])
+Labels = Tuple[Tuple[str, str], ...]
+MetricKey = Tuple[str, Labels]
+
+_enabled = os.environ.get(ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+_lock = threading.Lock()
+_counters: Dict[MetricKey, float] = {}
+# name/labels -> [calls, errors, total seconds]
+_timers: Dict[MetricKey, List[float]] = {}
+
+
+def enable(enabled: bool = True) -> None:
+    """Turns metric collection on or off for the whole process.
+
+    ``@timed`` functions check the flag on every call, so this also applies
+    to references imported before it was called.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+
+
+def _key(name: str, labels: Optional[Dict[str, str]]) -> MetricKey:
+    return name, tuple(sorted(labels.items())) if labels else ()
+
+
+def increment(
+    name: str, amount: float = 1, labels: Optional[Dict[str, str]] = None
+) -> None:
+    """Adds ``amount`` to a counter; a no-op while metrics are disabled."""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def observe(
+    name: str,
+    seconds: float,
+    labels: Optional[Dict[str, str]] = None,
+    calls: int = 1,
+    errors: int = 0,
+) -> None:
+    """Records ``calls`` timed calls that took ``seconds`` in total."""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        timer = _timers.setdefault(key, [0, 0, 0.0])
+        timer[0] += calls
+        timer[1] += errors
+        timer[2] += seconds
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator that counts calls, errors and time spent in a function.
+
+    While metrics are disabled the wrapper only checks a flag and calls
+    ``func``.
+    """
+
+    def decorator(func: F) -> F:
+        key = (name, ())
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            failed = 0
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                failed = 1
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                with _lock:
+                    timer = _timers.setdefault(key, [0, 0, 0.0])
+                    timer[0] += 1
+                    timer[1] += failed
+                    timer[2] += elapsed
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def snapshot() -> Dict[str, Any]:
+    """Returns a copy of all counters and timers."""
+    with _lock:
+        return {
+            "counters": dict(_counters),
+            "timers": {key: tuple(timer) for key, timer in _timers.items()},
+        }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels)
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def render_prometheus(
+    extra_gauges: Optional[Dict[str, float]] = None,
+    extra_counters: Optional[Dict[str, float]] = None,
+) -> str:
+    """Renders all metrics in the Prometheus text exposition format.
+
+    Timers become ``<name>_seconds`` summaries plus an ``<name>_errors_total``
+    counter. ``extra_gauges`` adds application values (queue depths, cache
+    sizes, ...) under the same prefix, and ``extra_counters`` adds ever
+    increasing application totals as counters (suffixed ``_total``).
+    """
+    data = snapshot()
+    # Samples of one metric family must be contiguous in the output.
+    families: Dict[str, Tuple[str, List[str]]] = {}
+
+    def add(family: str, kind: str, sample: str) -> None:
+        families.setdefault(family, (kind, []))[1].append(sample)
+
+    for (name, labels), value in sorted(data["counters"].items()):
+        metric = f"{METRIC_PREFIX}{name}_total"
+        add(metric, "counter", f"{metric}{_format_labels(labels)} {value:g}")
+    for (name, labels), (calls, errors, seconds) in sorted(data["timers"].items()):
+        label_text = _format_labels(labels)
+        metric = f"{METRIC_PREFIX}{name}_seconds"
+        add(metric, "summary", f"{metric}_count{label_text} {calls:g}")
+        add(metric, "summary", f"{metric}_sum{label_text} {seconds:.9g}")
+        errors_metric = f"{METRIC_PREFIX}{name}_errors_total"
+        add(errors_metric, "counter", f"{errors_metric}{label_text} {errors:g}")
+    for name, value in sorted((extra_counters or {}).items()):
+        metric = f"{METRIC_PREFIX}{name}"
+        if not metric.endswith("_total"):
+            metric += "_total"
+        add(metric, "counter", f"{metric} {value:g}")
+    for name, value in sorted((extra_gauges or {}).items()):
+        metric = f"{METRIC_PREFIX}{name}"
+        add(metric, "gauge", f"{metric} {value:g}")
+
+    lines: List[str] = []
+    for family, (kind, samples) in families.items():
+        lines.append(f"# TYPE {family} {kind}")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
+
+
+class SamplingProfiler:
+    """Samples the stacks of all threads from a background thread.
+
+    Unlike cProfile this sees every thread (executor workers included) at a
+    fixed, low overhead. ``collapsed()`` returns the samples in the "folded
+    stacks" format understood by flame graph tools.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        if interval <= 0:
+            raise ValueError("Sampling interval must be positive.")
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                current: Any = frame
+                while current is not None:
+                    code = current.f_code
+                    stack.append(
+                        f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+                    )
+                    current = current.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.samples.most_common()
+        )
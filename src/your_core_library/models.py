@@ -0,0 +1,182 @@
+# Compact, array-backed storage for large numbers of ExampleModel records
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+from itertools import compress
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+from typing import overload
+
+from your_core_library.data_handler import ExampleModel
+
+# Row selections are either a range (from slicing) or a view of row numbers
+# (from filtering and sorting); both are sliced without copying.
+Rows = Union[range, memoryview]
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """NumPy if installed (the 'perf' extra), else None."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class ExampleModelCollection:
+    """An immutable collection of (name, value) records in contiguous arrays.
+
+    Names are stored UTF-8 encoded in one bytes buffer with an offsets array
+    and values in a signed 64-bit array, so a record costs a few dozen bytes
+    instead of a Python object per model, name and value. Slices, filters and
+    sorts return new collections that share the underlying storage and only
+    record which rows they select. ``ExampleModel`` objects are created on
+    demand, when indexing or iterating. With NumPy installed, filtering and
+    sorting run vectorized over zero-copy views of the arrays.
+    """
+
+    __slots__ = ("_names", "_offsets", "_values", "_rows")
+
+    def __init__(
+        self,
+        names: Iterable[str] = (),
+        values: Iterable[int] = (),
+    ):
+        encoded = [name.encode() for name in names]
+        self._names = b"".join(encoded)
+        self._offsets = array("q", accumulate(map(len, encoded), initial=0))
+        self._values = array("q", values)
+        if len(self._values) != len(encoded):
+            raise ValueError("names and values must have the same length.")
+        self._rows: Rows = range(len(encoded))
+
+    @classmethod
+    def from_models(cls, models: Iterable[ExampleModel]) -> "ExampleModelCollection":
+        names: List[str] = []
+        values: List[int] = []
+        for model in models:
+            names.append(model.name)
+            values.append(model.value)
+        return cls(names, values)
+
+    def _select(self, rows: Rows) -> "ExampleModelCollection":
+        selection = object.__new__(ExampleModelCollection)
+        selection._names = self._names
+        selection._offsets = self._offsets
+        selection._values = self._values
+        selection._rows = rows
+        return selection
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _name(self, row: int) -> str:
+        return self._names[self._offsets[row] : self._offsets[row + 1]].decode()
+
+    @overload
+    def __getitem__(self, index: int) -> ExampleModel: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ExampleModelCollection": ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[ExampleModel, "ExampleModelCollection"]:
+        if isinstance(index, slice):
+            return self._select(self._rows[index])
+        row = self._rows[index]
+        return ExampleModel(self._name(row), self._values[row])
+
+    def __iter__(self) -> Iterator[ExampleModel]:
+        names, offsets, values = self._names, self._offsets, self._values
+        for row in self._rows:
+            name = names[offsets[row] : offsets[row + 1]].decode()
+            yield ExampleModel(name, values[row])
+
+    def __repr__(self) -> str:
+        return f"ExampleModelCollection({len(self)} models)"
+
+    def names(self) -> List[str]:
+        return [self._name(row) for row in self._rows]
+
+    def values(self) -> Sequence[int]:
+        """The selected values; a zero-copy view for unsorted, unstepped slices."""
+        rows = self._rows
+        if isinstance(rows, range) and rows.step == 1:
+            return memoryview(self._values)[rows.start : rows.stop]
+        values = self._values
+        return array("q", [values[row] for row in rows])
+
+    def filter_by_value(
+        self, min_value: Optional[int] = None, max_value: Optional[int] = None
+    ) -> "ExampleModelCollection":
+        """Selects the models whose value lies within the inclusive bounds."""
+        if min_value is None and max_value is None:
+            return self
+        np = _numpy()
+        if np is not None:
+            rows = self._row_array(np)
+            values = np.frombuffer(self._values, dtype=np.int64)[rows]
+            mask = np.ones(len(rows), dtype=bool)
+            if min_value is not None:
+                mask &= values >= min_value
+            if max_value is not None:
+                mask &= values <= max_value
+            return self._select(memoryview(rows[mask]))
+        low = min_value if min_value is not None else float("-inf")
+        high = max_value if max_value is not None else float("inf")
+        mask = [low <= value <= high for value in self._selected_values()]
+        return self._select(memoryview(array("q", compress(self._rows, mask))))
+
+    def sort_by_value(self, reverse: bool = False) -> "ExampleModelCollection":
+        """Returns the models ordered by value; ties keep their current order."""
+        np = _numpy()
+        if np is not None:
+            rows = self._row_array(np)
+            keys = np.frombuffer(self._values, dtype=np.int64)[rows]
+            if reverse:
+                # A stable descending sort: sort the reversed keys and map the
+                # positions back, so equal values keep their original order.
+                order = len(keys) - 1 - np.argsort(keys[::-1], kind="stable")[::-1]
+            else:
+                order = np.argsort(keys, kind="stable")
+            return self._select(memoryview(rows[order]))
+        rows_list = sorted(self._rows, key=self._values.__getitem__, reverse=reverse)
+        return self._select(memoryview(array("q", rows_list)))
+
+    def _selected_values(self) -> Iterable[int]:
+        rows = self._rows
+        if isinstance(rows, range) and rows.step == 1:
+            return self._values[rows.start : rows.stop]  # A fast C-level copy
+        return self.values()
+
+    def _row_array(self, np: Any) -> Any:
+        rows = self._rows
+        if isinstance(rows, range):
+            return np.arange(rows.start, rows.stop, rows.step, dtype=np.int64)
+        return np.frombuffer(rows, dtype=np.int64)
+
+    def to_models(self) -> List[ExampleModel]:
+        return list(self)
+
+    def to_pairs(self) -> List[Tuple[str, int]]:
+        return list(zip(self.names(), self.values(), strict=True))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the shared storage and this collection's row selection."""
+        rows = self._rows
+        row_bytes = rows.nbytes if isinstance(rows, memoryview) else 0
+        return (
+            len(self._names)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._values.itemsize * len(self._values)
+            + row_bytes
+        )
@@ -0,0 +1,453 @@
+# Streaming, chunked pipeline engine: extract -> transform stages -> load
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from dataclasses import field
+from itertools import islice
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from your_core_library import instrumentation
+
+# Chunks start out as lists of records, but a stage may turn them into any
+# other sized batch type (such as a columnar RecordBatch).
+Chunk = Any
+ChunkTransform = Callable[[Chunk], Chunk]
+ChunkSink = Callable[[Chunk], Any]
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Groups an iterable into lists of at most ``size`` items, lazily."""
+    if size < 1:
+        raise ValueError("Chunk size must be a positive integer.")
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+@dataclass
+class StageStats:
+    name: str
+    chunks: int = 0
+    records_in: int = 0
+    records_out: int = 0
+    seconds: float = 0.0
+    # Only filled in by concurrent runs:
+    starved_seconds: float = 0.0  # Waiting for the stage before it
+    blocked_seconds: float = 0.0  # Waiting for room in the queue after it
+    utilization: float = 0.0  # Share of the run's wall time spent working
+    queue_mean: float = 0.0  # Chunks in the queue after it, sampled on each put
+    queue_max: int = 0
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records_in / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class PipelineReport:
+    stages: List[StageStats] = field(default_factory=list)
+    seconds: float = 0.0
+    queue_size: int = 0  # Bound of the queues between stages; 0 if sequential
+
+    def stage(self, name: str) -> StageStats:
+        for stats in self.stages:
+            if stats.name == name:
+                return stats
+        raise KeyError(name)
+
+    def summary(self) -> List[str]:
+        lines = [
+            f"{stats.name}: {stats.records_in} in, {stats.records_out} out, "
+            f"{stats.chunks} chunk(s), {stats.seconds:.3f}s, "
+            f"{stats.records_per_second:,.0f} records/s"
+            for stats in self.stages
+        ]
+        if self.queue_size:
+            for i, stats in enumerate(self.stages):
+                lines[i] += f", {stats.utilization:.0%} busy"
+                if i < len(self.stages) - 1:
+                    lines[i] += (
+                        f", queue {stats.queue_mean:.1f}/{self.queue_size} "
+                        f"(max {stats.queue_max})"
+                    )
+        lines.append(f"total: {self.seconds:.3f}s")
+        return lines
+
+
+def parallel_map(
+    func: ChunkTransform,
+    chunks: Iterable[Chunk],
+    workers: int,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+) -> Iterator[Chunk]:
+    """Applies ``func`` to chunks on a pool of ``workers`` processes.
+
+    Whole chunks are pickled to the workers, so the per-record serialization
+    overhead shrinks as the chunk size grows. At most ``max_pending`` chunks
+    (default: twice the worker count) are in flight at once, which keeps memory
+    bounded. Results come back in input order unless ``ordered`` is False, in
+    which case they are yielded as soon as they complete.
+    """
+    if workers < 1:
+        raise ValueError("Worker count must be a positive integer.")
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque["Future[Chunk]"] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= max_pending:
+                yield _next_result(pending, ordered)
+        while pending:
+            yield _next_result(pending, ordered)
+
+
+def _next_result(pending: Deque["Future[Chunk]"], ordered: bool) -> Chunk:
+    if ordered:
+        return pending.popleft().result()
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    future = done.pop()
+    pending.remove(future)
+    return future.result()
+
+
+class _TimedIterator:
+    """Accumulates the time spent producing each item, upstream work included."""
+
+    def __init__(self, iterable: Iterable[Chunk]):
+        self._iterator = iter(iterable)
+        self.seconds = 0.0
+
+    def __iter__(self) -> "_TimedIterator":
+        return self
+
+    def __next__(self) -> Chunk:
+        tick = time.perf_counter()
+        try:
+            return next(self._iterator)
+        finally:
+            self.seconds += time.perf_counter() - tick
+
+
+@dataclass
+class Stage:
+    name: str
+    func: ChunkTransform
+    workers: int = 1
+    ordered: bool = True
+
+    def apply(self, chunks: Iterable[Chunk], stats: StageStats) -> Iterator[Chunk]:
+        if self.workers > 1:
+            results = parallel_map(
+                self.func, _counted(chunks, stats), self.workers, self.ordered
+            )
+        else:
+            results = map(self.func, _counted(chunks, stats))
+        for chunk in results:
+            stats.records_out += len(chunk)
+            if chunk:
+                yield chunk
+
+
+def _counted(chunks: Iterable[Chunk], stats: StageStats) -> Iterator[Chunk]:
+    for chunk in chunks:
+        stats.chunks += 1
+        stats.records_in += len(chunk)
+        yield chunk
+
+
+_DONE = object()
+
+# How often a thread blocked on a queue checks whether the run was aborted.
+_POLL_SECONDS = 0.05
+
+
+class _Stopped(Exception):
+    """Raised in a stage that waits on a queue after another stage failed."""
+
+
+class _Channel:
+    """A bounded queue between two concurrent stages.
+
+    A full queue blocks the stage feeding it, so a slow stage throttles the
+    ones before it instead of letting chunks pile up in memory.
+    """
+
+    def __init__(self, maxsize: int, stop: threading.Event):
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize)
+        self._stop = stop
+        self._puts = 0
+        self._occupancy = 0
+
+    def put(self, item: Any, stats: StageStats) -> None:
+        tick = time.perf_counter()
+        while True:
+            try:
+                self._queue.put(item, timeout=_POLL_SECONDS)
+                break
+            except queue.Full:
+                if self._stop.is_set():
+                    raise _Stopped from None
+        stats.blocked_seconds += time.perf_counter() - tick
+        size = self._queue.qsize()
+        self._puts += 1
+        self._occupancy += size
+        stats.queue_max = max(stats.queue_max, size)
+        stats.queue_mean = self._occupancy / self._puts
+
+    def drain(self, stats: StageStats) -> Iterator[Chunk]:
+        """Yields chunks until the stage before is done, timing the waits."""
+        while True:
+            tick = time.perf_counter()
+            while True:
+                try:
+                    item = self._queue.get(timeout=_POLL_SECONDS)
+                    break
+                except queue.Empty:
+                    if self._stop.is_set():
+                        raise _Stopped from None
+            stats.starved_seconds += time.perf_counter() - tick
+            if item is _DONE:
+                return
+            yield item
+
+
+def _run_stage(
+    chunks: Iterator[Chunk],
+    output: _Channel,
+    stats: StageStats,
+    errors: List[BaseException],
+    stop: threading.Event,
+) -> None:
+    timed = _TimedIterator(chunks)
+    try:
+        for chunk in timed:
+            output.put(chunk, stats)
+        output.put(_DONE, stats)
+    except _Stopped:
+        pass
+    except BaseException as exc:  # Re-raised in the thread that called run()
+        errors.append(exc)
+        stop.set()
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()  # Releases the source and any worker pool on an abort
+        stats.seconds = timed.seconds - stats.starved_seconds
+
+
+class Pipeline:
+    """Streams records from a source through chunk-level stages into a sink.
+
+    The source is consumed lazily in chunks of ``chunk_size`` records and
+    chunks are pulled through the stages one at a time (a few at a time for
+    parallel stages), so memory use depends on the chunk size rather than on
+    the size of the dataset. Chunks a stage filters down to nothing are not
+    passed on.
+    """
+
+    def __init__(
+        self,
+        source: Iterable[Any],
+        chunk_size: int = 1000,
+        source_name: str = "extract",
+    ):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be a positive integer.")
+        self.source = source
+        self.chunk_size = chunk_size
+        self.source_name = source_name
+        self.stages: List[Stage] = []
+
+    def add_stage(
+        self,
+        name: str,
+        func: ChunkTransform,
+        workers: int = 1,
+        ordered: bool = True,
+    ) -> "Pipeline":
+        """Adds a transform stage.
+
+        With ``workers > 1`` chunks are sharded across a process pool; ``func``
+        must then be picklable (a module-level function).
+        """
+        if workers < 1:
+            raise ValueError("Worker count must be a positive integer.")
+        self.stages.append(Stage(name, func, workers, ordered))
+        return self
+
+    def run(
+        self,
+        sink: Optional[ChunkSink] = None,
+        sink_name: str = "load",
+        concurrent: bool = False,
+        queue_size: int = 2,
+    ) -> PipelineReport:
+        """Runs the pipeline to completion and returns per-stage statistics.
+
+        A stage's time excludes the time spent in the stages before it.
+
+        With ``concurrent`` the source and each stage run on their own thread
+        and hand chunks on through queues of at most ``queue_size`` chunks;
+        the sink runs on the calling thread. I/O in one stage (and work that
+        releases the GIL, such as NumPy or a process-pool stage) then overlaps
+        with the others, so the run takes about as long as its slowest stage
+        rather than the sum of all of them. The report also says how busy
+        each stage was and how full the queue after it was on average: a
+        full queue points at a slow stage downstream, an empty one at a slow
+        stage upstream. An exception in any stage stops the others and is
+        raised here.
+        """
+        if concurrent:
+            return self._run_concurrent(sink, sink_name, queue_size)
+        source_stats = StageStats(self.source_name)
+        report = PipelineReport([source_stats])
+        started = time.perf_counter()
+
+        timed = [
+            _TimedIterator(
+                _counted(chunked(self.source, self.chunk_size), source_stats)
+            )
+        ]
+        for stage in self.stages:
+            stats = StageStats(stage.name)
+            report.stages.append(stats)
+            timed.append(_TimedIterator(stage.apply(timed[-1], stats)))
+
+        sink_stats = StageStats(sink_name)
+        for chunk in timed[-1]:
+            if sink is not None:
+                tick = time.perf_counter()
+                sink(chunk)
+                sink_stats.seconds += time.perf_counter() - tick
+                sink_stats.chunks += 1
+                sink_stats.records_in += len(chunk)
+                sink_stats.records_out += len(chunk)
+
+        source_stats.records_out = source_stats.records_in
+        source_stats.seconds = timed[0].seconds
+        for stats, upstream, own in zip(
+            report.stages[1:], timed[:-1], timed[1:], strict=True
+        ):
+            stats.seconds = own.seconds - upstream.seconds
+        if sink is not None:
+            report.stages.append(sink_stats)
+        report.seconds = time.perf_counter() - started
+        if instrumentation.is_enabled():
+            _record_metrics(report)
+        return report
+
+    def _run_concurrent(
+        self, sink: Optional[ChunkSink], sink_name: str, queue_size: int
+    ) -> PipelineReport:
+        if queue_size < 1:
+            raise ValueError("Queue size must be a positive integer.")
+        stop = threading.Event()
+        errors: List[BaseException] = []
+        source_stats = StageStats(self.source_name)
+        report = PipelineReport([source_stats], queue_size=queue_size)
+        started = time.perf_counter()
+
+        channel = _Channel(queue_size, stop)
+        threads = [
+            threading.Thread(
+                target=_run_stage,
+                args=(
+                    _counted(chunked(self.source, self.chunk_size), source_stats),
+                    channel,
+                    source_stats,
+                    errors,
+                    stop,
+                ),
+                name=f"pipeline-{self.source_name}",
+                daemon=True,
+            )
+        ]
+        for stage in self.stages:
+            stats = StageStats(stage.name)
+            report.stages.append(stats)
+            upstream, channel = channel, _Channel(queue_size, stop)
+            threads.append(
+                threading.Thread(
+                    target=_run_stage,
+                    args=(
+                        stage.apply(upstream.drain(stats), stats),
+                        channel,
+                        stats,
+                        errors,
+                        stop,
+                    ),
+                    name=f"pipeline-{stage.name}",
+                    daemon=True,
+                )
+            )
+        for thread in threads:
+            thread.start()
+
+        sink_stats = StageStats(sink_name)
+        try:
+            for chunk in channel.drain(sink_stats):
+                if sink is not None:
+                    tick = time.perf_counter()
+                    sink(chunk)
+                    sink_stats.seconds += time.perf_counter() - tick
+                    sink_stats.chunks += 1
+                    sink_stats.records_in += len(chunk)
+                    sink_stats.records_out += len(chunk)
+        except _Stopped:
+            pass
+        finally:
+            stop.set()  # Unblocks the stages if the sink raised
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+
+        source_stats.records_out = source_stats.records_in
+        if sink is not None:
+            report.stages.append(sink_stats)
+        report.seconds = time.perf_counter() - started
+        for stats in report.stages:
+            if report.seconds:
+                stats.utilization = stats.seconds / report.seconds
+        if instrumentation.is_enabled():
+            _record_metrics(report)
+        return report
+
+
+def _record_metrics(report: PipelineReport) -> None:
+    instrumentation.observe("pipeline_run", report.seconds)
+    for stats in report.stages:
+        labels = {"stage": stats.name}
+        instrumentation.observe(
+            "pipeline_stage", stats.seconds, labels, calls=stats.chunks
+        )
+        instrumentation.increment("pipeline_stage_records_in", stats.records_in, labels)
+        instrumentation.increment(
+            "pipeline_stage_records_out", stats.records_out, labels
+        )
+        if report.queue_size:
+            instrumentation.observe(
+                "pipeline_stage_blocked",
+                stats.blocked_seconds,
+                labels,
+                calls=stats.chunks,
+            )
+            instrumentation.observe(
+                "pipeline_stage_starved",
+                stats.starved_seconds,
+                labels,
+                calls=stats.chunks,
+            )
@@ -0,0 +1,354 @@
+# Compiled validation rules for DataHandler input checks
+import json
+import logging
+import operator
+import os
+import re
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+# Joins a batch for the single-pass scan. Patterns containing it are matched
+# as regexes, so a literal match in the joined text never spans two records.
+_SEPARATOR = "\x00"
+
+NUMERIC_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """NumPy if installed (the 'perf' extra), else None."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@dataclass(frozen=True)
+class PatternRule:
+    """Rejects text containing ``pattern`` (a literal unless ``regex``)."""
+
+    name: str
+    pattern: str
+    message: str = "Input matches a reject pattern."
+    regex: bool = False
+    case_sensitive: bool = False
+
+
+@dataclass(frozen=True)
+class NumericRule:
+    """Rejects a value for which ``value <op> threshold`` holds."""
+
+    name: str
+    op: str
+    threshold: float
+    message: str = "Value is out of range."
+
+
+@lru_cache(maxsize=None)
+def _ahocorasick() -> Any:
+    """pyahocorasick if installed (the 'perf' extra), else None."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    return ahocorasick
+
+
+# A match: (start offset, rule index). The smallest one wins.
+Hit = Tuple[int, int]
+
+# Below this many literals, one str.find scan per literal beats the
+# automaton (see benchmarks/bench_rules.py).
+_AUTOMATON_MIN_LITERALS = 24
+
+
+class _Literals:
+    """Finds any of a set of literal strings in one pass over the text.
+
+    Uses an Aho-Corasick automaton, whose cost does not grow with the number
+    of literals, when pyahocorasick is installed and there are enough
+    literals to pay off; otherwise one fast ``str.find`` scan per literal.
+    """
+
+    def __init__(self, literals: Sequence[Tuple[str, int]]):
+        self.literals = tuple(literals)
+        self._automaton: Any = None
+        ahocorasick = _ahocorasick()
+        if ahocorasick is not None and len(self.literals) >= _AUTOMATON_MIN_LITERALS:
+            automaton = ahocorasick.Automaton()
+            for literal, index in self.literals:
+                if not automaton.exists(literal):  # The first rule listed wins
+                    automaton.add_word(literal, (len(literal), index))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def first(self, text: str) -> Optional[Hit]:
+        best: Optional[Hit] = None
+        if self._automaton is not None:
+            for end, (length, index) in self._automaton.iter(text):
+                hit = (end - length + 1, index)
+                if best is None or hit < best:
+                    best = hit
+            return best
+        for literal, index in self.literals:
+            if literal in text:  # Cheaper than find() for the usual miss
+                hit = (text.find(literal), index)
+                if best is None or hit < best:
+                    best = hit
+        return best
+
+    def first_per_record(
+        self, joined: str, starts: List[int], best: List[Optional[Hit]]
+    ) -> None:
+        """Records each record's first hit in ``best``; records are joined
+        with a separator no literal contains and start at ``starts``."""
+        if self._automaton is not None:
+            for end, (length, index) in self._automaton.iter(joined):
+                start = end - length + 1
+                record = bisect_right(starts, start) - 1
+                hit = (start - starts[record], index)
+                current = best[record]
+                if current is None or hit < current:
+                    best[record] = hit
+            return
+        for literal, index in self.literals:
+            position = joined.find(literal)
+            while position != -1:
+                record = bisect_right(starts, position) - 1
+                hit = (position - starts[record], index)
+                current = best[record]
+                if current is None or hit < current:
+                    best[record] = hit
+                position = joined.find(literal, starts[record + 1])
+
+
+class RuleSet:
+    """An immutable set of rules compiled for fast checking.
+
+    Literal patterns are matched together in one pass, with Aho-Corasick
+    when pyahocorasick is installed (case-insensitive ones against the
+    lowered text), and a batch of records is joined and scanned at once.
+    Regex patterns are combined into one regular expression; the rule that
+    matched is only looked up on a hit. Numeric rules run as one vectorized
+    comparison per rule over a whole batch when NumPy is installed. Each
+    check returns the message of the rule that rejected the input, or None:
+    the pattern that matches earliest in the text (the first rule listed on
+    a tie), or the first numeric rule listed.
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[PatternRule] = (),
+        numeric: Sequence[NumericRule] = (),
+    ):
+        for numeric_rule in numeric:
+            if numeric_rule.op not in NUMERIC_OPERATORS:
+                raise ValueError(
+                    f"Rule {numeric_rule.name!r}: operator must be one of "
+                    f"{tuple(NUMERIC_OPERATORS)}, got {numeric_rule.op!r}."
+                )
+        self.patterns = tuple(patterns)
+        self.numeric = tuple(numeric)
+        folded: List[Tuple[str, int]] = []
+        exact: List[Tuple[str, int]] = []
+        regexes: List[Tuple["re.Pattern[str]", int]] = []
+        for index, rule in enumerate(self.patterns):
+            if not rule.pattern:
+                raise ValueError(f"Rule {rule.name!r}: the pattern is empty.")
+            if rule.regex or _SEPARATOR in rule.pattern:
+                flags = 0 if rule.case_sensitive else re.IGNORECASE
+                source = rule.pattern if rule.regex else re.escape(rule.pattern)
+                try:
+                    regexes.append((re.compile(source, flags), index))
+                except re.error as e:
+                    raise ValueError(f"Rule {rule.name!r}: invalid regex: {e}") from e
+            elif rule.case_sensitive:
+                exact.append((rule.pattern, index))
+            else:
+                folded.append((rule.pattern.lower(), index))
+        self._folded = _Literals(folded) if folded else None
+        self._exact = _Literals(exact) if exact else None
+        # Regexes with groups are searched on their own: combined, their
+        # group numbers and names would clash with those of the other rules
+        # (so a backreference such as \1 would point at another rule's group).
+        self._regexes = [(rx, index) for rx, index in regexes if not rx.groups]
+        self._grouped = [(rx, index) for rx, index in regexes if rx.groups]
+        # Finds where the earliest regex match starts; which rule matched
+        # there is looked up afterwards. Named groups would tell directly,
+        # but make the combined pattern far slower to search.
+        alternatives = [
+            f"(?i:{rx.pattern})" if rx.flags & re.IGNORECASE else f"(?:{rx.pattern})"
+            for rx, _ in self._regexes
+        ]
+        try:
+            self._combined = (
+                re.compile("|".join(alternatives)) if alternatives else None
+            )
+        except re.error as e:  # E.g. a global inline flag in a later rule
+            raise ValueError(f"Invalid regex rules: {e}") from e
+        self._messages = [rule.message for rule in self.patterns]
+        self._checks: List[Tuple[Callable[[Any, Any], Any], float, str]] = [
+            (NUMERIC_OPERATORS[rule.op], rule.threshold, rule.message)
+            for rule in self.numeric
+        ]
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Any]) -> "RuleSet":
+        """Builds a rule set from ``{"patterns": [...], "numeric": [...]}``,
+        each a list of keyword arguments for the rule classes."""
+        try:
+            return cls(
+                [PatternRule(**rule) for rule in config.get("patterns", ())],
+                [NumericRule(**rule) for rule in config.get("numeric", ())],
+            )
+        except TypeError as e:
+            raise ValueError(f"Invalid rule definition: {e}") from e
+
+    @property
+    def current(self) -> "RuleSet":
+        """The rule set itself; see ``RuleFile.current``."""
+        return self
+
+    def __len__(self) -> int:
+        return len(self.patterns) + len(self.numeric)
+
+    def _first_regex(self, text: str) -> Optional[Hit]:
+        best: Optional[Hit] = None
+        for regex, index in self._grouped:
+            match = regex.search(text)
+            if match is not None and (best is None or (match.start(), index) < best):
+                best = match.start(), index
+        match = self._combined.search(text) if self._combined is not None else None
+        if match is None:
+            return best
+        position = match.start()
+        for regex, index in self._regexes:
+            if regex.match(text, position):
+                return min(best, (position, index)) if best else (position, index)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _first(self, text: str) -> Optional[Hit]:
+        hits = [
+            self._folded.first(text.lower()) if self._folded is not None else None,
+            self._exact.first(text) if self._exact is not None else None,
+            self._first_regex(text),
+        ]
+        return min((hit for hit in hits if hit is not None), default=None)
+
+    def check(self, text: str) -> Optional[str]:
+        hit = self._first(text)
+        return self._messages[hit[1]] if hit is not None else None
+
+    def check_batch(self, texts: Sequence[str]) -> List[Optional[str]]:
+        if not self.patterns:
+            return [None] * len(texts)
+        joined = _SEPARATOR.join(texts)
+        lowered = joined.lower() if self._folded is not None else joined
+        if self._combined is not None or self._grouped or len(lowered) != len(joined):
+            # Regexes can match across the separator or depend on where the
+            # text starts, and some characters change length when lowered,
+            # which shifts record offsets; check those records one by one.
+            return [self.check(text) for text in texts]
+        starts = list(accumulate((len(text) + 1 for text in texts), initial=0))
+        best: List[Optional[Hit]] = [None] * len(texts)
+        if self._folded is not None:
+            self._folded.first_per_record(lowered, starts, best)
+        if self._exact is not None:
+            self._exact.first_per_record(joined, starts, best)
+        return [self._messages[hit[1]] if hit is not None else None for hit in best]
+
+    def check_value(self, value: float) -> Optional[str]:
+        for compare, threshold, message in self._checks:
+            if compare(value, threshold):
+                return message
+        return None
+
+    def check_values(self, values: Sequence[float]) -> List[Optional[str]]:
+        np = _numpy()
+        if np is None or not self._checks:
+            return [self.check_value(value) for value in values]
+        array = np.asarray(values, dtype=np.float64)
+        rejected_by = np.full(len(array), -1, dtype=np.intp)
+        # Last rule first, so that the first rule listed wins.
+        for index in range(len(self._checks) - 1, -1, -1):
+            compare, threshold, _ = self._checks[index]
+            rejected_by[compare(array, threshold)] = index
+        return [
+            None if index < 0 else self._checks[index][2]
+            for index in rejected_by.tolist()
+        ]
+
+
+def load_rules(path: str) -> RuleSet:
+    """Loads a rule set from a JSON file (see ``RuleSet.from_dict``)."""
+    with open(path, encoding="utf-8") as f:
+        return RuleSet.from_dict(json.load(f))
+
+
+class RuleFile:
+    """A rule set loaded from a JSON file and reloaded when the file changes.
+
+    ``current`` checks the file's modification time at most once every
+    ``check_interval`` seconds and recompiles the rules when it changed, so
+    rules can be edited without restarting the app. A file that fails to
+    load is logged and the previous rules stay in effect. The first load
+    raises instead.
+    """
+
+    def __init__(self, path: str, check_interval: float = 1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self.reloads = 0
+        self._stamp = self._file_stamp()
+        self._rules = load_rules(path)
+        self._checked = time.monotonic()
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    @property
+    def current(self) -> RuleSet:
+        now = time.monotonic()
+        if now - self._checked >= self.check_interval:
+            self._checked = now
+            self.reload()
+        return self._rules
+
+    def reload(self, force: bool = False) -> bool:
+        """Reloads the rules if the file changed; returns whether it did."""
+        try:
+            stamp = self._file_stamp()
+            if stamp == self._stamp and not force:
+                return False
+            rules = load_rules(self.path)
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Keeping the current rules; cannot load %s: %s", self.path, e
+            )
+            return False
+        self._rules, self._stamp = rules, stamp
+        self.reloads += 1
+        logger.info("Loaded %d rule(s) from %s.", len(rules), self.path)
+        return True
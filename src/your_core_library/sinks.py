@@ -0,0 +1,384 @@
+# Batched record writers for the end of a Pipeline
+import abc
+import csv
+import json
+import queue
+import re
+import sqlite3
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+Record = Dict[str, Any]
+
+SINK_FORMATS = ("ndjson", "csv", "sqlite", "parquet", "arrow")
+# Formats whose output is complete after every flush and can be added to.
+APPENDABLE_FORMATS = ("ndjson", "csv", "sqlite")
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_CLOSED = object()
+_FLUSH = object()
+
+
+class Sink(abc.ABC):
+    """Collects records and writes them ``batch_size`` at a time.
+
+    Subclasses implement ``_write_batch`` (and ``_close`` to release their
+    resources). A sink is callable with a chunk of records, so it can be
+    passed straight to ``Pipeline.run``; use it as a context manager, or call
+    ``close``, to write the final partial batch.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError("Batch size must be a positive integer.")
+        self.batch_size = batch_size
+        self.records_written = 0
+        self._pending: List[Record] = []
+        self._closed = False
+
+    def write(self, records: Iterable[Record]) -> None:
+        if self._closed:
+            raise ValueError("Cannot write to a closed sink.")
+        pending = self._pending
+        pending.extend(records)
+        if len(pending) >= self.batch_size:
+            size = self.batch_size
+            full = len(pending) - len(pending) % size
+            for start in range(0, full, size):
+                self._write_batch(pending[start : start + size])
+            self.records_written += full
+            del pending[:full]
+
+    __call__ = write
+
+    def flush(self) -> None:
+        """Writes any records still waiting for a full batch to the output."""
+        if self._pending:
+            self._write_batch(self._pending)
+            self.records_written += len(self._pending)
+            self._pending = []
+        self._flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._close()
+
+    def __enter__(self) -> "Sink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @abc.abstractmethod
+    def _write_batch(self, records: List[Record]) -> None:
+        """Writes one batch of records to the output."""
+
+    # Optional hooks, so deliberately not abstract.
+    def _flush(self) -> None:  # noqa: B027
+        pass
+
+    def _close(self) -> None:  # noqa: B027
+        pass
+
+
+class NdjsonSink(Sink):
+    """Writes one JSON object per line, each batch with a single write call.
+
+    With ``append`` the records are added to the end of an existing file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        append: bool = False,
+    ):
+        super().__init__(batch_size)
+        mode = "a" if append else "w"
+        self._file = open(path, mode, encoding="utf-8", buffering=buffer_size)
+        self._encode = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode
+
+    def _write_batch(self, records: List[Record]) -> None:
+        encode = self._encode
+        self._file.write("\n".join([encode(record) for record in records]) + "\n")
+
+    def _flush(self) -> None:
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class CsvSink(Sink):
+    """Writes CSV with a header row; columns default to the first record's keys.
+
+    With ``append`` the rows are added to the end of an existing file, whose
+    header is kept and decides the columns.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        fieldnames: Optional[List[str]] = None,
+        append: bool = False,
+    ):
+        super().__init__(batch_size)
+        header = _csv_header(path) if append else None
+        self._file = open(
+            path,
+            "a" if append else "w",
+            encoding="utf-8",
+            newline="",
+            buffering=buffer_size,
+        )
+        self.fieldnames = header or fieldnames
+        self._has_header = header is not None
+        self._writer: Optional[csv.DictWriter] = None
+
+    def _write_batch(self, records: List[Record]) -> None:
+        if self._writer is None:
+            self.fieldnames = self.fieldnames or list(records[0])
+            self._writer = csv.DictWriter(
+                self._file, self.fieldnames, extrasaction="ignore"
+            )
+            if not self._has_header:
+                self._writer.writeheader()
+        self._writer.writerows(records)
+
+    def _flush(self) -> None:
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+def _csv_header(path: str) -> Optional[List[str]]:
+    """The header row of an existing CSV file, or None if there is none."""
+    try:
+        with open(path, encoding="utf-8", newline="") as f:
+            return next(csv.reader(f), None)
+    except FileNotFoundError:
+        return None
+
+
+class SqliteSink(Sink):
+    """Inserts records into a SQLite table, one transaction per batch.
+
+    The table is created from the first record's keys if it does not exist;
+    an existing table is appended to.
+    Each batch is a single ``executemany`` inside one transaction, with the
+    journal in WAL mode and ``synchronous=NORMAL``, which is safe for WAL and
+    avoids an fsync per commit.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        table: str = "records",
+    ):
+        if not _IDENTIFIER.fullmatch(table):
+            raise ValueError(f"Invalid table name: {table!r}")
+        super().__init__(batch_size)
+        self.table = table
+        # Used by one thread at a time, but possibly not the creating one
+        # (see BackgroundSink).
+        self._connection = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._columns: Optional[List[str]] = None
+        self._insert = ""
+
+    def _prepare(self, record: Record) -> None:
+        columns = list(record)
+        invalid = [column for column in columns if not _IDENTIFIER.fullmatch(column)]
+        if invalid:
+            raise ValueError(f"Invalid column name(s): {', '.join(invalid)}")
+        self._columns = columns
+        column_list = ", ".join(columns)
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ({column_list})"  # nosec B608
+        )
+        placeholders = ", ".join("?" * len(columns))
+        self._insert = (
+            f"INSERT INTO {self.table} ({column_list}) VALUES ({placeholders})"  # nosec B608
+        )
+
+    def _write_batch(self, records: List[Record]) -> None:
+        if self._columns is None:
+            self._prepare(records[0])
+        columns = self._columns or []
+        rows = [tuple(record.get(column) for column in columns) for record in records]
+        connection = self._connection
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(self._insert, rows)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _close(self) -> None:
+        self._connection.close()
+
+
+class ArrowSink(Sink):
+    """Writes Parquet or Arrow IPC files (needs the 'perf' extra, pyarrow).
+
+    The schema is inferred from the first batch; each batch becomes one
+    Parquet row group or one IPC record batch.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        file_format: str = "parquet",
+    ):
+        if file_format not in ("parquet", "arrow"):
+            raise ValueError(f"Unknown Arrow file format: {file_format!r}")
+        import pyarrow  # Fails early when the 'perf' extra is missing
+
+        super().__init__(batch_size)
+        self._pyarrow = pyarrow
+        self.path = path
+        self.file_format = file_format
+        self._writer: Any = None
+
+    def _write_batch(self, records: List[Record]) -> None:
+        pa = self._pyarrow
+        if self._writer is None:
+            table = pa.Table.from_pylist(records)
+            if self.file_format == "parquet":
+                import pyarrow.parquet
+
+                self._writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+            else:
+                import pyarrow.ipc
+
+                self._writer = pyarrow.ipc.new_file(self.path, table.schema)
+        else:
+            table = pa.Table.from_pylist(records, schema=self._writer.schema)
+        self._writer.write_table(table)
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+class BackgroundSink(Sink):
+    """Runs another sink on a writer thread so producers overlap with I/O.
+
+    Chunks are handed over through a queue of at most ``max_pending``
+    chunks, so a slow sink applies back-pressure instead of buffering
+    without bound. An error raised by the wrapped sink is kept and re-raised
+    by every later ``write``, ``flush`` or ``close``, so it cannot be lost.
+    """
+
+    def __init__(self, sink: Sink, max_pending: int = 8):
+        super().__init__(batch_size=1)
+        self.sink = sink
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name="BackgroundSink", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            records = self._queue.get()
+            if records is _CLOSED:
+                break
+            if self._error is None:  # After an error, drain without writing
+                try:
+                    if records is _FLUSH:
+                        self.sink.flush()
+                    else:
+                        self.sink.write(records)
+                except BaseException as exc:  # Re-raised in the caller's thread
+                    self._error = exc
+            self._queue.task_done()
+        try:
+            self.sink.close()
+        except BaseException as exc:
+            self._error = self._error or exc
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def write(self, records: Iterable[Record]) -> None:
+        self._raise_error()
+        if self._closed:
+            raise ValueError("Cannot write to a closed sink.")
+        self._write_batch(list(records))
+
+    __call__ = write
+
+    def _write_batch(self, records: List[Record]) -> None:
+        self._queue.put(records)
+        self.records_written += len(records)
+
+    def flush(self) -> None:
+        """Waits until everything written so far has been flushed by the sink."""
+        if not self._closed:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_CLOSED)
+            self._thread.join()
+        self._raise_error()
+
+
+def open_sink(
+    file_format: str,
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    background: bool = False,
+    append: bool = False,
+) -> Sink:
+    """Creates a sink for one of ``SINK_FORMATS`` writing to ``path``.
+
+    With ``append`` an existing output is added to instead of replaced. The
+    ``APPENDABLE_FORMATS`` support this; Parquet and Arrow files are only
+    readable once closed, so they cannot be.
+    """
+    if append and file_format not in APPENDABLE_FORMATS:
+        raise ValueError(f"Cannot append to a {file_format} file.")
+    sink: Sink
+    if file_format == "ndjson":
+        sink = NdjsonSink(path, batch_size, append=append)
+    elif file_format == "csv":
+        sink = CsvSink(path, batch_size, append=append)
+    elif file_format == "sqlite":
+        sink = SqliteSink(path, batch_size)
+    elif file_format in ("parquet", "arrow"):
+        sink = ArrowSink(path, batch_size, file_format)
+    else:
+        raise ValueError(
+            f"Unknown sink format {file_format!r}; expected one of {SINK_FORMATS}."
+        )
+    return BackgroundSink(sink) if background else sink
@@ -0,0 +1,217 @@
+# Concurrent HTTP record sources for the start of a Pipeline
+import asyncio
+import contextlib
+import queue
+import random
+import threading
+from collections import deque
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+
+import httpx
+
+Record = Dict[str, Any]
+Page = List[Record]
+
+# Responses worth retrying: rate limiting and transient server errors.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_DONE = object()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def json_records(response: httpx.Response) -> Page:
+    """Default page parser: the body is a JSON list of records, or an object
+    holding one under ``"records"``."""
+    body = response.json()
+    if isinstance(body, dict):
+        body = body.get("records", [])
+    if not isinstance(body, list):
+        raise ValueError(f"Expected a list of records from {response.url}.")
+    return body
+
+
+class HttpSource:
+    """Fetches pages of records over HTTP, many at a time, in page order.
+
+    All requests share one ``httpx.AsyncClient``, so connections are pooled
+    and reused. At most ``concurrency`` requests are in flight; up to
+    ``prefetch`` pages are fetched ahead of the one being consumed. Failed
+    requests (connection errors and ``RETRY_STATUSES``) are retried up to
+    ``retries`` times with exponential backoff and full jitter, honouring a
+    numeric ``Retry-After`` header. Other HTTP errors are raised.
+
+    Use ``pages()`` from async code. Iterating the source yields records and
+    runs the fetching on a background event loop, so it can be passed
+    straight to ``Pipeline`` while the transform runs concurrently.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        base_url: str = "",
+        concurrency: int = 8,
+        prefetch: Optional[int] = None,
+        retries: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        timeout: float = 10.0,
+        headers: Optional[Mapping[str, str]] = None,
+        parse: Callable[[httpx.Response], Page] = json_records,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("Concurrency must be a positive integer.")
+        if retries < 0:
+            raise ValueError("Retries must not be negative.")
+        self.urls = urls
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.prefetch = max(prefetch or 2 * concurrency, concurrency)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.headers = headers
+        self.parse = parse
+        self.transport = transport
+        self.requests = 0
+        self.retried = 0
+        self.pages_fetched = 0
+
+    def client(self) -> httpx.AsyncClient:
+        """A client whose connection pool matches the concurrency limit."""
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency,
+        )
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=limits,
+            headers=self.headers,
+            transport=self.transport,
+        )
+
+    def _delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None:
+            retry_after = response.headers.get("retry-after", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    async def fetch(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        semaphore: asyncio.Semaphore,
+    ) -> Page:
+        """Fetches and parses one page, retrying transient failures."""
+        for attempt in range(self.retries + 1):
+            response: Optional[httpx.Response] = None
+            error: Optional[httpx.TransportError] = None
+            async with semaphore:  # Released while backing off
+                self.requests += 1
+                try:
+                    response = await client.get(url)
+                except httpx.TransportError as exc:
+                    error = exc
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                response.raise_for_status()
+                self.pages_fetched += 1
+                return self.parse(response)
+            if attempt == self.retries:
+                if response is not None:
+                    response.raise_for_status()
+                assert error is not None  # nosec B101
+                raise error
+            self.retried += 1
+            await asyncio.sleep(self._delay(attempt, response))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def pages(self) -> AsyncIterator[Page]:
+        """Yields each page's records, in the order of ``urls``."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with self.client() as client:
+            urls = iter(self.urls)
+            pending: Deque["asyncio.Task[Page]"] = deque()
+
+            def schedule() -> None:
+                url = next(urls, None)
+                if url is not None:
+                    pending.append(
+                        asyncio.ensure_future(self.fetch(client, url, semaphore))
+                    )
+
+            try:
+                for _ in range(self.prefetch):
+                    schedule()
+                while pending:
+                    page = await pending.popleft()
+                    schedule()  # Keep the window full while the page is consumed
+                    yield page
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def __iter__(self) -> Iterator[Record]:
+        # The event loop runs on its own thread and hands pages over through
+        # a one-slot queue, so fetching continues while the caller works.
+        handoff: "queue.Queue[Any]" = queue.Queue(maxsize=1)
+        started = threading.Event()
+        control: Dict[str, Any] = {}
+
+        async def pump() -> None:
+            control["loop"] = asyncio.get_running_loop()
+            control["task"] = asyncio.current_task()
+            started.set()
+            item: Any = _DONE
+            try:
+                async for page in self.pages():
+                    await asyncio.to_thread(handoff.put, page)
+            except Exception as exc:  # Re-raised in the consuming thread
+                item = _Failure(exc)
+            await asyncio.to_thread(handoff.put, item)
+
+        def run() -> None:
+            with contextlib.suppress(asyncio.CancelledError):
+                asyncio.run(pump())
+
+        thread = threading.Thread(target=run, name="http-source", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = handoff.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield from item
+        finally:
+            # Stops early consumers' fetches; a no-op once the source is done.
+            started.wait()
+            try:
+                control["loop"].call_soon_threadsafe(control["task"].cancel)
+            except RuntimeError:  # The loop has already closed
+                pass
+            while thread.is_alive():
+                try:  # Unblocks a pending hand-off
+                    handoff.get(timeout=0.01)
+                except queue.Empty:
+                    pass
+            thread.join()
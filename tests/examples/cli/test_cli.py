@@ -2,8 +2,10 @@ import re
 import subprocess
 import sys
 
+import pytest
 from typer.testing import CliRunner
 
+from examples import cli
 from examples.cli import app
 
 runner = CliRunner()
@@ -83,3 +85,138 @@ def test_cli_help():
     # Add more assertions as needed, e.g., checking for specific options
     assert "--name" in cleaned_stdout
     assert "--count" in cleaned_stdout
+
+
+def test_parse_fast_args():
+    assert cli.parse_fast_args([]) == {"name": "World", "count": 1}
+    assert cli.parse_fast_args(["--name", "A", "--count=3"]) == {
+        "name": "A",
+        "count": 3,
+    }
+    assert cli.parse_fast_args(["--name=B"]) == {"name": "B", "count": 1}
+    assert cli.parse_fast_args(["--output", "out.txt.gz", "--gzip"]) == {
+        "name": "World",
+        "count": 1,
+        "output": "out.txt.gz",
+        "compress": True,
+    }
+    # Anything unusual is left to Typer.
+    assert cli.parse_fast_args(["--help"]) is None
+    assert cli.parse_fast_args(["--count", "many"]) is None
+    assert cli.parse_fast_args(["--name"]) is None
+
+
+def test_run_fast_path(capsys):
+    cli.run(["--name", "Fast", "--count", "2"])
+    out = capsys.readouterr().out
+    assert "Hello Fast!" in out
+    assert out.count("Core library says: Hello, Fast!") == 2
+
+
+def test_negative_count_prints_no_core_messages(capsys, tmp_path):
+    import io
+
+    cli.run(["--name", "Neg", "--count", "-5"])
+    assert "Core library says" not in capsys.readouterr().out
+    result = runner.invoke(app, ["--name", "Neg", "--count", "-5"])
+    assert result.exit_code == 0
+    assert "Core library says" not in result.stdout
+    stream = io.BytesIO()
+    cli.write_repeated(stream, b"x\n", -5)
+    assert stream.getvalue() == b""
+
+
+def test_run_falls_back_to_typer_for_errors():
+    import pytest
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.run(["--count", "many"])
+    assert excinfo.value.code == 2
+
+
+def test_cli_fast_path_does_not_import_typer():
+    """A plain greeting should not pay for importing typer/click/rich."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "examples/cli.py", "--name", "Quick"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "Hello Quick!" in result.stdout
+    imported = [line.split("|")[-1].strip() for line in result.stderr.splitlines()]
+    assert not [name for name in imported if name.split(".")[0] in ("typer", "click")]
+
+
+def test_cli_batch_mode():
+    result = runner.invoke(
+        app, ["--batch"], input="--name A\n\n--name B --count 2\n--bogus\n"
+    )
+    assert result.exit_code == 1
+    assert "Hello A!" in result.stdout
+    assert result.stdout.count("Core library says: Hello, B!") == 2
+    assert "Skipping invalid command: --bogus" in result.output
+
+
+def test_cli_batch_mode_fast_path():
+    result = subprocess.run(
+        [sys.executable, "examples/cli.py", "--batch"],
+        input="--name A\n--name B\n",
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert "Hello A!" in result.stdout
+    assert "Hello B!" in result.stdout
+
+
+def test_write_repeated_spans_blocks():
+    import io
+
+    stream = io.BytesIO()
+    line = b"x" * 1000 + b"\n"
+    cli.write_repeated(stream, line, 150)
+    assert stream.getvalue() == line * 150
+
+
+def test_greet_writes_to_output_file(tmp_path, capsys):
+    output = tmp_path / "greetings.txt"
+    cli.run(["--name", "File", "--count", "3", "--output", str(output)])
+    out = capsys.readouterr().out
+    assert "Hello File!" in out
+    assert "Core library says" not in out
+    assert "Printed the greeting 3 time(s) for File." in out
+    line = f"Core library says: {cli.get_core_greeting('File')}\n"
+    assert output.read_text() == line * 3
+
+
+def test_greet_writes_gzip_output(tmp_path):
+    import gzip
+
+    output = tmp_path / "greetings.txt"
+    result = runner.invoke(
+        app, ["--name", "Zip", "--count", "2", "--output", str(output), "--gzip"]
+    )
+    assert result.exit_code == 0
+    with gzip.open(output, "rt") as f:
+        assert f.read() == f"Core library says: {cli.get_core_greeting('Zip')}\n" * 2
+
+
+def test_cli_process_file(tmp_path):
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    source.write_text("abc\n\ndef\n")
+    result = runner.invoke(
+        app, ["process-file", str(source), str(target), "--workers", "2"]
+    )
+    assert result.exit_code == 0
+    assert "Hello" not in result.output
+    assert "Processed 3 record(s) (1 rejected)" in result.output
+    assert target.read_text() == "processed_cba\nprocessed_fed\n"
+
+
+def test_run_dispatches_subcommands_to_typer(tmp_path, capsys):
+    source, target = tmp_path / "in.bin", tmp_path / "out.bin"
+    source.write_bytes(b"abcdef")
+    with pytest.raises(SystemExit) as exc_info:
+        cli.run(["process-file", str(source), str(target), "--record-size", "3"])
+    assert exc_info.value.code == 0
+    assert target.read_bytes() == b"processed_cbaprocessed_fed"
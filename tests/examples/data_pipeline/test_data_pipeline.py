@@ -27,8 +27,8 @@ def capture_logs(caplog):
 def test_extract_data():
     """Test the data extraction simulation."""
     # Since it uses random, just check the type and basic structure
-    data = data_pipeline.extract_data()
-    assert isinstance(data, list)
+    data = list(data_pipeline.extract_data())
+    assert len(data) == 10
     if data:
         assert isinstance(data[0], dict)
         assert "id" in data[0]
@@ -57,6 +57,14 @@ def test_transform_data(mock_get_greeting_func):
     mock_get_greeting_func.assert_called_once()
 
 
+def test_extract_data_is_lazy():
+    """Records are generated on demand rather than materialized up front."""
+    records = data_pipeline.extract_data(num_records=1_000_000_000)
+    first = next(records)
+    assert first["id"] == 1
+    records.close()
+
+
 @patch("builtins.print")
 def test_load_data_with_data(mock_print, caplog):
     """Test loading data when data is present."""
@@ -95,3 +103,300 @@ def test_main_pipeline_flow(mock_load, mock_transform, mock_extract, caplog):
 
     assert "ETL Pipeline Started." in caplog.text
     assert "ETL Pipeline Finished." in caplog.text
+
+
+@patch("builtins.print")
+def test_main_streams_records_in_chunks(mock_print, caplog):
+    """main runs the real stages chunk by chunk and logs per-stage statistics."""
+    with patch(
+        "examples.data_pipeline.transform_data", wraps=data_pipeline.transform_data
+    ) as spy_transform:
+        data_pipeline.main(num_records=25, chunk_size=10)
+
+    assert [len(call.args[0]) for call in spy_transform.call_args_list] == [10, 10, 5]
+    assert "Pipeline stats: extract: 25 in, 25 out, 3 chunk(s)" in caplog.text
+    assert "Pipeline stats: transform: 25 in" in caplog.text
+
+
+@patch("builtins.print")
+def test_main_with_parallel_transform(mock_print, caplog):
+    data_pipeline.main(num_records=40, chunk_size=10, workers=2)
+    assert "Pipeline stats: transform: 40 in" in caplog.text
+
+
+@patch("builtins.print")
+def test_main_runs_the_stages_concurrently(mock_print, caplog):
+    data_pipeline.main(num_records=40, chunk_size=10, concurrent=True, queue_size=1)
+    assert "Pipeline stats: extract: 40 in, 40 out, 4 chunk(s)" in caplog.text
+    assert "busy, queue" in caplog.text
+    with pytest.raises(ValueError, match="concurrently"):
+        data_pipeline.main(concurrent=True, state="state.db")
+
+
+@patch("examples.data_pipeline.get_core_greeting", return_value=MOCK_CORE_MESSAGE)
+def test_transform_batch_matches_transform_data(mock_get_greeting_func):
+    pytest.importorskip("numpy")
+    from your_core_library.columnar import RecordBatch
+
+    # transform_data updates records in place, so each side gets fresh copies.
+    def fresh_records():
+        return [
+            {"id": r["id"], "value": r["value"], "category": r["category"]}
+            for r in SAMPLE_RAW_DATA
+        ]
+
+    batch = data_pipeline.transform_batch(RecordBatch.from_records(fresh_records()))
+    records = batch.to_records()
+    expected = data_pipeline.transform_data(fresh_records())
+    assert records == expected
+    assert [list(record) for record in records] == [list(r) for r in expected]
+
+
+@patch("builtins.print")
+def test_main_columnar_mode(mock_print, caplog):
+    pytest.importorskip("numpy")
+    data_pipeline.main(num_records=30, chunk_size=10, columnar=True)
+    assert "Pipeline stats: to_columnar: 30 in, 30 out, 3 chunk(s)" in caplog.text
+    loaded = [call.args[0] for call in mock_print.call_args_list]
+    records = [record for record in loaded if isinstance(record, dict)]
+    assert records and all(record["value"] > 50 for record in records)
+    assert all(record["status"] == "processed" for record in records)
+
+
+def test_parse_args():
+    args = data_pipeline.parse_args(["--records", "100", "--chunk-size", "7"])
+    assert args.records == 100
+    assert args.chunk_size == 7
+    assert args.workers == 1
+    assert args.unordered is False
+
+    args = data_pipeline.parse_args(["--workers", "4", "--unordered"])
+    assert args.workers == 4
+    assert args.unordered is True
+    assert data_pipeline.parse_args(["--columnar"]).columnar is True
+
+    args = data_pipeline.parse_args(["--concurrent", "--queue-size", "4"])
+    assert (args.concurrent, args.queue_size) == (True, 4)
+    for argv in (["--queue-size", "0"], ["--concurrent", "--state", "s.db"]):
+        with pytest.raises(SystemExit):
+            data_pipeline.parse_args(argv)
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_main_writes_to_a_sink(tmp_path, background):
+    import json
+
+    output = tmp_path / "out.ndjson"
+    data_pipeline.main(
+        num_records=50,
+        chunk_size=10,
+        sink="ndjson",
+        output=str(output),
+        sink_batch_size=7,
+        background=background,
+    )
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert records and all(record["value"] > 50 for record in records)
+    assert [record["id"] for record in records] == sorted(r["id"] for r in records)
+
+
+def test_main_columnar_mode_writes_to_a_sink(tmp_path):
+    pytest.importorskip("numpy")
+    import sqlite3
+
+    output = tmp_path / "out.db"
+    data_pipeline.main(
+        num_records=30, chunk_size=10, columnar=True, sink="sqlite", output=str(output)
+    )
+    with sqlite3.connect(output) as connection:
+        values = [row[0] for row in connection.execute("SELECT value FROM records")]
+    assert values and all(value > 50 for value in values)
+
+
+def test_main_columnar_mode_writes_the_same_csv(tmp_path):
+    pytest.importorskip("numpy")
+    import random
+
+    outputs = []
+    for columnar in (False, True):
+        output = tmp_path / f"columnar-{columnar}.csv"
+        random.seed(7)
+        data_pipeline.main(
+            num_records=30,
+            chunk_size=10,
+            columnar=columnar,
+            sink="csv",
+            output=str(output),
+        )
+        outputs.append(output.read_text())
+    assert outputs[0].startswith("id,value,category,status,core_message,")
+    assert outputs[1] == outputs[0]
+
+
+def test_main_sink_requires_output():
+    with pytest.raises(ValueError, match="output path"):
+        data_pipeline.main(sink="csv")
+
+
+def test_parse_args_sink_options(capsys):
+    args = data_pipeline.parse_args(
+        ["--sink", "sqlite", "--output", "out.db", "--sink-batch-size", "500"]
+    )
+    assert (args.sink, args.output, args.sink_batch_size) == ("sqlite", "out.db", 500)
+    assert args.background is False
+    with pytest.raises(SystemExit):
+        data_pipeline.parse_args(["--sink", "csv"])
+    assert "--sink requires --output" in capsys.readouterr().err
+
+
+def test_extract_data_from_start_id():
+    assert [record["id"] for record in data_pipeline.extract_data(5, start_id=4)] == [
+        4,
+        5,
+    ]
+
+
+def test_main_incremental_runs_only_process_new_records(tmp_path, caplog):
+    import json
+
+    state = str(tmp_path / "state.db")
+    output = tmp_path / "out.ndjson"
+    data_pipeline.main(
+        num_records=30, chunk_size=10, sink="ndjson", output=str(output), state=state
+    )
+    first = [json.loads(line)["id"] for line in output.read_text().splitlines()]
+
+    caplog.clear()
+    data_pipeline.main(
+        num_records=45, chunk_size=10, sink="ndjson", output=str(output), state=state
+    )
+    assert "extracting records from id 31" in caplog.text
+    assert "Pipeline stats: extract: 15 in" in caplog.text
+    combined = [json.loads(line)["id"] for line in output.read_text().splitlines()]
+    # The second run appends to the output of the first one.
+    assert combined[: len(first)] == first
+    assert all(record_id > 30 for record_id in combined[len(first) :])
+    assert combined  # Random values: at least one run loads something
+
+    caplog.clear()
+    data_pipeline.main(num_records=45, chunk_size=10, state=state)
+    assert "Pipeline stats: extract: 0 in" in caplog.text
+
+
+def test_main_incremental_reruns_append_to_a_csv_output(tmp_path):
+    import csv
+
+    state = str(tmp_path / "state.db")
+    output = tmp_path / "out.csv"
+    for num_records in (200, 250):
+        data_pipeline.main(
+            num_records=num_records,
+            chunk_size=50,
+            sink="csv",
+            output=str(output),
+            state=state,
+        )
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    ids = [int(row["id"]) for row in rows]
+    assert ids == sorted(set(ids))  # One header, every record loaded once
+    assert any(i <= 200 for i in ids) and any(i > 200 for i in ids)
+    assert all(int(row["value"]) > 50 for row in rows)
+
+
+def test_main_incremental_rejects_sinks_that_cannot_append(tmp_path):
+    with pytest.raises(ValueError, match="append"):
+        data_pipeline.main(
+            sink="parquet", output=str(tmp_path / "out.parquet"), state="state.db"
+        )
+    with pytest.raises(SystemExit):
+        data_pipeline.parse_args(
+            ["--sink", "arrow", "--output", "o.arrow", "--state", "s.db"]
+        )
+
+
+def test_main_incremental_resumes_after_the_last_committed_chunk(tmp_path):
+    from your_core_library.checkpoint import CheckpointStore
+
+    state = str(tmp_path / "state.db")
+    loaded = []
+
+    def failing_load(chunk):
+        if len(loaded) == 2:
+            raise RuntimeError("crash")
+        loaded.append(chunk)
+
+    with patch("examples.data_pipeline.transform_data", side_effect=lambda c: c):
+        with patch("examples.data_pipeline.load_data", side_effect=failing_load):
+            with pytest.raises(RuntimeError, match="crash"):
+                data_pipeline.main(num_records=50, chunk_size=10, state=state)
+    with CheckpointStore(state, pipeline="data_pipeline") as store:
+        assert store.high_water_mark == 20
+
+
+def test_main_incremental_rejects_parallel_transform(tmp_path):
+    with pytest.raises(ValueError, match="workers=1"):
+        data_pipeline.main(workers=2, state=str(tmp_path / "state.db"))
+    with pytest.raises(SystemExit):
+        data_pipeline.parse_args(["--state", "s.db", "--workers", "2"])
+    assert data_pipeline.parse_args(["--state", "s.db"]).state == "s.db"
+
+
+def records_transport():
+    import httpx
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(
+            200,
+            json=[
+                {"id": page * 10 + i, "value": 40 + 5 * i, "category": "A"}
+                for i in range(10)
+            ],
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_extract_http_fetches_every_page():
+    source = data_pipeline.extract_http(
+        "http://test/records?page={page}", 3, transport=records_transport()
+    )
+    assert [record["id"] for record in source] == list(range(10, 40))
+    with pytest.raises(ValueError, match="placeholder"):
+        data_pipeline.extract_http("http://test/records", 3)
+
+
+def test_main_extracts_over_http(tmp_path, monkeypatch):
+    import json
+    from functools import partial
+
+    monkeypatch.setattr(
+        data_pipeline,
+        "HttpSource",
+        partial(data_pipeline.HttpSource, transport=records_transport()),
+    )
+    output = tmp_path / "out.ndjson"
+    data_pipeline.main(
+        source_url="http://test/records?page={page}",
+        pages=4,
+        concurrency=2,
+        chunk_size=7,
+        sink="ndjson",
+        output=str(output),
+    )
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    # Values 55 to 85 pass the value > 50 filter: 7 per page
+    assert len(records) == 28
+    assert [record["id"] for record in records] == sorted(r["id"] for r in records)
+
+
+def test_parse_args_source_options():
+    args = data_pipeline.parse_args(
+        ["--source-url", "http://h/r?page={page}", "--pages", "5", "--concurrency", "3"]
+    )
+    assert (args.source_url, args.pages, args.concurrency) == (
+        "http://h/r?page={page}",
+        5,
+        3,
+    )
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from examples.web.coalesce import MicroBatcher
+from examples.web.coalesce import SingleFlight
+
+
+def test_single_flight_shares_one_computation_per_key():
+    calls = []
+
+    async def compute(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def scenario():
+        flight = SingleFlight()
+        keys = ["a", "a", "b", "a", "b"]
+        results = await asyncio.gather(
+            *(flight.run(key, lambda key=key: compute(key)) for key in keys)
+        )
+        again = await flight.run("a", lambda: compute("a"))  # Nothing in flight
+        return results, again, flight.stats()
+
+    results, again, stats = asyncio.run(scenario())
+    assert results == ["A", "A", "B", "A", "B"]
+    assert again == "A"
+    assert calls == ["a", "b", "a"]
+    assert stats["calls"] == 6
+    assert stats["coalesced"] == 3
+    assert stats["ratio"] == 0.5
+    assert stats["in_flight"] == 0
+
+
+def test_single_flight_shares_errors_and_survives_cancelled_callers():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("bad input")
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def scenario():
+        flight = SingleFlight()
+        errors = await asyncio.gather(
+            flight.run("k", fail), flight.run("k", fail), return_exceptions=True
+        )
+        leader = asyncio.ensure_future(flight.run("s", slow))
+        follower = asyncio.ensure_future(flight.run("s", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return errors, await follower
+
+    errors, result = asyncio.run(scenario())
+    assert [str(error) for error in errors] == ["bad input", "bad input"]
+    assert result == "done"
+
+
+def test_micro_batcher_groups_calls_within_the_window():
+    batches = []
+
+    async def run_batch(items):
+        batches.append(list(items))
+        return [ValueError(item) if item < 0 else item * 10 for item in items]
+
+    async def scenario():
+        batcher = MicroBatcher(run_batch, window=0.005, max_batch=100)
+        results = await asyncio.gather(
+            *(batcher.submit(item) for item in [1, 2, -3, 4]), return_exceptions=True
+        )
+        await batcher.submit(5)
+        return results, batcher.stats()
+
+    results, stats = asyncio.run(scenario())
+    assert results[:2] == [10, 20] and results[3] == 40
+    assert isinstance(results[2], ValueError)
+    assert batches == [[1, 2, -3, 4], [5]]
+    assert stats["items"] == 5
+    assert stats["batches"] == 2
+    assert stats["mean_batch_size"] == 2.5
+    assert 0 < stats["wait_seconds_mean"] <= stats["wait_seconds_max"]
+
+
+def test_micro_batcher_flushes_full_batches_at_once():
+    batches = []
+
+    async def run_batch(items):
+        batches.append(len(items))
+        return items
+
+    async def scenario():
+        # A window this long would time the test out if full batches waited.
+        batcher = MicroBatcher(run_batch, window=60, max_batch=3)
+        return await asyncio.gather(*(batcher.submit(item) for item in range(6)))
+
+    assert asyncio.run(asyncio.wait_for(scenario(), 5)) == list(range(6))
+    assert batches == [3, 3]
+
+
+def test_micro_batcher_batch_failures_reach_every_caller():
+    async def broken(items):
+        raise RuntimeError("pool is down")
+
+    async def short(items):
+        return items[:1]
+
+    async def scenario(run_batch):
+        batcher = MicroBatcher(run_batch, window=0.001)
+        return await asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+
+    assert [str(e) for e in asyncio.run(scenario(broken))] == ["pool is down"] * 2
+    assert all(isinstance(e, RuntimeError) for e in asyncio.run(scenario(short)))
+    with pytest.raises(ValueError, match="max_batch"):
+        MicroBatcher(short, max_batch=0)
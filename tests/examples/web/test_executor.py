@@ -0,0 +1,76 @@
+import asyncio
+import threading
+
+import pytest
+
+from examples.web.executor import ExecutorBusyError
+from examples.web.executor import WorkExecutor
+from your_core_library.data_handler import DataHandler
+
+
+def test_thread_executor_runs_work_and_records_stats():
+    executor = WorkExecutor(mode="thread", max_workers=2, max_queue=2)
+    try:
+        result = asyncio.run(executor.run(DataHandler().process, "abc"))
+        assert result == "processed_cba"
+        stats = executor.stats()
+        assert stats["mode"] == "thread"
+        assert stats["submitted"] == 1
+        assert stats["completed"] == 1
+        assert stats["in_flight"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["execution_seconds_total"] >= 0
+    finally:
+        executor.shutdown()
+
+
+def test_executor_propagates_errors():
+    executor = WorkExecutor(max_workers=1, max_queue=0)
+    try:
+        with pytest.raises(ValueError, match="Simulated processing error"):
+            asyncio.run(executor.run(DataHandler().process, "error"))
+        assert executor.stats()["failed"] == 1
+    finally:
+        executor.shutdown()
+
+
+def test_executor_rejects_when_queue_is_full():
+    executor = WorkExecutor(max_workers=1, max_queue=0)
+    release = threading.Event()
+
+    async def scenario():
+        blocked = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+        assert executor.saturated
+        assert executor.stats()["in_flight"] == 1
+        with pytest.raises(ExecutorBusyError):
+            await executor.run(str, 1)
+        waiting = asyncio.ensure_future(executor.run(str, 1, wait=True))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+        release.set()
+        assert await blocked is True
+        assert await waiting == "1"
+
+    try:
+        asyncio.run(scenario())
+        assert executor.stats()["rejected"] == 1
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_process_executor_runs_work():
+    executor = WorkExecutor(mode="process", max_workers=1, max_queue=1)
+    try:
+        result = asyncio.run(executor.run(DataHandler().process, "xyz"))
+        assert result == "processed_zyx"
+    finally:
+        executor.shutdown()
+
+
+def test_executor_rejects_invalid_configuration():
+    with pytest.raises(ValueError, match="Executor mode"):
+        WorkExecutor(mode="fiber")
+    with pytest.raises(ValueError, match="max_workers"):
+        WorkExecutor(max_workers=0)
@@ -0,0 +1,78 @@
+import json
+import logging
+
+import pytest
+
+from examples.web.logging_config import REQUEST_LOGGER_NAME
+from examples.web.logging_config import JsonFormatter
+from examples.web.logging_config import SamplingFilter
+from examples.web.logging_config import init_logging
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    yield
+    init_logging("INFO")
+
+
+def _record(level=logging.INFO, msg="hello %s", args=("world",)):
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+def test_json_formatter_emits_one_object_per_record():
+    entry = json.loads(JsonFormatter().format(_record()))
+    assert entry["message"] == "hello world"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "test"
+    assert "timestamp" in entry
+
+
+def test_json_formatter_includes_exceptions():
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        import sys
+
+        record = logging.LogRecord(
+            "test", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+        )
+    assert (
+        "RuntimeError: boom" in json.loads(JsonFormatter().format(record))["exception"]
+    )
+
+
+def test_sampling_filter_keeps_rate_and_all_warnings():
+    sampler = SamplingFilter(0.25)
+    kept = sum(sampler.filter(_record()) for _ in range(100))
+    assert kept == 25
+    assert all(sampler.filter(_record(logging.WARNING)) for _ in range(10))
+
+
+def test_sampling_filter_rejects_bad_rate():
+    with pytest.raises(ValueError):
+        SamplingFilter(1.5)
+
+
+def test_init_logging_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        init_logging("INFO", log_format="xml")
+
+
+def test_async_json_logging_writes_through_listener(capsys):
+    listener = init_logging(
+        "INFO", log_format="json", async_mode=True, request_sample_rate=0.5
+    )
+    assert listener is not None
+    for i in range(4):
+        logging.getLogger(REQUEST_LOGGER_NAME).info("request %d", i)
+    logging.getLogger(REQUEST_LOGGER_NAME).warning("slow request")
+    listener.stop()
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    messages = [line["message"] for line in lines]
+    assert messages[0].startswith("Logging initialized")
+    assert messages[1:] == ["request 1", "request 3", "slow request"]
+
+
+def test_sync_logging_returns_no_listener():
+    assert init_logging("INFO") is None
+    assert not logging.getLogger(REQUEST_LOGGER_NAME).filters
@@ -69,6 +69,206 @@ def test_read_item_fastapi(client):
     assert response.json() == expected_response
 
 
+def _ndjson_lines(response):
+    import json
+
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_process_endpoint(client):
+    response = client.post("/process/", json={"data": "abc"})
+    assert response.status_code == 200
+    assert response.json() == {"data": "processed_cba"}
+
+
+def test_process_endpoint_value_error(client):
+    response = client.post("/process/", json={"data": "an error"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Simulated processing error based on input."}
+
+
+def test_process_batch_json_array(client):
+    response = client.post(
+        "/process/batch",
+        json=[{"data": "abc"}, {"data": "error"}, {"nope": 1}, {"data": ""}],
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert _ndjson_lines(response) == [
+        {"index": 0, "data": "processed_cba"},
+        {"index": 1, "error": "Simulated processing error based on input."},
+        {
+            "index": 2,
+            "error": "Record must be a JSON object with a string 'data' field.",
+        },
+        {"index": 3, "error": "Input data cannot be empty."},
+    ]
+
+
+def test_process_batch_ndjson_stream(client, monkeypatch):
+    from examples.web.config import settings
+
+    monkeypatch.setattr(settings, "PROCESS_BATCH_CHUNK_SIZE", 2)
+
+    def body():
+        yield b'{"data": "one"}\n{"da'
+        yield b'ta": "two"}\n\nnot json\n'
+        yield b'{"data": "three"}'
+
+    response = client.post(
+        "/process/batch",
+        content=body(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert _ndjson_lines(response) == [
+        {"index": 0, "data": "processed_eno"},
+        {"index": 1, "data": "processed_owt"},
+        {"index": 2, "error": "Invalid JSON."},
+        {"index": 3, "data": "processed_eerht"},
+    ]
+
+
+def test_process_batch_ndjson_reports_overlong_lines(client, monkeypatch):
+    from examples.web.config import settings
+
+    monkeypatch.setattr(settings, "PROCESS_BATCH_MAX_LINE_BYTES", 20)
+
+    def body():
+        yield b'{"data": "one"}\n{"data": "'
+        yield b"x" * 50
+        yield b"x" * 50
+        yield b'"}\n{"data": "two"}\n{"data": "' + b"y" * 30 + b'"}\n'
+        yield b'{"data": "' + b"z" * 30
+
+    response = client.post(
+        "/process/batch",
+        content=body(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    too_long = "Line is longer than 20 bytes."
+    assert _ndjson_lines(response) == [
+        {"index": 0, "data": "processed_eno"},
+        {"index": 1, "error": too_long},
+        {"index": 2, "data": "processed_owt"},
+        {"index": 3, "error": too_long},
+        {"index": 4, "error": too_long},
+    ]
+
+
+def test_process_batch_rejects_non_array_body(client):
+    response = client.post("/process/batch", json={"data": "abc"})
+    assert response.status_code == 400
+
+    response = client.post(
+        "/process/batch",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 400
+
+
+class _SaturatedExecutor:
+    saturated = True
+
+    async def run(self, *args, **kwargs):
+        from examples.web.executor import ExecutorBusyError
+
+        raise ExecutorBusyError("Work queue is full, try again later.")
+
+
+def test_process_endpoints_return_503_when_executor_is_full(client, monkeypatch):
+    monkeypatch.setattr(client.app.state, "executor", _SaturatedExecutor())
+
+    response = client.post("/process/", json={"data": "abc"})
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+    response = client.post("/process/batch", json=[{"data": "abc"}])
+    assert response.status_code == 503
+
+
+def test_executor_stats_endpoint(client):
+    client.post("/process/", json={"data": "abc"})
+    response = client.get("/executor/stats")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["mode"] == "thread"
+    assert stats["completed"] >= 1
+    assert "queue_depth" in stats
+
+
+def test_cache_stats_disabled_by_default(client):
+    assert client.get("/cache/stats").json() == {"enabled": False}
+
+
+def test_process_endpoint_uses_result_cache(monkeypatch):
+    from examples.web.config import settings
+
+    monkeypatch.setattr(settings, "PROCESS_CACHE_ENABLED", True)
+    with TestClient(fastapi_app) as cached_client:
+        for _ in range(2):
+            assert cached_client.post("/process/", json={"data": "abc"}).json() == {
+                "data": "processed_cba"
+            }
+            response = cached_client.post("/process/", json={"data": "error"})
+            assert response.status_code == 400
+        stats = cached_client.get("/cache/stats").json()
+    assert stats["enabled"] is True
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_metrics_endpoint(monkeypatch):
+    from examples.web.config import settings
+    from your_core_library import instrumentation
+
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    try:
+        with TestClient(fastapi_app) as metrics_client:
+            metrics_client.post("/process/", json={"data": "abc"})
+            metrics_client.get("/core_greet")
+            response = metrics_client.get("/metrics")
+    finally:
+        instrumentation.enable(False)
+        instrumentation.reset()
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "your_core_library_data_handler_process_seconds_count 1" in response.text
+    assert "your_core_library_get_core_greeting_seconds_count 1" in response.text
+    assert "your_core_library_executor_max_workers" in response.text
+    assert "# TYPE your_core_library_executor_submitted_total counter" in response.text
+    assert "# TYPE your_core_library_executor_wait_seconds_total counter" in (
+        response.text
+    )
+
+
+def test_profile_endpoint_disabled_by_default(client):
+    assert client.get("/debug/profile", params={"seconds": 0.01}).status_code == 404
+
+
+@pytest.mark.parametrize(
+    ("mode", "expected"),
+    [("sample", "test_profile_endpoint"), ("cprofile", "function calls")],
+)
+def test_profile_endpoint(client, monkeypatch, mode, expected):
+    from examples.web.config import settings
+
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    response = client.get("/debug/profile", params={"seconds": 0.05, "mode": mode})
+    assert response.status_code == 200
+    assert expected in response.text
+
+
+def test_profile_endpoint_rejects_unknown_mode(client, monkeypatch):
+    from examples.web.config import settings
+
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    response = client.get("/debug/profile", params={"seconds": 0.01, "mode": "x"})
+    assert response.status_code == 400
+
+
 def test_init_logging_debug_level():
     """Test that init_logging can be called with DEBUG level."""
     from examples.web.logging_config import init_logging
@@ -81,3 +281,110 @@ def test_init_logging_debug_level():
     import logging
 
     assert logging.getLogger().getEffectiveLevel() == logging.DEBUG
+
+
+def test_response_cache_serves_get_routes(monkeypatch):
+    from examples.web.config import settings
+
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+    with TestClient(fastapi_app) as cached_client:
+        first = cached_client.get("/items/7")
+        second = cached_client.get(
+            "/items/7", headers={"If-None-Match": first.headers["etag"]}
+        )
+        assert first.headers["x-cache"] == "MISS"
+        assert second.status_code == 304
+        assert "x-cache" not in cached_client.get("/").headers
+        response = cached_client.get("/metrics")
+    assert "your_core_library_response_cache_hit_ratio 0.5" in response.text
+    assert "your_core_library_response_cache_not_modified_total 1" in response.text
+
+
+def test_response_cache_disabled_by_default():
+    with TestClient(fastapi_app) as fresh_client:  # Reruns the lifespan
+        assert "x-cache" not in fresh_client.get("/items/7").headers
+
+
+@pytest.mark.parametrize("window_ms", [0.0, 50.0])
+def test_process_endpoint_coalesces_concurrent_requests(monkeypatch, window_ms):
+    import asyncio
+
+    import httpx
+
+    from examples.web.config import settings
+    from examples.web.main import _app_counters
+    from examples.web.main import _app_gauges
+
+    monkeypatch.setattr(settings, "COALESCE_ENABLED", True)
+    monkeypatch.setattr(settings, "COALESCE_BATCH_WINDOW_MS", window_ms)
+    payloads = ["abc"] * 5 + ["xyz", "error", ""]
+
+    async def scenario():
+        async with fastapi_app.router.lifespan_context(fastapi_app):
+            transport = httpx.ASGITransport(app=fastapi_app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                responses = await asyncio.gather(
+                    *(client.post("/process/", json={"data": d}) for d in payloads)
+                )
+                metrics = await client.get("/metrics")
+            state = fastapi_app.state
+            return responses, _app_gauges(state), _app_counters(state), metrics.text
+
+    responses, gauges, counters, metrics = asyncio.run(scenario())
+    assert [r.json()["data"] for r in responses[:6]] == ["processed_cba"] * 5 + [
+        "processed_zyx"
+    ]
+    assert [r.status_code for r in responses[6:]] == [400, 400]
+    assert counters["coalesce_calls"] == 8
+    assert counters["coalesce_coalesced"] == 4
+    assert gauges["coalesce_ratio"] == 0.5
+    assert "coalesce_calls" not in gauges
+    assert "# TYPE your_core_library_coalesce_calls_total counter" in metrics
+    assert "# TYPE your_core_library_coalesce_ratio gauge" in metrics
+    if window_ms:
+        assert counters["microbatch_items"] == 4
+        assert counters["microbatch_batches"] == 1
+        assert gauges["microbatch_wait_seconds_max"] > 0
+    else:
+        assert "microbatch_items" not in counters
+
+
+@pytest.mark.parametrize("process_cache", [False, True])
+def test_process_endpoint_applies_hot_reloaded_rules(
+    monkeypatch, tmp_path, process_cache
+):
+    import json
+    import os
+
+    from examples.web.config import settings
+    from examples.web.main import _app_counters
+    from examples.web.main import _app_gauges
+
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text(
+        json.dumps({"patterns": [{"name": "a", "pattern": "alpha", "message": "A"}]})
+    )
+    monkeypatch.setattr(settings, "RULES_FILE", str(rules_file))
+    monkeypatch.setattr(settings, "RULES_RELOAD_SECONDS", 0.0)
+    monkeypatch.setattr(settings, "PROCESS_CACHE_ENABLED", process_cache)
+    # Built by the lifespan of the module's client, which is still running
+    monkeypatch.delattr(fastapi_app.state, "data_handler", raising=False)
+    with TestClient(fastapi_app) as rules_client:
+        response = rules_client.post("/process/", json={"data": "alpha"})
+        assert (response.status_code, response.json()["detail"]) == (400, "A")
+        assert rules_client.post("/process/", json={"data": "error"}).status_code == 200
+        assert rules_client.post("/process/", json={"data": "beta"}).status_code == 200
+
+        rules_file.write_text(
+            json.dumps({"patterns": [{"name": "b", "pattern": "beta", "message": "B"}]})
+        )
+        os.utime(rules_file, ns=(0, 10**18))
+        assert rules_client.post("/process/", json={"data": "alpha"}).status_code == 200
+        assert rules_client.post("/process/", json={"data": "beta"}).status_code == 400
+        assert rules_client.post("/process/", json={"data": "xbeta"}).status_code == 400
+        gauges = _app_gauges(fastapi_app.state)
+        counters = _app_counters(fastapi_app.state)
+    assert gauges["rules_loaded"] == 1
+    assert counters["rules_reloads"] == 1
@@ -0,0 +1,124 @@
+import pytest
+from fastapi import FastAPI
+from fastapi import Response
+from fastapi.testclient import TestClient
+
+from examples.web.response_cache import ResponseCache
+from examples.web.response_cache import ResponseCacheMiddleware
+from your_core_library.cache import ResultCache
+
+
+def make_client(ttls, key="path_query", max_entries=100):
+    app = FastAPI()
+    app.add_middleware(ResponseCacheMiddleware)
+    calls = {"count": 0}
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int, q: str = ""):
+        calls["count"] += 1
+        return {"item_id": item_id, "q": q, "call": calls["count"]}
+
+    @app.get("/cookie")
+    async def cookie(response: Response):
+        calls["count"] += 1
+        response.set_cookie("session", "abc")
+        return {"call": calls["count"]}
+
+    @app.get("/missing")
+    async def missing():
+        calls["count"] += 1
+        return Response(status_code=404)
+
+    app.state.response_cache = ResponseCache(
+        ResultCache(max_entries=max_entries), ttls, key=key
+    )
+    return TestClient(app), app.state.response_cache, calls
+
+
+def test_get_responses_are_cached_with_an_etag():
+    client, cache, calls = make_client({"/items/": 60})
+    first = client.get("/items/1")
+    second = client.get("/items/1")
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json() == {"item_id": 1, "q": "", "call": 1}
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["cache-control"] == "max-age=60"
+    assert int(second.headers["content-length"]) == len(second.content)
+    assert calls["count"] == 1
+    assert cache.stats()["hit_ratio"] == 0.5
+
+
+def test_if_none_match_returns_304_without_a_body():
+    client, cache, _ = make_client({"/items/": 60})
+    etag = client.get("/items/1").headers["etag"]
+    response = client.get("/items/1", headers={"If-None-Match": f'"x", W/{etag}'})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert client.get("/items/1", headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get("/items/1", headers={"If-None-Match": '"x"'}).status_code == 200
+    assert cache.stats()["not_modified"] == 2
+
+
+def test_query_strings_are_normalized_into_the_key():
+    client, _, calls = make_client({"/items/": 60})
+    client.get("/items/1?q=a&x=1")
+    assert client.get("/items/1?x=1&q=a").headers["x-cache"] == "HIT"
+    assert client.get("/items/1?q=b").json()["q"] == "b"
+    assert calls["count"] == 2
+
+
+def test_path_key_ignores_the_query():
+    client, _, calls = make_client({"/items/": 60}, key="path")
+    client.get("/items/1?q=a")
+    assert client.get("/items/1?q=b").json()["q"] == "a"
+    assert calls["count"] == 1
+    with pytest.raises(ValueError, match="key"):
+        ResponseCache(ResultCache(), {}, key="header")
+
+
+def test_uncacheable_requests_pass_through():
+    client, cache, calls = make_client({"/cookie": 60, "/missing": 60})
+    for _ in range(2):
+        assert "session" in client.get("/cookie").cookies
+        assert client.get("/missing").status_code == 404
+    assert calls["count"] == 4
+    assert cache.stats()["entries"] == 0
+    client.get("/items/1")  # No TTL configured for /items/
+    assert "x-cache" not in client.get("/items/1").headers
+
+
+def test_no_cache_request_refreshes_the_entry():
+    client, cache, calls = make_client({"/items/": 60})
+    client.get("/items/1")
+    response = client.get("/items/1", headers={"Cache-Control": "no-cache"})
+    assert response.json()["call"] == 2
+    assert client.get("/items/1").json()["call"] == 2
+    assert cache.stats()["bypassed"] == 1
+
+
+def test_head_requests_use_cached_get_responses():
+    client, _, _ = make_client({"/items/": 60})
+    client.get("/items/1")
+    response = client.head("/items/1")
+    assert response.status_code == 200
+    assert response.headers["x-cache"] == "HIT"
+    assert response.content == b""
+
+
+def test_lru_eviction_bounds_the_cache():
+    client, cache, _ = make_client({"/items/": 60}, max_entries=2)
+    for item_id in range(5):
+        client.get(f"/items/{item_id}")
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 3
+
+
+def test_longest_prefix_wins():
+    cache = ResponseCache(ResultCache(), {"/a/": 1, "/a/b/": 2, "/c": 3})
+    assert cache.ttl_for("/a/b/c") == 2
+    assert cache.ttl_for("/a/x") == 1
+    assert cache.ttl_for("/c") == 3
+    assert cache.ttl_for("/c/d") is None
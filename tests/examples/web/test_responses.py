@@ -0,0 +1,53 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from examples.web import responses
+from examples.web.main import app as fastapi_app
+
+CONTENT = {"data": "processed_cbä", "n": 1, "x": [1.5, None, True], "nested": {}}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(responses, "_orjson", lambda: None)
+    return request.param
+
+
+def test_dumps_is_compact_json(backend):
+    encoded = responses.dumps(CONTENT)
+    assert json.loads(encoded) == CONTENT
+    assert b", " not in encoded
+    assert "ä".encode() in encoded
+
+
+def test_fast_json_response(backend):
+    response = responses.FastJSONResponse(CONTENT, status_code=201)
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == CONTENT
+
+
+def test_fast_json_mode_keeps_responses_identical(monkeypatch):
+    from examples.web.config import settings
+
+    requests = [
+        ("POST", "/process/", {"data": "abc"}),
+        ("POST", "/process/", {"data": "error"}),
+        ("GET", "/items/5", None),
+        ("GET", "/core_greet?name=Fast", None),
+        ("GET", "/health", None),
+    ]
+    results = {}
+    for fast in (False, True):
+        monkeypatch.setattr(settings, "FAST_JSON", fast)
+        with TestClient(fastapi_app) as client:
+            results[fast] = [
+                (r.status_code, r.json())
+                for r in (client.request(m, p, json=b) for m, p, b in requests)
+            ]
+    assert results[True] == results[False]
@@ -0,0 +1,115 @@
+import asyncio
+import gc
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import FastAPI
+
+from examples.web import server
+from examples.web.config import Settings
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_private_memory_excludes_pages_shared_with_the_parent():
+    shared = bytes(range(256)) * (1 << 18)  # 64 MiB, untouched by the child
+    baseline = server.private_memory_bytes()
+    assert 0 < baseline < 1 << 40
+    reader, writer = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        os.write(writer, str(server.private_memory_bytes()).encode())
+        os._exit(0)
+    os.close(writer)
+    child = int(os.read(reader, 64))
+    os.close(reader)
+    os.waitpid(pid, 0)
+    assert shared and child < baseline - (32 << 20)
+
+
+def test_recycling_server_exits_above_the_memory_limit():
+    config = uvicorn.Config(FastAPI())
+    assert asyncio.run(server.RecyclingServer(config, 1).on_tick(10)) is True
+    assert asyncio.run(server.RecyclingServer(config, 1).on_tick(3)) is False
+    assert asyncio.run(server.RecyclingServer(config, 1 << 50).on_tick(10)) is False
+    assert asyncio.run(server.RecyclingServer(config).on_tick(10)) is False
+
+
+def test_worker_config_uses_the_recycling_settings():
+    settings = Settings(SERVER_MAX_REQUESTS=100, SERVER_MAX_REQUESTS_JITTER=10)
+    limits = {
+        server.worker_config(FastAPI(), settings).limit_max_requests for _ in range(200)
+    }
+    assert limits <= set(range(100, 111)) and len(limits) > 1
+    assert server.worker_config(FastAPI(), settings).lifespan == "on"
+    settings = Settings(SERVER_MAX_REQUESTS=100, SERVER_MAX_REQUESTS_JITTER=0)
+    assert server.worker_config(FastAPI(), settings).limit_max_requests == 100
+    assert server.worker_config(FastAPI(), Settings()).limit_max_requests is None
+
+
+def test_preload_builds_shared_state_and_freezes_it():
+    app = FastAPI()
+    try:
+        server.preload(app)
+        assert app.state.data_handler.process("abc") == "processed_cba"
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_server_recycles_workers_and_stops_gracefully():
+    port = free_port()
+    env = {
+        **os.environ,
+        "LOG_LEVEL": "info",  # Lowercase, as in .env.example
+        "SERVER_MAX_REQUESTS_JITTER": "0",
+    }
+    process = subprocess.Popen(  # nosec B603
+        [
+            sys.executable,
+            "-m",
+            "examples.web.server",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            "2",
+            "--max-requests",
+            "3",
+        ],
+        env=env,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        statuses = []
+        deadline = time.monotonic() + 30
+        while len(statuses) < 12 and time.monotonic() < deadline:
+            try:  # A new connection per request, as keep-alive pins a worker
+                response = httpx.get(f"http://127.0.0.1:{port}/health", timeout=5)
+            except httpx.TransportError:
+                time.sleep(0.1)
+                continue
+            statuses.append(response.status_code)
+        assert statuses == [200] * 12
+    finally:
+        process.send_signal(signal.SIGTERM)
+        _, stderr = process.communicate(timeout=30)
+    assert process.returncode == 0
+    assert "Maximum request limit of 3 exceeded" in stderr
+    assert "replacing it" in stderr
+    assert "Stopping 2 worker(s)." in stderr
@@ -0,0 +1,159 @@
+import threading
+
+import pytest
+
+from your_core_library.cache import CachedDataHandler
+from your_core_library.cache import ResultCache
+from your_core_library.data_handler import DataHandler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingHandler(DataHandler):
+    def __init__(self):
+        self.calls = 0
+
+    def process(self, data: str) -> str:
+        self.calls += 1
+        return super().process(data)
+
+
+def test_lru_evicts_least_recently_used_entry():
+    cache = ResultCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.hits == 3
+    assert stats.misses == 1
+    assert stats.hit_ratio == pytest.approx(0.75)
+
+
+def test_cache_is_bounded_by_bytes():
+    cache = ResultCache(max_entries=100, max_bytes=100)
+    cache.put("a", "x", size=60)
+    cache.put("b", "y", size=60)
+    assert len(cache) == 1
+    assert cache.get("a") is None
+    assert cache.stats().bytes == 60
+    assert cache.put("huge", "z", size=101) is False
+
+
+def test_ttl_expires_entries():
+    clock = FakeClock()
+    cache = ResultCache(ttl=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2, ttl=100)
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.stats().expirations == 1
+
+
+def test_tinylfu_keeps_frequently_used_entries():
+    cache = ResultCache(max_entries=2, policy="tinylfu")
+    for key in ("hot", "warm"):
+        cache.put(key, key)
+        for _ in range(5):
+            cache.get(key)
+    # A one-off key is not admitted over entries that are used more often.
+    cache.get("cold")
+    assert cache.put("cold", "cold") is False
+    assert cache.get("hot") == "hot"
+    assert cache.get("warm") == "warm"
+    assert cache.stats().rejections == 1
+
+    # Once it has been requested more often than the victim, it is admitted.
+    for _ in range(10):
+        cache.get("cold")
+    assert cache.put("cold", "cold") is True
+    assert cache.get("cold") == "cold"
+
+
+def test_cache_rejects_invalid_configuration():
+    with pytest.raises(ValueError, match="Cache policy"):
+        ResultCache(policy="fifo")
+    with pytest.raises(ValueError, match="positive"):
+        ResultCache(max_entries=0)
+
+
+def test_clear_empties_cache():
+    cache = ResultCache()
+    cache.put("a", 1)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats().bytes == 0
+
+
+def test_cached_handler_memoizes_results():
+    inner = CountingHandler()
+    handler = CachedDataHandler(inner)
+    assert handler.process("abc") == "processed_cba"
+    assert handler.process("abc") == "processed_cba"
+    assert inner.calls == 1
+    # Uncached methods are passed through to the wrapped handler.
+    assert handler.another_method(11) is True
+
+
+def test_cached_handler_caches_value_errors():
+    inner = CountingHandler()
+    handler = CachedDataHandler(inner)
+    for _ in range(3):
+        with pytest.raises(ValueError, match="Simulated processing error"):
+            handler.process("error")
+    assert inner.calls == 1
+
+
+def test_cached_handler_can_skip_caching_errors():
+    inner = CountingHandler()
+    handler = CachedDataHandler(inner, cache_errors=False)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            handler.process("error")
+    assert inner.calls == 2
+
+
+def test_cached_handler_forgets_outcomes_when_the_rules_change():
+    from your_core_library.rules import PatternRule
+    from your_core_library.rules import RuleSet
+
+    inner = DataHandler(rules=RuleSet([PatternRule("foo", "foo", "no foo")]))
+    handler = CachedDataHandler(inner)
+    with pytest.raises(ValueError, match="no foo"):
+        handler.process("foo")
+    assert handler.process("bar") == "processed_rab"
+
+    inner.rules = RuleSet([PatternRule("bar", "bar", "no bar")])
+    assert handler.process("foo") == "processed_oof"
+    with pytest.raises(ValueError, match="no bar"):
+        handler.process("bar")
+
+
+def test_cache_is_thread_safe():
+    cache = ResultCache(max_entries=50, policy="tinylfu")
+
+    def worker(offset):
+        for i in range(2000):
+            key = (offset + i) % 80
+            if cache.get(key) is None:
+                cache.put(key, key)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats.entries == len(cache) <= 50
+    assert stats.hits + stats.misses == 8000
@@ -0,0 +1,61 @@
+import pytest
+
+from your_core_library.checkpoint import CheckpointStore
+from your_core_library.checkpoint import record_hash
+
+
+def records(ids, value=1):
+    return [{"id": i, "value": value} for i in ids]
+
+
+def test_record_hash_ignores_key_order():
+    assert record_hash({"a": 1, "b": 2}) == record_hash({"b": 2, "a": 1})
+    assert record_hash({"a": 1}) != record_hash({"a": 2})
+    assert len(record_hash({})) == 16
+
+
+def test_select_and_commit_persist_across_stores(tmp_path):
+    path = str(tmp_path / "state.db")
+    with CheckpointStore(path, pipeline="p") as store:
+        assert store.high_water_mark is None
+        assert store.select(records(range(1, 6))) == records(range(1, 6))
+        store.commit()
+        assert store.high_water_mark == 5
+
+    with CheckpointStore(path, pipeline="p") as store:
+        assert store.high_water_mark == 5
+        batch = records(range(1, 6)) + records([6, 7])
+        batch[2]["value"] = 99  # id 3 changed
+        assert [record["id"] for record in store.select(batch)] == [3, 6, 7]
+        store.commit()
+        assert store.high_water_mark == 7
+        assert store.select(batch) == []
+
+    with CheckpointStore(path, pipeline="other") as store:  # Separate state
+        assert store.high_water_mark is None
+
+
+def test_uncommitted_selections_are_not_persisted(tmp_path):
+    path = str(tmp_path / "state.db")
+    with CheckpointStore(path) as store:
+        store.select(records([1, 2]))
+        store.commit()
+        store.select(records([3, 4]))  # Simulates a crash before the commit
+    with CheckpointStore(path) as store:
+        assert store.high_water_mark == 2
+        assert len(store.select(records([1, 2, 3, 4]))) == 2
+
+
+def test_select_looks_up_many_ids_in_batches(tmp_path):
+    with CheckpointStore(str(tmp_path / "state.db")) as store:
+        store.select(records(range(2000)))
+        store.commit()
+        store.commit()  # Nothing staged: a no-op
+        assert store.select(records(range(2000))) == []
+        assert len(store.select(records(range(2000), value=2))) == 2000
+
+
+def test_select_requires_the_key(tmp_path):
+    with CheckpointStore(str(tmp_path / "state.db"), key="uid") as store:
+        with pytest.raises(KeyError):
+            store.select(records([1]))
@@ -0,0 +1,54 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from your_core_library.columnar import RecordBatch  # noqa: E402
+
+RECORDS = [
+    {"id": 1, "value": 60, "category": "A"},
+    {"id": 2, "value": 30, "category": "B"},
+    {"id": 3, "value": 90, "category": "A"},
+]
+
+
+def test_from_records_encodes_columns():
+    batch = RecordBatch.from_records(RECORDS)
+    assert len(batch) == 3
+    assert batch.columns["value"].dtype.kind == "i"
+    assert batch.columns["category"].dtype == np.uint8
+    assert batch.dictionaries["category"].tolist() == ["A", "B"]
+    assert batch["category"].tolist() == ["A", "B", "A"]
+    assert batch.names == ["id", "value", "category"]
+
+
+def test_round_trip_to_records():
+    assert RecordBatch.from_records(RECORDS).to_records() == RECORDS
+
+
+def test_filter_and_derived_columns():
+    batch = RecordBatch.from_records(RECORDS)
+    kept = batch.filter(batch["value"] > 50).with_constant("status", "processed")
+    kept = kept.with_column("double", kept["value"] * 2)
+    records = kept.to_records()
+    assert [record["id"] for record in records] == [1, 3]
+    assert [record["double"] for record in records] == [120, 180]
+    # Constant columns share one object across all records.
+    assert records[0]["status"] is records[1]["status"]
+    assert kept["status"].tolist() == ["processed", "processed"]
+
+
+def test_records_keep_the_order_columns_were_added_in():
+    batch = RecordBatch.from_records(RECORDS).with_constant("status", "ok")
+    batch = batch.with_column("double", batch["value"] * 2).with_constant("tag", 1)
+    assert batch.names == ["id", "value", "category", "status", "double", "tag"]
+    assert all(list(record) == batch.names for record in batch.to_records())
+
+
+def test_empty_batch_and_errors():
+    empty = RecordBatch.from_records([])
+    assert len(empty) == 0
+    assert empty.to_records() == []
+    with pytest.raises(KeyError):
+        empty["missing"]
+    with pytest.raises(ValueError, match="same length"):
+        RecordBatch({"a": np.arange(2), "b": np.arange(3)})
@@ -1,5 +1,6 @@
 import pytest
 
+from your_core_library.data_handler import BatchResult
 from your_core_library.data_handler import DataHandler
 from your_core_library.data_handler import ExampleModel
 
@@ -58,4 +59,158 @@ def test_example_model_repr():
     assert repr(model) == expected_repr
 
 
+def test_process_batch_matches_process(handler):
+    items = ["abc", "Hello World", "x"]
+    batch = handler.process_batch(items)
+    assert batch.results == [handler.process(item) for item in items]
+    assert batch.errors == [None, None, None]
+    assert batch.ok
+    assert len(batch) == 3
+
+
+def test_batch_result_equality_and_repr(handler):
+    batch = handler.process_batch(["a", ""])
+    assert batch == BatchResult(
+        ["processed_a", None], [None, "Input data cannot be empty."]
+    )
+    assert batch != BatchResult()
+    assert batch != "not a batch"
+    assert (
+        repr(BatchResult(["x"], [None])) == "BatchResult(results=['x'], errors=[None])"
+    )
+
+
+def test_process_batch_collects_per_item_errors(handler):
+    batch = handler.process_batch(["good", "", "has ERROR inside", "fine"])
+    assert batch.results == ["processed_doog", None, None, "processed_enif"]
+    assert batch.errors == [
+        None,
+        "Input data cannot be empty.",
+        "Simulated processing error based on input.",
+        None,
+    ]
+    assert batch.error_count == 2
+    assert not batch.ok
+
+
+def test_process_batch_error_does_not_span_records(handler):
+    # "err" + "or" must not be joined into a match across record boundaries.
+    batch = handler.process_batch(["err", "or"])
+    assert batch.ok
+
+
+def test_process_batch_handles_length_changing_lowercase(handler):
+    # "İ".lower() is two characters long, which shifts offsets in the batch.
+    batch = handler.process_batch(["İİ", "ok", "an Error"])
+    assert batch.results == ["processed_İİ", "processed_ko", None]
+    assert batch.errors[2] == "Simulated processing error based on input."
+
+
+def test_process_many_chunks_lazily(handler):
+    chunks = list(handler.process_many(iter(["a", "b", "error", "c"]), chunk_size=3))
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert chunks[0].errors[2] == "Simulated processing error based on input."
+    assert chunks[1].results == ["processed_c"]
+
+
+def test_process_many_rejects_invalid_chunk_size(handler):
+    with pytest.raises(ValueError, match="chunk_size"):
+        handler.process_many(["a"], chunk_size=0)  # Raises before iterating
+
+
+def test_batch_result_to_numpy(handler):
+    np = pytest.importorskip("numpy")
+    array = handler.process_batch(["ab", "error"]).to_numpy()
+    assert isinstance(array, np.ndarray)
+    assert array.tolist() == ["processed_ba", ""]
+
+
+def test_batch_result_to_arrow(handler):
+    pytest.importorskip("pyarrow")
+    array = handler.process_batch(["ab", "error"]).to_arrow()
+    assert array.to_pylist() == ["processed_ba", None]
+
+
+@pytest.mark.parametrize(
+    "data",
+    ["abc", "x" * 70_000, "héllo wörld", "Ǆ mixed ẞ case", "a\x00b"],
+)
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_process_bytes_matches_str_path(handler, data, wrap):
+    result = handler.process_bytes(wrap(data.encode()))
+    assert isinstance(result, bytearray)
+    assert result.decode() == handler.process(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    ["", "error", "ERROR", "x" * 65_534 + "ErRoR", "ünicode error"],
+)
+def test_process_bytes_rejects_like_str_path(handler, data):
+    with pytest.raises(ValueError) as str_error:
+        handler.process(data)
+    with pytest.raises(ValueError, match=str(str_error.value)):
+        handler.process_bytes(data.encode())
+
+
+def test_process_bytes_reuses_output_buffer(handler):
+    out = bytearray(b"?" * 100)
+    assert handler.process_bytes(b"abc", out) is out
+    assert out == b"processed_cba"
+    assert handler.process_bytes(b"x" * 20, out) == b"processed_" + b"x" * 20
+    assert handler.process_bytes("é".encode(), out) == "processed_é".encode()
+
+
+def test_process_bytes_rejects_invalid_utf8(handler):
+    with pytest.raises(UnicodeDecodeError):
+        handler.process_bytes(b"\xff\xfe")
+
+
+def test_process_bytes_accepts_non_byte_memoryviews(handler):
+    import array
+
+    data = array.array("H", [0x6261, 0x6463])  # b"abcd" on little-endian
+    expected = handler.process(bytes(data).decode())
+    assert handler.process_bytes(memoryview(data)).decode() == expected
+
+
+@pytest.mark.parametrize("size", [6, 100_000])
+def test_process_bytes_accepts_non_contiguous_memoryviews(handler, size):
+    data = b"a-" * size
+    view = memoryview(data)[::2]
+    assert not view.contiguous
+    assert handler.process_bytes(view).decode() == handler.process("a" * size)
+
+
 # TODO: Add more tests for edge cases and other methods in DataHandler if necessary
+
+
+def test_data_handler_with_rules():
+    import pickle
+
+    from your_core_library.rules import NumericRule
+    from your_core_library.rules import PatternRule
+    from your_core_library.rules import RuleSet
+
+    rules = RuleSet(
+        [PatternRule("secret", "secret", "no secrets")],
+        [NumericRule("negative", "<", 0, "negative")],
+    )
+    handler = DataHandler(rules=rules)
+    assert handler.process("error is fine now") == "processed_won enif si rorre"
+    with pytest.raises(ValueError, match="no secrets"):
+        handler.process("top SECRET")
+    with pytest.raises(ValueError, match="cannot be empty"):
+        handler.process("")
+    with pytest.raises(ValueError, match="no secrets"):
+        handler.process_bytes(b"x" * 10_000 + b"secret")
+    batch = handler.process_batch(["ok", "secret", "", "error"])
+    assert batch.results == ["processed_ko", None, None, "processed_rorre"]
+    assert batch.errors == [None, "no secrets", "Input data cannot be empty.", None]
+    assert handler.another_method(5) is True
+    assert handler.another_method(-1) is False
+    # Without numeric rules the built-in thresholds still apply
+    assert DataHandler(rules=RuleSet()).another_method(5) is False
+    assert pickle.loads(pickle.dumps(handler)).process_batch(["secret"]).errors == [
+        "no secrets"
+    ]
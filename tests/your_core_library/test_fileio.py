@@ -0,0 +1,120 @@
+import mmap
+
+import pytest
+
+from your_core_library.data_handler import DataHandler
+from your_core_library.fileio import process_file
+from your_core_library.fileio import split_ranges
+
+
+def expected_output(records):
+    handler = DataHandler()
+    return "".join(
+        handler.process(record) + "\n"
+        for record in records
+        if record and "error" not in record.lower()
+    )
+
+
+def write_lines(path, records):
+    path.write_text("".join(record + "\n" for record in records))
+
+
+@pytest.mark.parametrize("chunk_bytes", [7, 64, 4 * 1024 * 1024])
+def test_process_file_lines(tmp_path, chunk_bytes):
+    records = [f"record-{i}" for i in range(200)] + ["", "some error", "héllo"]
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    write_lines(source, records)
+
+    report = process_file(str(source), str(target), chunk_bytes=chunk_bytes)
+
+    assert target.read_text() == expected_output(records)
+    assert report.records == len(records)
+    assert report.errors == 2
+    assert report.bytes_in == source.stat().st_size
+    assert report.bytes_out == target.stat().st_size
+
+
+def test_process_file_without_trailing_newline(tmp_path):
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    source.write_text("abc\ndef")
+    process_file(str(source), str(target))
+    assert target.read_text() == "processed_cba\nprocessed_fed\n"
+
+
+def test_process_file_with_workers_keeps_order(tmp_path):
+    records = [f"line {i}" for i in range(1000)]
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    write_lines(source, records)
+
+    report = process_file(str(source), str(target), workers=3, chunk_bytes=100)
+
+    assert target.read_text() == expected_output(records)
+    assert report.records == len(records)
+    assert sorted(tmp_path.iterdir()) == [source, target]  # Parts cleaned up
+
+
+def test_process_file_fixed_size_records(tmp_path):
+    records = [f"rec{i:05d}" for i in range(100)]  # 8 bytes each
+    source, target = tmp_path / "in.bin", tmp_path / "out.bin"
+    source.write_bytes("".join(records).encode())
+
+    report = process_file(
+        str(source), str(target), workers=2, record_size=8, chunk_bytes=20
+    )
+
+    handler = DataHandler()
+    assert target.read_bytes() == "".join(map(handler.process, records)).encode()
+    assert report.records == 100
+    assert report.errors == 0
+
+
+@pytest.mark.parametrize("chunk_bytes", [4, 4 * 1024 * 1024])
+def test_process_file_skips_invalid_utf8_lines(tmp_path, chunk_bytes):
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    source.write_bytes(b"abc\n\xff\xfe\ndef\n")
+    report = process_file(str(source), str(target), chunk_bytes=chunk_bytes)
+    assert target.read_text() == "processed_cba\nprocessed_fed\n"
+    assert (report.records, report.errors) == (3, 1)
+
+
+def test_process_file_skips_invalid_utf8_fixed_size_records(tmp_path):
+    source, target = tmp_path / "in.bin", tmp_path / "out.bin"
+    source.write_bytes(b"abcd\xff\xfe\xfd\xfcwxyz")
+    report = process_file(str(source), str(target), record_size=4)
+    assert target.read_bytes() == b"processed_dcbaprocessed_zyxw"
+    assert (report.records, report.errors) == (3, 1)
+
+
+def test_process_file_empty_input(tmp_path):
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    source.write_bytes(b"")
+    report = process_file(str(source), str(target), workers=4)
+    assert target.read_bytes() == b""
+    assert report.records == 0
+
+
+def test_process_file_rejects_bad_arguments(tmp_path):
+    source = tmp_path / "in.txt"
+    source.write_text("abc\n")
+    with pytest.raises(ValueError, match="positive"):
+        process_file(str(source), str(tmp_path / "out"), workers=0)
+    with pytest.raises(ValueError, match="positive"):
+        process_file(str(source), str(tmp_path / "out"), record_size=0)
+
+
+def test_split_ranges_align_to_records(tmp_path):
+    source = tmp_path / "in.txt"
+    source.write_bytes(b"aaaa\nbb\ncccccccc\nd\n")
+    with (
+        open(source, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        ranges = split_ranges(data, 3)
+        assert ranges == [(0, 8), (8, 17), (17, 19)]
+        for _, end in ranges:
+            assert data[end - 1 : end] == b"\n"
+        assert split_ranges(data, 100)[-1][1] == len(data)
+        assert split_ranges(data, 2, record_size=4) == [(0, 12), (12, 19)]
+        with pytest.raises(ValueError, match="positive"):
+            split_ranges(data, 0)
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+import pytest
+
+import your_core_library
+
+
+def test_lazy_exports_resolve_to_submodule_objects():
+    from your_core_library.data_handler import DataHandler
+
+    assert your_core_library.DataHandler is DataHandler
+    assert "DataHandler" in dir(your_core_library)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        your_core_library.does_not_exist  # noqa: B018
+
+
+def test_import_does_not_load_submodules():
+    code = (
+        "import sys, your_core_library; "
+        "print(any(m.startswith('your_core_library.') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
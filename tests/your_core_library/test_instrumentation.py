@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from your_core_library import instrumentation
+from your_core_library.data_handler import DataHandler
+from your_core_library.pipeline import Pipeline
+
+
+@pytest.fixture
+def metrics():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.enable(False)
+    instrumentation.reset()
+
+
+def test_timed_functions_record_nothing_while_disabled():
+    assert not instrumentation.is_enabled()
+    instrumentation.reset()
+    DataHandler().process("abc")
+    assert instrumentation.snapshot()["timers"] == {}
+
+
+def test_timed_counts_calls_and_errors(metrics):
+    handler = DataHandler()
+    handler.process("abc")
+    with pytest.raises(ValueError):
+        handler.process("error")
+    calls, errors, seconds = metrics.snapshot()["timers"][("data_handler_process", ())]
+    assert (calls, errors) == (2, 1)
+    assert seconds > 0
+
+
+def test_names_imported_before_enabling_are_timed(metrics):
+    from your_core_library import get_core_greeting as package_export
+    from your_core_library.data_handler import get_core_greeting
+
+    get_core_greeting("a")
+    package_export("b")
+    assert metrics.snapshot()["timers"][("get_core_greeting", ())][0] == 2
+    metrics.enable(False)
+    get_core_greeting("c")
+    assert metrics.snapshot()["timers"][("get_core_greeting", ())][0] == 2
+
+
+def test_counters_and_labels(metrics):
+    metrics.increment("things")
+    metrics.increment("things", 2)
+    metrics.increment("things", labels={"kind": 'a"b'})
+    text = metrics.render_prometheus()
+    assert "# TYPE your_core_library_things_total counter" in text
+    assert "your_core_library_things_total 3" in text
+    assert 'your_core_library_things_total{kind="a\\"b"} 1' in text
+
+
+def test_pipeline_records_stage_metrics(metrics):
+    Pipeline(range(10), chunk_size=4).add_stage("double", list).run(lambda chunk: None)
+    timers = metrics.snapshot()["timers"]
+    assert timers[("pipeline_stage", (("stage", "double"),))][0] == 3
+    assert timers[("pipeline_run", ())][0] == 1
+    text = metrics.render_prometheus()
+    assert (
+        'your_core_library_pipeline_stage_records_in_total{stage="double"} 10' in text
+    )
+
+
+def test_render_prometheus_groups_families(metrics):
+    metrics.observe("stage", 0.5, {"name": "a"})
+    metrics.observe("stage", 0.25, {"name": "b"})
+    text = metrics.render_prometheus(
+        {"queue_depth": 3}, {"jobs": 5, "busy_seconds_total": 1.5}
+    )
+    lines = text.splitlines()
+    families = [line.split()[2] for line in lines if line.startswith("# TYPE")]
+    assert len(families) == len(set(families))
+    assert 'your_core_library_stage_seconds_sum{name="a"} 0.5' in lines
+    assert "your_core_library_queue_depth 3" in lines
+    assert "# TYPE your_core_library_jobs_total counter" in lines
+    assert "your_core_library_jobs_total 5" in lines
+    assert "your_core_library_busy_seconds_total 1.5" in lines
+
+
+def test_disabled_calls_record_nothing():
+    instrumentation.reset()
+    instrumentation.increment("things")
+    instrumentation.observe("stage", 1.0)
+    assert instrumentation.snapshot() == {"counters": {}, "timers": {}}
+
+
+def test_sampling_profiler_collects_stacks():
+    def busy_wait(seconds):
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            pass
+
+    sampler = instrumentation.SamplingProfiler(interval=0.001).start()
+    busy_wait(0.05)
+    sampler.stop()
+    assert "busy_wait" in sampler.collapsed()
+
+
+def test_sampling_profiler_rejects_bad_interval():
+    with pytest.raises(ValueError):
+        instrumentation.SamplingProfiler(interval=0)
@@ -0,0 +1,96 @@
+import pytest
+
+from your_core_library import models
+from your_core_library.data_handler import ExampleModel
+from your_core_library.models import ExampleModelCollection
+
+
+@pytest.fixture(params=["numpy", "stdlib"])
+def collection(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(models, "_numpy", lambda: None)
+    return ExampleModelCollection(
+        ["delta", "alpha", "cañón", "beta", "gamma"], [40, 10, 30, 10, 20]
+    )
+
+
+def test_example_model_has_no_instance_dict():
+    model = ExampleModel("slim", 1)
+    assert not hasattr(model, "__dict__")
+    with pytest.raises(AttributeError):
+        model.extra = True  # type: ignore[attr-defined]
+
+
+def test_indexing_and_iteration_create_models(collection):
+    assert len(collection) == 5
+    assert repr(collection[2]) == "ExampleModel(name='cañón', value=30)"
+    assert collection[-1].name == "gamma"
+    assert [model.value for model in collection] == [40, 10, 30, 10, 20]
+    with pytest.raises(IndexError):
+        collection[5]
+
+
+def test_from_models_round_trips():
+    models = [ExampleModel("a", 1), ExampleModel("b", -2)]
+    collection = ExampleModelCollection.from_models(models)
+    assert collection.to_pairs() == [("a", 1), ("b", -2)]
+    assert [repr(model) for model in collection.to_models()] == [
+        repr(model) for model in models
+    ]
+
+
+def test_mismatched_lengths_are_rejected():
+    with pytest.raises(ValueError):
+        ExampleModelCollection(["a"], [1, 2])
+
+
+def test_slices_share_storage(collection):
+    middle = collection[1:4]
+    assert middle.names() == ["alpha", "cañón", "beta"]
+    assert isinstance(middle.values(), memoryview)
+    assert list(middle.values()) == [10, 30, 10]
+    assert middle.nbytes == collection.nbytes
+    assert collection[::2].names() == ["delta", "cañón", "gamma"]
+    assert list(collection[::-1].values()) == [20, 10, 30, 10, 40]
+
+
+def test_filter_by_value(collection):
+    assert collection.filter_by_value(min_value=20).names() == [
+        "delta",
+        "cañón",
+        "gamma",
+    ]
+    assert collection.filter_by_value(max_value=10).names() == ["alpha", "beta"]
+    assert collection.filter_by_value(15, 35).names() == ["cañón", "gamma"]
+    assert collection.filter_by_value() is collection
+
+
+def test_sort_by_value_is_stable(collection):
+    assert collection.sort_by_value().names() == [
+        "alpha",
+        "beta",
+        "gamma",
+        "cañón",
+        "delta",
+    ]
+    assert collection.sort_by_value(reverse=True).to_pairs()[:3] == [
+        ("delta", 40),
+        ("cañón", 30),
+        ("gamma", 20),
+    ]
+
+
+def test_selections_compose(collection):
+    top = collection.sort_by_value(reverse=True)[:3].filter_by_value(max_value=30)
+    assert top.to_pairs() == [("cañón", 30), ("gamma", 20)]
+    assert top[1].name == "gamma"
+    assert top[1:].names() == ["gamma"]
+
+
+def test_empty_collection():
+    empty = ExampleModelCollection()
+    assert len(empty) == 0
+    assert list(empty) == []
+    assert empty.sort_by_value().to_pairs() == []
@@ -0,0 +1,202 @@
+import threading
+import time
+
+import pytest
+
+from your_core_library.pipeline import Pipeline
+from your_core_library.pipeline import chunked
+from your_core_library.pipeline import parallel_map
+
+
+def square_chunk(chunk):
+    return [x * x for x in chunk]
+
+
+def test_chunked_groups_lazily():
+    assert list(chunked(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 3)) == []
+    with pytest.raises(ValueError, match="positive"):
+        list(chunked([1], 0))
+
+
+def test_pipeline_runs_stages_per_chunk():
+    loaded = []
+    pipeline = Pipeline(range(10), chunk_size=4)
+    pipeline.add_stage("double", lambda chunk: [x * 2 for x in chunk])
+    pipeline.add_stage("evens", lambda chunk: [x for x in chunk if x % 4 == 0])
+    report = pipeline.run(loaded.append)
+
+    assert loaded == [[0, 4], [8, 12], [16]]
+    assert report.stage("extract").records_out == 10
+    assert report.stage("extract").chunks == 3
+    assert report.stage("double").records_out == 10
+    assert report.stage("evens").records_in == 10
+    assert report.stage("evens").records_out == 5
+    assert report.stage("load").records_in == 5
+    assert report.seconds >= 0
+    assert report.summary()[-1].startswith("total:")
+    with pytest.raises(KeyError):
+        report.stage("missing")
+
+
+def test_pipeline_skips_empty_chunks():
+    loaded = []
+    calls = []
+
+    def record_call(chunk):
+        calls.append(chunk)
+        return chunk
+
+    pipeline = Pipeline(range(6), chunk_size=3)
+    pipeline.add_stage("drop_small", lambda chunk: [x for x in chunk if x > 2])
+    pipeline.add_stage("record", record_call)
+    report = pipeline.run(loaded.append)
+
+    assert calls == [[3, 4, 5]]
+    assert loaded == [[3, 4, 5]]
+    assert report.stage("load").chunks == 1
+
+
+def test_pipeline_consumes_source_lazily():
+    consumed = []
+
+    def source():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    seen_before_chunk = []
+    pipeline = Pipeline(source(), chunk_size=10)
+    pipeline.add_stage(
+        "probe", lambda chunk: seen_before_chunk.append(len(consumed)) or chunk
+    )
+    pipeline.run()
+    assert seen_before_chunk == [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+
+
+def test_pipeline_rejects_invalid_chunk_size():
+    with pytest.raises(ValueError, match="positive"):
+        Pipeline([], chunk_size=0)
+
+
+def test_parallel_map_preserves_order():
+    chunks = [[i, i + 1] for i in range(0, 20, 2)]
+    results = list(parallel_map(square_chunk, chunks, workers=2, max_pending=3))
+    assert results == [square_chunk(chunk) for chunk in chunks]
+
+
+def test_parallel_map_unordered_returns_all_chunks():
+    chunks = [[i] for i in range(10)]
+    results = list(parallel_map(square_chunk, chunks, workers=2, ordered=False))
+    assert sorted(results) == sorted(square_chunk(chunk) for chunk in chunks)
+    with pytest.raises(ValueError, match="Worker count"):
+        list(parallel_map(square_chunk, chunks, workers=0))
+
+
+def test_pipeline_parallel_stage():
+    loaded = []
+    pipeline = Pipeline(range(100), chunk_size=7)
+    pipeline.add_stage("square", square_chunk, workers=2)
+    report = pipeline.run(loaded.extend)
+    assert loaded == [x * x for x in range(100)]
+    assert report.stage("square").records_in == 100
+    assert report.stage("square").chunks == 15
+    with pytest.raises(ValueError, match="Worker count"):
+        pipeline.add_stage("bad", square_chunk, workers=0)
+
+
+def pipeline_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("pipeline-")]
+
+
+def test_concurrent_run_matches_sequential_run():
+    def build():
+        pipeline = Pipeline(range(100), chunk_size=7)
+        pipeline.add_stage("double", lambda chunk: [x * 2 for x in chunk])
+        pipeline.add_stage("evens", lambda chunk: [x for x in chunk if x % 4 == 0])
+        return pipeline
+
+    sequential, concurrent = [], []
+    build().run(sequential.append)
+    report = build().run(concurrent.append, concurrent=True, queue_size=3)
+
+    assert concurrent == sequential
+    assert report.queue_size == 3
+    assert report.stage("extract").records_out == 100
+    assert report.stage("evens").records_out == 50
+    assert report.stage("load").chunks == 15
+    for stats in report.stages:
+        assert 0 <= stats.utilization <= 1
+    assert 0 < report.stage("double").queue_mean <= 3
+    assert report.stage("double").queue_max <= 3
+    assert "busy, queue" in report.summary()[0]
+    assert not pipeline_threads()
+
+
+def test_concurrent_run_overlaps_stages():
+    def slow(chunk):
+        time.sleep(0.02)
+        return chunk
+
+    pipeline = Pipeline(range(10), chunk_size=1)
+    pipeline.add_stage("a", slow).add_stage("b", slow)
+    report = pipeline.run(slow, concurrent=True)
+
+    # 30 sleeps of 20 ms in sequence; overlapped, about 10 plus the ramp-up.
+    assert report.seconds < 0.45
+    assert report.stage("a").seconds >= 0.2
+    assert report.stage("load").starved_seconds > 0
+
+
+def test_concurrent_run_throttles_the_source_to_a_slow_sink():
+    extracted = []
+    backlog = []
+
+    def source():
+        for i in range(50):
+            extracted.append(i)
+            yield i
+
+    def slow_sink(chunk):
+        backlog.append(len(extracted) - chunk[0] - 1)
+        time.sleep(0.005)
+
+    pipeline = Pipeline(source(), chunk_size=1)
+    pipeline.add_stage("identity", lambda chunk: chunk)
+    report = pipeline.run(slow_sink, concurrent=True, queue_size=1)
+
+    # At most one chunk in each queue and one held by each thread.
+    assert max(backlog) <= 5
+    assert report.stage("extract").blocked_seconds > 0
+
+
+def test_concurrent_run_raises_stage_and_sink_errors():
+    def fail(chunk):
+        if chunk[0] >= 30:
+            raise RuntimeError("bad chunk")
+        return chunk
+
+    pipeline = Pipeline(range(1000), chunk_size=10)
+    pipeline.add_stage("fail", fail)
+    with pytest.raises(RuntimeError, match="bad chunk"):
+        pipeline.run(lambda chunk: None, concurrent=True, queue_size=1)
+    assert not pipeline_threads()
+
+    def failing_sink(chunk):
+        raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        Pipeline(range(1000), chunk_size=10).run(failing_sink, concurrent=True)
+    assert not pipeline_threads()
+
+    with pytest.raises(ValueError, match="Queue size"):
+        Pipeline([]).run(concurrent=True, queue_size=0)
+
+
+def test_concurrent_run_with_a_parallel_stage():
+    loaded = []
+    pipeline = Pipeline(range(100), chunk_size=7)
+    pipeline.add_stage("square", square_chunk, workers=2)
+    report = pipeline.run(loaded.extend, concurrent=True)
+    assert loaded == [x * x for x in range(100)]
+    assert report.stage("square").chunks == 15
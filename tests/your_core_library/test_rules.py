@@ -0,0 +1,227 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from your_core_library import rules as rules_module
+from your_core_library.rules import NumericRule
+from your_core_library.rules import PatternRule
+from your_core_library.rules import RuleFile
+from your_core_library.rules import RuleSet
+from your_core_library.rules import load_rules
+
+
+@pytest.fixture(params=["ahocorasick", "find"])
+def backend(request, monkeypatch):
+    """Runs a test with and without pyahocorasick for the literal rules."""
+    if request.param == "ahocorasick":
+        pytest.importorskip("ahocorasick")
+        monkeypatch.setattr(rules_module, "_AUTOMATON_MIN_LITERALS", 1)
+    else:
+        monkeypatch.setattr(rules_module, "_ahocorasick", lambda: None)
+    return request.param
+
+
+def make_rules():
+    return RuleSet(
+        [
+            PatternRule("error", "error", "contains error"),
+            PatternRule("drop", "DROP TABLE", "sql", case_sensitive=True),
+            PatternRule("dots", "a.b", "dots"),
+        ],
+        [
+            NumericRule("negative", "<", 0, "negative"),
+            NumericRule("too_big", ">", 100, "too big"),
+            NumericRule("zero", "==", 0, "zero"),
+        ],
+    )
+
+
+RULES = make_rules()
+TEXTS = ["fine", "an ERROR here", "drop table", "DROP TABLE x", "axb", "a.b", "", "ok"]
+EXPECTED = [None, "contains error", None, "sql", None, "dots", None, None]
+
+
+def test_check_matches_literals_and_case_rules(backend):
+    rule_set = make_rules()
+    assert [rule_set.check(text) for text in TEXTS] == EXPECTED
+    assert rule_set.check("a.b then error") == "dots"  # Earliest match wins
+    assert rule_set.check("error then a.b") == "contains error"
+
+
+def test_check_batch_matches_single_checks(backend):
+    rule_set = make_rules()
+    assert rule_set.check_batch(TEXTS) == EXPECTED
+    assert rule_set.check_batch([]) == []
+    # Several matches in one record, and records with matches back to back
+    assert rule_set.check_batch(["error a.b", "a.b error", "error", "x"]) == [
+        "contains error",
+        "dots",
+        "contains error",
+        None,
+    ]
+
+
+def test_overlapping_literals_report_the_earliest_then_first_rule(backend):
+    rule_set = RuleSet(
+        [
+            PatternRule("long", "abcd", "long"),
+            PatternRule("short", "bc", "short"),
+            PatternRule("same", "ABCD", "same", case_sensitive=True),
+        ]
+    )
+    texts = ["xabcd", "xbcd", "ABCD", "abc"]
+    assert rule_set.check_batch(texts) == ["long", "short", "long", "short"]
+    assert [rule_set.check(text) for text in texts] == [
+        "long",
+        "short",
+        "long",
+        "short",
+    ]
+
+
+def test_batches_whose_length_changes_when_lowered(backend):
+    # "İ" lowers to two characters, which would shift the offsets in the batch.
+    rule_set = RuleSet([PatternRule("error", "error", "e")])
+    assert rule_set.check_batch(["İİ", "error", "İ error", "ok"]) == [
+        None,
+        "e",
+        "e",
+        None,
+    ]
+
+
+def test_regex_and_literal_rules_mix():
+    rule_set = RuleSet(
+        [
+            PatternRule("word", "stop", "word"),
+            PatternRule("number", r"\d{3}", "number", regex=True),
+            PatternRule("nul", "a\x00b", "nul"),
+        ]
+    )
+    texts = ["123 stop", "stop 123", "STOP", "a\x00b", "12"]
+    assert rule_set.check_batch(texts) == ["number", "word", "word", "nul", None]
+
+
+def test_regex_rules_are_checked_per_record():
+    rule_set = RuleSet(
+        [
+            PatternRule("digits", r"^\d+$", "only digits", regex=True),
+            PatternRule("spaces", r"\s{2,}", "spaces", regex=True),
+        ]
+    )
+    texts = ["123", "a123", "x  y", "12\x0034"]
+    assert rule_set.check_batch(texts) == [rule_set.check(t) for t in texts]
+    assert rule_set.check_batch(texts) == ["only digits", None, "spaces", None]
+
+
+def test_regex_rules_with_backreferences_keep_their_own_groups():
+    rule_set = RuleSet(
+        [
+            PatternRule("aa", r"(a)\1", "double a", regex=True),
+            PatternRule("bb", r"(b)\1", "double b", regex=True),
+            PatternRule("digits", r"\d{3}", "digits", regex=True),
+        ]
+    )
+    texts = ["xxbbxx", "xxaaxx", "ab", "bb aa", "123 bb"]
+    expected = ["double b", "double a", None, "double b", "digits"]
+    assert [rule_set.check(text) for text in texts] == expected
+    assert rule_set.check_batch(texts) == expected
+
+
+def test_regex_rules_may_reuse_group_names():
+    rule_set = RuleSet(
+        [
+            PatternRule("x", r"(?P<w>x+)-(?P=w)", "xs", regex=True),
+            PatternRule("y", r"(?P<w>y+)-(?P=w)", "ys", regex=True),
+        ]
+    )
+    assert rule_set.check("yy-yy") == "ys"
+    assert rule_set.check("x-x") == "xs"
+    assert rule_set.check("x-y") is None
+
+
+def test_numeric_rules_first_listed_wins():
+    values = [-5, 0, 5, 100, 101, -0.5]
+    expected = ["negative", "zero", None, None, "too big", "negative"]
+    assert [RULES.check_value(value) for value in values] == expected
+    assert RULES.check_values(values) == expected
+
+
+def test_numeric_rules_without_numpy(monkeypatch):
+    monkeypatch.setattr(rules_module, "_numpy", lambda: None)
+    assert RULES.check_values([-1, 50, 200]) == ["negative", None, "too big"]
+
+
+def test_empty_rule_set_accepts_everything():
+    rule_set = RuleSet()
+    assert len(rule_set) == 0
+    assert rule_set.check("error") is None
+    assert rule_set.check_batch(["a", "b"]) == [None, None]
+    assert rule_set.check_values([1, -1]) == [None, None]
+
+
+def test_invalid_rules_are_rejected():
+    with pytest.raises(ValueError, match="operator"):
+        RuleSet(numeric=[NumericRule("x", "=>", 1)])
+    with pytest.raises(ValueError, match="empty"):
+        RuleSet([PatternRule("x", "")])
+    with pytest.raises(ValueError, match="invalid regex"):
+        RuleSet([PatternRule("x", "(", regex=True)])
+    with pytest.raises(ValueError, match="Invalid rule definition"):
+        RuleSet.from_dict({"patterns": [{"name": "x"}]})
+
+
+def test_rule_sets_pickle(backend):
+    restored = pickle.loads(pickle.dumps(make_rules()))
+    assert restored.check_batch(TEXTS) == EXPECTED
+
+
+def write_rules(path, patterns, numeric=()):
+    path.write_text(
+        json.dumps({"patterns": list(patterns), "numeric": list(numeric)}),
+        encoding="utf-8",
+    )
+
+
+def test_load_rules_from_json(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(
+        path,
+        [{"name": "bad", "pattern": "bad", "message": "bad input"}],
+        [{"name": "neg", "op": "<", "threshold": 0}],
+    )
+    rule_set = load_rules(str(path))
+    assert rule_set.check("so BAD") == "bad input"
+    assert rule_set.check_value(-1) == "Value is out of range."
+
+
+def test_rule_file_reloads_when_the_file_changes(tmp_path, caplog):
+    path = tmp_path / "rules.json"
+    write_rules(path, [{"name": "a", "pattern": "alpha"}])
+    rule_file = RuleFile(str(path), check_interval=0)
+    assert rule_file.current.check("alpha") is not None
+    assert rule_file.reload() is False  # Unchanged
+
+    write_rules(path, [{"name": "b", "pattern": "beta"}])
+    os.utime(path, ns=(0, 10**18))  # A new mtime even on coarse clocks
+    assert rule_file.current.check("alpha") is None
+    assert rule_file.current.check("beta") is not None
+    assert rule_file.reloads == 1
+
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, ns=(0, 2 * 10**18))
+    assert rule_file.current.check("beta") is not None  # Previous rules kept
+    assert "Keeping the current rules" in caplog.text
+
+
+def test_rule_file_checks_at_most_once_per_interval(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, [{"name": "a", "pattern": "alpha"}])
+    rule_file = RuleFile(str(path), check_interval=3600)
+    write_rules(path, [{"name": "b", "pattern": "beta"}])
+    os.utime(path, ns=(0, 10**18))
+    assert rule_file.current.check("alpha") is not None
+    assert rule_file.reload(force=True) is True
+    assert rule_file.current.check("beta") is not None
@@ -0,0 +1,178 @@
+import csv
+import json
+import sqlite3
+
+import pytest
+
+from your_core_library.sinks import BackgroundSink
+from your_core_library.sinks import CsvSink
+from your_core_library.sinks import NdjsonSink
+from your_core_library.sinks import Sink
+from your_core_library.sinks import SqliteSink
+from your_core_library.sinks import open_sink
+
+RECORDS = [{"id": i, "value": i * 10, "category": "AB"[i % 2]} for i in range(25)]
+
+
+class ListSink(Sink):
+    def __init__(self, batch_size=10):
+        super().__init__(batch_size)
+        self.batches = []
+        self.closed = False
+
+    def _write_batch(self, records):
+        self.batches.append(list(records))
+
+    def _close(self):
+        self.closed = True
+
+
+class FailingSink(ListSink):
+    def _write_batch(self, records):
+        raise RuntimeError("disk full")
+
+
+def test_sink_writes_full_batches_then_the_rest_on_close():
+    sink = ListSink(batch_size=10)
+    sink(RECORDS[:7])
+    assert sink.batches == []
+    sink.write(RECORDS[7:])
+    assert [len(batch) for batch in sink.batches] == [10, 10]
+    sink.close()
+    assert [len(batch) for batch in sink.batches] == [10, 10, 5]
+    assert sink.records_written == 25
+    assert sink.closed
+    sink.close()  # Closing twice is harmless
+    with pytest.raises(ValueError, match="closed"):
+        sink.write(RECORDS)
+    with pytest.raises(ValueError, match="positive"):
+        ListSink(batch_size=0)
+
+
+def test_ndjson_sink(tmp_path):
+    path = tmp_path / "out.ndjson"
+    with NdjsonSink(str(path), batch_size=4) as sink:
+        sink.write(RECORDS)
+    lines = path.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == RECORDS
+
+
+def test_csv_sink(tmp_path):
+    path = tmp_path / "out.csv"
+    with CsvSink(str(path), batch_size=4) as sink:
+        sink.write(RECORDS)
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [{key: str(value) for key, value in r.items()} for r in RECORDS]
+
+
+def test_text_sinks_append_to_existing_output(tmp_path):
+    ndjson = tmp_path / "out.ndjson"
+    csv_path = tmp_path / "out.csv"
+    for records in (RECORDS[:10], RECORDS[10:]):
+        with open_sink("ndjson", str(ndjson), append=True) as sink:
+            sink.write(records)
+        with open_sink("csv", str(csv_path), append=True) as sink:
+            sink.write(records)
+    assert [json.loads(line) for line in ndjson.read_text().splitlines()] == RECORDS
+    with open(csv_path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [{key: str(value) for key, value in r.items()} for r in RECORDS]
+    with pytest.raises(ValueError, match="append"):
+        open_sink("parquet", str(tmp_path / "out.parquet"), append=True)
+
+
+def test_sqlite_sink(tmp_path):
+    path = tmp_path / "out.db"
+    with SqliteSink(str(path), batch_size=4, table="items") as sink:
+        sink.write(RECORDS)
+        sink.write([{"id": 99, "value": 1}])  # Missing columns become NULL
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute(
+            "SELECT id, value, category FROM items ORDER BY id"
+        ).fetchall()
+    assert rows[:-1] == [(r["id"], r["value"], r["category"]) for r in RECORDS]
+    assert rows[-1] == (99, 1, None)
+
+
+def test_sqlite_sink_rejects_unsafe_names(tmp_path):
+    with pytest.raises(ValueError, match="table"):
+        SqliteSink(str(tmp_path / "out.db"), table="x; DROP TABLE y")
+    sink = SqliteSink(str(tmp_path / "out.db"))
+    with pytest.raises(ValueError, match="column"):
+        sink.write([{"bad name": 1}])
+        sink.close()
+
+
+def test_arrow_sinks(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    for file_format in ("parquet", "arrow"):
+        path = tmp_path / f"out.{file_format}"
+        with open_sink(file_format, str(path), batch_size=10) as sink:
+            sink.write(RECORDS)
+        if file_format == "parquet":
+            table = pyarrow.parquet.read_table(path)
+        else:
+            table = pyarrow.ipc.open_file(path).read_all()
+        assert table.to_pylist() == RECORDS
+
+
+def test_background_sink_writes_everything_in_order():
+    inner = ListSink(batch_size=10)
+    with BackgroundSink(inner, max_pending=2) as sink:
+        for start in range(0, len(RECORDS), 3):
+            sink.write(RECORDS[start : start + 3])
+    assert [record for batch in inner.batches for record in batch] == RECORDS
+    assert sink.records_written == 25
+    assert inner.closed
+
+
+def test_background_sink_reraises_errors():
+    inner = FailingSink(batch_size=1)
+    sink = BackgroundSink(inner)
+    sink.write(RECORDS[:1])
+    with pytest.raises(RuntimeError, match="disk full"):
+        sink.close()
+    assert inner.closed
+
+
+def test_background_sink_keeps_raising_its_error():
+    sink = BackgroundSink(FailingSink(batch_size=1))
+    sink.write(RECORDS[:1])
+    with pytest.raises(RuntimeError, match="disk full"):
+        sink.flush()
+    for later_call in (lambda: sink.write(RECORDS[1:2]), sink.flush, sink.close):
+        with pytest.raises(RuntimeError, match="disk full"):
+            later_call()
+    with pytest.raises(RuntimeError, match="disk full"):
+        sink.close()
+
+
+def test_sink_subclasses_must_write_batches():
+    class NoWriter(Sink):
+        pass
+
+    with pytest.raises(TypeError):
+        NoWriter()  # type: ignore[abstract]
+
+
+def test_open_sink(tmp_path):
+    sink = open_sink("ndjson", str(tmp_path / "out"), background=True)
+    assert isinstance(sink, BackgroundSink)
+    assert isinstance(sink.sink, NdjsonSink)
+    sink.close()
+    with pytest.raises(ValueError, match="Unknown sink format"):
+        open_sink("xml", str(tmp_path / "out"))
+
+
+def test_flush_makes_written_records_visible(tmp_path):
+    path = tmp_path / "out.ndjson"
+    sink = BackgroundSink(NdjsonSink(str(path), batch_size=100))
+    sink.write(RECORDS[:3])
+    sink.flush()
+    assert len(path.read_text().splitlines()) == 3
+    sink.close()
+    sink.flush()  # No-op once closed
@@ -0,0 +1,134 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from your_core_library.pipeline import Pipeline
+from your_core_library.sources import HttpSource
+from your_core_library.sources import json_records
+
+
+def page_server(pages=20, per_page=5, delay=0.001):
+    """A MockTransport serving /records?page=N, tracking peak concurrency."""
+    state = {"active": 0, "peak": 0, "calls": 0}
+
+    async def handler(request):
+        state["calls"] += 1
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        page = int(request.url.params["page"])
+        # Later pages answer sooner, so completion order differs from page order.
+        await asyncio.sleep(delay * (pages - page))
+        state["active"] -= 1
+        start = page * per_page
+        return httpx.Response(
+            200, json=[{"id": i, "page": page} for i in range(start, start + per_page)]
+        )
+
+    return httpx.MockTransport(handler), state
+
+
+def urls(pages=20):
+    return [f"/records?page={page}" for page in range(pages)]
+
+
+def test_records_arrive_in_page_order_with_bounded_concurrency():
+    transport, state = page_server()
+    source = HttpSource(
+        urls(), base_url="http://test", concurrency=4, transport=transport
+    )
+    records = list(source)
+    assert [record["id"] for record in records] == list(range(100))
+    assert state["calls"] == source.requests == source.pages_fetched == 20
+    assert 1 < state["peak"] <= 4
+
+
+def test_pages_can_be_consumed_from_async_code():
+    transport, _ = page_server(pages=3, per_page=2)
+
+    async def collect():
+        source = HttpSource(urls(3), base_url="http://test", transport=transport)
+        return [page async for page in source.pages()]
+
+    pages = asyncio.run(collect())
+    assert [[record["id"] for record in page] for page in pages] == [
+        [0, 1],
+        [2, 3],
+        [4, 5],
+    ]
+
+
+def test_transient_failures_are_retried():
+    attempts = {"count": 0}
+
+    def handler(request):
+        attempts["count"] += 1
+        if attempts["count"] == 1:
+            raise httpx.ConnectError("refused", request=request)
+        if attempts["count"] == 2:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"records": [{"id": 1}]})
+
+    source = HttpSource(
+        ["http://test/"], backoff=0, transport=httpx.MockTransport(handler)
+    )
+    assert list(source) == [{"id": 1}]
+    assert source.retried == 2
+    assert source.requests == 3
+
+
+def test_exhausted_retries_and_client_errors_are_raised():
+    def unavailable(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    source = HttpSource(
+        ["http://test/"],
+        retries=2,
+        backoff=0,
+        transport=httpx.MockTransport(unavailable),
+    )
+    with pytest.raises(httpx.ConnectError):
+        list(source)
+    assert source.requests == 3
+
+    missing = HttpSource(
+        ["http://test/"],
+        transport=httpx.MockTransport(lambda request: httpx.Response(404)),
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        list(missing)
+    assert missing.requests == 1
+
+
+def test_stopping_early_cancels_the_remaining_fetches():
+    transport, state = page_server(pages=200, delay=0)
+    source = HttpSource(
+        urls(200), base_url="http://test", concurrency=2, transport=transport
+    )
+    records = iter(source)
+    assert next(records)["id"] == 0
+    records.close()  # type: ignore[attr-defined]
+    assert state["calls"] < 200
+    assert not [t for t in threading.enumerate() if t.name == "http-source"]
+
+
+def test_source_feeds_a_pipeline():
+    transport, _ = page_server(pages=10, per_page=10)
+    source = HttpSource(urls(10), base_url="http://test", transport=transport)
+    loaded = []
+    report = Pipeline(source, chunk_size=25).run(loaded.extend)
+    assert len(loaded) == 100
+    assert report.stage("extract").records_out == 100
+
+
+def test_json_records_and_validation():
+    response = httpx.Response(200, json={"total": 0}, request=httpx.Request("GET", "/"))
+    assert json_records(response) == []
+    response = httpx.Response(200, json="x", request=httpx.Request("GET", "/"))
+    with pytest.raises(ValueError, match="list of records"):
+        json_records(response)
+    with pytest.raises(ValueError, match="Concurrency"):
+        HttpSource([], concurrency=0)
+    with pytest.raises(ValueError, match="Retries"):
+        HttpSource([], retries=-1)